@@ -0,0 +1,135 @@
+"""Compact on-disk format for shows which are streamed while they play."""
+from array import array
+import json
+import mmap
+import struct
+import sys
+
+EXTENSION = 'mpfshow'
+"""File extension of compiled shows."""
+
+MAGIC = b'MPFSHOW\x00'
+
+FORMAT_VERSION = 2
+"""Bump this when the layout of compiled show files changes."""
+
+_header = struct.Struct('<8sII')
+
+
+def _to_little_endian(values):
+    """Return the bytes of an array in little endian byte order."""
+    if sys.byteorder == 'big':     # pragma: no cover
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_little_endian(typecode, data):
+    """Return an array from bytes in little endian byte order."""
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == 'big':     # pragma: no cover
+        values.byteswap()
+    return values
+
+
+def write_compiled_show(filename, steps, show_version, tokens=None):
+    """Write a compiled show file.
+
+    The file starts with a small JSON header which contains the number of
+    steps and the tokens in the show. It is followed by the duration of
+    every step and an offset table as little endian arrays. Steps are JSON
+    encoded one by one after that so a single step can be read without
+    touching the rest of the file.
+
+    Args:
+        filename: File to write.
+        steps: Iterable of tuples of duration (in seconds) and the raw step
+            dict (without time or duration).
+        show_version: Show version of the source of the steps.
+        tokens: Set of (lowercase) tokens which are used in the steps.
+
+    Raises ValueError if a step contains data which JSON cannot represent
+    (e.g. keys which are no strings).
+    """
+    durations = array('d')
+    offsets = array('Q', [0])
+    data = []
+    for duration, step in steps:
+        step_data = json.dumps(step, separators=(',', ':')).encode()
+        if json.loads(step_data.decode()) != step:
+            raise ValueError("Step {} of {} cannot be stored in a compiled show".format(len(durations), filename))
+        durations.append(duration)
+        offsets.append(offsets[-1] + len(step_data))
+        data.append(step_data)
+
+    header = json.dumps({'show_version': int(show_version),
+                         'steps': len(durations),
+                         'tokens': sorted(tokens or [])}).encode()
+
+    with open(filename, 'wb') as f:
+        f.write(_header.pack(MAGIC, FORMAT_VERSION, len(header)))
+        f.write(header)
+        f.write(_to_little_endian(durations))
+        f.write(_to_little_endian(offsets))
+        for step_data in data:
+            f.write(step_data)
+
+
+class CompiledShowFile(object):
+
+    """Read access to a compiled show file.
+
+    Only the header is read on open. Steps are decoded from a memory map
+    when they are requested.
+
+    Attributes:
+        show_version: Show version of the source of the show.
+        durations: Array with the duration of every step in seconds.
+        tokens: Set of tokens in the show.
+    """
+
+    def __init__(self, filename):
+        """Open a compiled show file.
+
+        Raises ValueError if the file is no compiled show or has a different
+        format version.
+        """
+        self.filename = filename
+        with open(filename, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, format_version, header_length = _header.unpack_from(self._map)
+        except struct.error:
+            self.close()
+            raise ValueError("File {} is no compiled show".format(filename))
+
+        if magic != MAGIC or format_version != FORMAT_VERSION:
+            self.close()
+            raise ValueError("File {} is no compiled show of format version {}".format(filename, FORMAT_VERSION))
+
+        position = _header.size + header_length
+        header = json.loads(self._map[_header.size:position].decode())
+        self.show_version = header['show_version']
+        self.tokens = set(header['tokens'])
+
+        steps = header['steps']
+        self.durations = _from_little_endian('d', self._map[position:position + 8 * steps])
+        position += 8 * steps
+        self._offsets = _from_little_endian('Q', self._map[position:position + 8 * (steps + 1)])
+        self._data_start = position + 8 * (steps + 1)
+
+    def __len__(self):
+        """Return the number of steps."""
+        return len(self.durations)
+
+    def read_step(self, index):
+        """Return the raw step dict of a step."""
+        start = self._data_start + self._offsets[index]
+        end = self._data_start + self._offsets[index + 1]
+        return json.loads(self._map[start:end].decode())
+
+    def close(self):
+        """Close the file."""
+        self._map.close()
@@ -1,4 +1,9 @@
 """Contains show related classes."""
+from collections import OrderedDict
+import math
+from copy import copy
+
+from mpf.assets.compiled_show import CompiledShowFile, write_compiled_show, EXTENSION as COMPILED_SHOW_EXTENSION
 from mpf.core.assets import Asset, AssetPool
 from mpf.core.file_manager import FileManager
 from mpf.core.utility_functions import Util
@@ -30,7 +35,7 @@ class Show(Asset):
     path_string = 'shows'
     config_section = 'shows'
     disk_asset_section = 'file_shows'
-    extensions = 'yaml'
+    extensions = ('yaml', COMPILED_SHOW_EXTENSION)
     class_priority = 100
     pool_config_section = 'show_pools'
     asset_group_class = ShowPool
@@ -47,6 +52,10 @@ class Show(Asset):
         self.tokens = set()
         self.token_values = dict()
         self.token_keys = dict()
+        self.token_steps = dict()
+        '''Dict of step index -> tuple of a list of value slots and a list of
+        key slots. Each slot is a tuple of the path in the step and the token.
+        Steps without tokens are not in this dict.'''
 
         self.running = set()
         '''Set of RunningShow() instances which represents running instances
@@ -65,14 +74,17 @@ class Show(Asset):
 
     def _initialize_asset(self):
         self.loaded = False
+        self.streamed = False
         self.show_steps = list()
+        self._compiled_steps = dict()
         self.mode = None
 
     def do_load(self):
         """Load a show from disk."""
         self._do_load_show(None)
 
-    def _get_duration(self, data, step_num, total_step_time):
+    @classmethod
+    def _get_duration(cls, data, step_num, total_step_time, identifier):
         total_steps_num = len(data)
         step = data[step_num]
         if 'duration' not in step:
@@ -88,73 +100,126 @@ class Show(Asset):
                     return Util.string_to_secs(next_step_time)
                 else:
                     if total_step_time < 0:     # pragma: no cover
-                        self._show_validation_error("Absolute timing in step {} not possible because "
-                                                    "there was a duration of -1 before".format(step_num))
+                        cls._raise_validation_error(identifier, "Absolute timing in step {} not possible because "
+                                                                "there was a duration of -1 before".format(step_num))
                     return Util.string_to_secs(next_step_time) - total_step_time
             else:
                 return 1
         else:
             if step_num < total_steps_num - 1 and 'time' in data[step_num + 1]:     # pragma: no cover
-                self._show_validation_error("Found invalid 'time' entry in step after {} which contains a duration. "
-                                            "Remove either of them!".format(step_num))
+                cls._raise_validation_error(identifier, "Found invalid 'time' entry in step after {} which contains "
+                                                        "a duration. Remove either of them!".format(step_num))
             return Util.string_to_secs(step['duration'])
 
-    def _do_load_show(self, data):
-        # do not use machine or the logger here because it will block
-        self.show_steps = list()
+    @classmethod
+    def get_timed_steps(cls, data, identifier):
+        """Return a list of tuples of the duration and the raw step for all steps in show data.
 
-        if not data and self.file:
-            data = self.load_show_from_disk()
+        Step times can be specified as either an absolute time elapsed (from
+        the beginning of the show) or a relative time (time elapsed since the
+        previous step). Time strings starting with a plus sign (+) are treated
+        as relative times. All times are converted to the duration of each
+        step in seconds.
 
+        Args:
+            data: Show data as loaded from a show file.
+            identifier: File or name of the show for error messages.
+        """
         # Pylint complains about the change from dict to list. This is intended and fine.
         # pylint: disable-msg=redefined-variable-type
         if isinstance(data, dict):
             data = list(data)
         elif not isinstance(data, list):    # pragma: no cover
             raise ValueError("Show {} does not appear to be a valid show "
-                             "config".format(self.file))
+                             "config".format(identifier))
 
         if not data:    # pragma: no cover
-            self._show_validation_error("Cannot load empty show")
+            cls._raise_validation_error(identifier, "Cannot load empty show")
 
+        steps = list()
         total_step_time = 0
 
         # add empty first step if show does not start right away
         if 'time' in data[0] and data[0]['time'] != 0:
-            self.show_steps.append({'duration': Util.string_to_secs(data[0]['time'])})
+            steps.append((Util.string_to_secs(data[0]['time']), dict()))
             total_step_time = Util.string_to_secs(data[0]['time'])
 
         # Loop over all steps in the show file
         for step_num, step in enumerate(data):
-            actions = dict()
-
-            # Note: all times are stored/calculated in seconds.
-
-            # Step time can be specified as either an absolute time elapsed
-            # (from the beginning of the show) or a relative time (time elapsed
-            # since the previous step).  Time strings starting with a plus sign
-            # (+) are treated as relative times.
-
-            # Step times are all converted to relative times internally (time
-            # since the previous step).
-
-            # Make sure there is a time entry for each step in the show file.
-            duration = self._get_duration(data, step_num, total_step_time)
+            duration = cls._get_duration(data, step_num, total_step_time, identifier)
 
             # special case: empty last step
             if duration is False:
                 break
             elif duration == 0:     # pragma: no cover
-                self._show_validation_error("Step {} has 0 duration".format(step_num))
-
-            # Calculate the time since previous step
-            actions['duration'] = duration
+                cls._raise_validation_error(identifier, "Step {} has 0 duration".format(step_num))
 
             if duration > 0 and total_step_time >= 0:
                 total_step_time += duration
             else:
                 total_step_time = -1
 
+            steps.append((duration, step))
+
+        if not steps:   # pragma: no cover
+            cls._raise_validation_error(identifier, "Show is empty")
+
+        return steps
+
+    @classmethod
+    def write_compiled_show(cls, data, filename, identifier=None):
+        """Write show data to a compiled show file.
+
+        Compiled shows are not loaded completely. Their steps are decoded and
+        validated while the show plays which keeps very long shows (e.g.
+        generated from audio analysis) fast to load and small in memory. Put
+        the compiled file into the shows folder instead of the source file.
+
+        Args:
+            data: Show data as loaded from a show file.
+            filename: Compiled show file to write.
+            identifier: File or name of the show for error messages.
+        """
+        tokens = set()
+
+        def collect_tokens(item):
+            if isinstance(item, dict):
+                for key, value in item.items():
+                    collect_tokens(key)
+                    collect_tokens(value)
+            elif isinstance(item, list):
+                for value in item:
+                    collect_tokens(value)
+            elif isinstance(item, str) and item[0:1] == "(" and item[-1:] == ")":
+                tokens.add(item[1:-1].lower())
+
+        steps = list()
+        for duration, step in cls.get_timed_steps(data, identifier or filename):
+            if not isinstance(step, dict):
+                cls._raise_validation_error(identifier or filename, "Steps need to be dicts.")
+            step = {key: value for key, value in step.items() if key not in ('duration', 'time')}
+            collect_tokens(step)
+            steps.append((duration, step))
+
+        write_compiled_show(filename, steps, __show_version__, tokens)
+
+    def _do_load_show(self, data):
+        # do not use machine or the logger here because it will block
+        self.show_steps = list()
+        self._compiled_steps = dict()
+        self.streamed = False
+
+        if not data and self.file:
+            if self.file.endswith('.' + COMPILED_SHOW_EXTENSION):
+                self._do_load_compiled_show()
+                return
+
+            data = self.load_show_from_disk()
+
+        for duration, step in self.get_timed_steps(data, self.file or self.name):
+            actions = dict()
+            actions['duration'] = duration
+
             # Now process show step actions
             self._process_step_actions(step, actions)
 
@@ -163,17 +228,52 @@ class Show(Asset):
         # Count how many total steps are in the show. We need this later
         # so we can know when we're at the end of a show
         self.total_steps = len(self.show_steps)
+
+        self._get_tokens()
+
+    def _do_load_compiled_show(self):
+        show_file = CompiledShowFile(self.file)
+        if show_file.show_version != int(__show_version__):   # pragma: no cover
+            show_file.close()
+            raise ValueError("Show file {} cannot be loaded. MPF v{} requires "
+                             "#show_version={}".format(self.file,
+                                                       __version__,
+                                                       __show_version__))
+
+        self.streamed = True
+        self.show_steps = StreamedShowSteps(show_file, self.config['stream_window'],
+                                            self._decode_streamed_step, self._forget_streamed_step,
+                                            self.machine.clock.loop.call_soon)
+        self.total_steps = len(self.show_steps)
         if self.total_steps == 0:   # pragma: no cover
             self._show_validation_error("Show is empty")
 
         self._get_tokens()
 
+        # validate the first window right away
+        self.show_steps.load(0)
+
+    def _decode_streamed_step(self, step_index, duration, step):
+        actions = dict()
+        actions['duration'] = duration
+        self._process_step_actions(step, actions)
+        self._walk_show(actions, (step_index,))
+        return actions
+
+    def _forget_streamed_step(self, step_index):
+        self._compiled_steps.pop(step_index, None)
+        self.token_steps.pop(step_index, None)
+
     def _show_validation_error(self, msg):  # pragma: no cover
         if self.file:
             identifier = self.file
         else:
             identifier = self.name
 
+        self._raise_validation_error(identifier, msg)
+
+    @staticmethod
+    def _raise_validation_error(identifier, msg):  # pragma: no cover
         raise AssertionError("Show {}: {}".format(identifier, msg))
 
     def _process_step_actions(self, step, actions):
@@ -192,29 +292,64 @@ class Show(Asset):
                 self._show_validation_error('Invalid section "{}:" found in show'.format(key))
 
     def _do_unload(self):
+        if self.streamed:
+            self.show_steps.close()
         self.show_steps = None
+        self._compiled_steps = dict()
+
+    def get_compiled_step(self, step_index):
+        """Return the compiled step with the tokens in it unbound.
+
+        Steps are compiled on first use because devices might not exist when
+        the show is loaded.
+        """
+        try:
+            return self._compiled_steps[step_index]
+        except KeyError:
+            compiled_step = self.compile_step(self.show_steps[step_index])
+            self._compiled_steps[step_index] = compiled_step
+            return compiled_step
+
+    def compile_step(self, step):
+        """Return a tuple of the duration and the actions of a step.
+
+        Actions are tuples of the player name and a callable which is returned
+        by get_show_step_action of the player.
+        """
+        show_players = self.machine.show_controller.show_players
+        actions = tuple((item_type, show_players[item_type].get_show_step_action(settings))
+                        for item_type, settings in step.items() if item_type in show_players)
+        return step['duration'], actions
 
     def _get_tokens(self):
-        self._walk_show(self.show_steps)
+        self.tokens = set()
+        self.token_values = dict()
+        self.token_keys = dict()
+        self.token_steps = dict()
+        if self.streamed:
+            # the tokens of a step are added to token_steps when the step is
+            # decoded. token_values and token_keys stay empty
+            self.tokens = set(self.show_steps.tokens)
+        else:
+            self._walk_show(self.show_steps, tuple())
 
-    def _walk_show(self, data, path=None, list_index=None):
-        # walks a list of dicts, checking tokens
-        if not path:
-            path = list()
+    def step_has_tokens(self, step_index):
+        """Return true if a step contains tokens."""
+        if self.streamed:
+            # make sure the step is decoded
+            self.show_steps.load(step_index)
+        return step_index in self.token_steps
 
+    def _walk_show(self, data, path):
+        # walks a list of dicts, checking tokens
         if isinstance(data, dict):
             for k, v in data.items():
                 self._check_token(path, k, 'key')
-                self._walk_show(v, path + [k])
+                self._walk_show(v, path + (k,))
 
         elif isinstance(data, list):
-            for i in data:
-                self._check_token(path, i, 'key')
-                if list_index is None:
-                    list_index = 0
-                else:
-                    list_index += 1
-                self._walk_show(i, path + [list_index], list_index)
+            for index, item in enumerate(data):
+                self._walk_show(item, path + (index,))
 
         else:
             self._check_token(path, data, 'value')
@@ -224,7 +359,9 @@ class Show(Asset):
         if data == 'dummy_default!#$':
             data = self.show_steps
 
-        if isinstance(data, dict):
+        if isinstance(data, StreamedShowSteps):
+            return [self.get_show_steps(data[index]) for index in range(len(data))]
+        elif isinstance(data, dict):
             new_dict = dict()
             for k, v in data.items():
                 new_dict[k] = self.get_show_steps(v)
@@ -249,16 +386,79 @@ class Show(Asset):
         if token not in self.tokens:
             self.tokens.add(token)
 
-        if token_type == 'key':
+        # streamed shows only keep the slots of decoded steps
+        if token_type == 'key' and not self.streamed:
             if token not in self.token_keys:
                 self.token_keys[token] = list()
             self.token_keys[token].append(path)
 
-        elif token_type == 'value':
+        elif token_type == 'value' and not self.streamed:
             if token not in self.token_values:
                 self.token_values[token] = list()
             self.token_values[token].append(path)
 
+        # remember the slot in its step so running shows can bind tokens
+        if path[0] not in self.token_steps:
+            self.token_steps[path[0]] = (list(), list())
+        value_slots, key_slots = self.token_steps[path[0]]
+        if token_type == 'key':
+            key_slots.append((path[1:], token))
+        else:
+            value_slots.append((path[1:], token))
+
+    def bind_tokens(self, step_index, show_tokens):
+        """Return a step with tokens replaced by show_tokens.
+
+        Only the dicts and lists on the paths to the tokens are copied. All
+        other settings are shared with the show and must not be modified.
+
+        Args:
+            step_index: Index of the step.
+            show_tokens: Dict of token -> replacement.
+        """
+        copies = {tuple(): copy(self.show_steps[step_index])}
+
+        def writable(path):
+            try:
+                return copies[path]
+            except KeyError:
+                pass
+            parent = writable(path[:-1])
+            container = copy(parent[path[-1]])
+            parent[path[-1]] = container
+            copies[path] = container
+            return container
+
+        value_slots, key_slots = self.token_steps[step_index]
+        for path, token in value_slots:
+            if token in show_tokens:
+                writable(path[:-1])[path[-1]] = show_tokens[token]
+
+        keys_replaced = dict()
+        for path, token in key_slots:
+            if token not in show_tokens:
+                continue
+
+            replacement = show_tokens[token]
+            key_name = '({})'.format(token)
+            target = writable(tuple(keys_replaced.get(x, x) for x in path))
+
+            if key_name in target:
+                target[replacement] = target.pop(key_name)
+            else:
+                # Fallback in case the token is no lowercase. Unfortunately, this can happen since every config
+                # player has its own config validator. Additionally, keys in dicts are not properly lowercased.
+                for key in target:
+                    if key.lower() == key_name:
+                        target[replacement] = target.pop(key)
+                        break
+                else:   # pragma: no cover
+                    raise KeyError("Could not find token {}".format(key_name))
+
+            keys_replaced[key_name] = replacement
+
+        return copies[tuple()]
+
     # pylint: disable-msg=too-many-arguments
     def play(self, priority=0, speed=1.0, start_step=1, callback=None,
              loops=-1, sync_ms=0, manual_advance=False, show_tokens=None):
@@ -341,7 +541,7 @@ class Show(Asset):
                              format(self.name, self.tokens, set(show_tokens.keys())))
 
         if self.loaded:
-            show_steps = self.get_show_steps()
+            show_steps = self.show_steps
         else:
             show_steps = False
 
@@ -364,6 +564,10 @@ class Show(Asset):
 
     def load_show_from_disk(self):
         """Load show from disk."""
+        show_data = self.machine.config_cache.get('show', self.file)
+        if show_data is not None:
+            return show_data
+
         show_version = YamlInterface.get_show_file_version(self.file)
 
         if show_version != int(__show_version__):   # pragma: no cover
@@ -372,7 +576,9 @@ class Show(Asset):
                                                        __version__,
                                                        __show_version__))
 
-        return FileManager.load(self.file)
+        show_data = FileManager.load(self.file)
+        self.machine.config_cache.set('show', self.file, show_data, [self.file])
+        return show_data
 
 
 # This class is more or less a container
@@ -408,6 +614,7 @@ class RunningShow(object):
         self.name = show.name
 
         self.id = self.machine.show_controller.get_next_show_id()
+        self._context = "show_" + str(self.id)
         self._players = list()
 
         # if show_tokens:
@@ -431,7 +638,7 @@ class RunningShow(object):
         """
         del show
         self._show_loaded = True
-        self.show_steps = self.show.get_show_steps()
+        self.show_steps = self.show.show_steps
         self._start_play()
 
     def _start_play(self):
@@ -447,18 +654,17 @@ class RunningShow(object):
         else:
             self.next_step_index = 0
 
-        if self.show_tokens and self.show.tokens:
-            self._replace_tokens(**self.show_tokens)
-
         self.show.running.add(self)
         self.machine.show_controller.notify_show_starting(self)
 
         # Figure out the show start time
         if self.sync_ms:
-            delay_secs = (self.sync_ms / 1000.0) - (self.next_step_time % (self.sync_ms / 1000.0))
-            self.next_step_time += delay_secs
-            self._delay_handler = self.machine.clock.schedule_once(self._run_next_step,
-                                                                   delay_secs)
+            # start at the next point of the sync grid. all shows which start
+            # there share one deadline in the show scheduler
+            sync_secs = self.sync_ms / 1000.0
+            self.next_step_time = (math.floor(self.next_step_time / sync_secs) + 1) * sync_secs
+            self._delay_handler = self.machine.show_controller.show_scheduler.schedule(self.next_step_time,
+                                                                                       self._run_next_step)
         else:  # run now
             self._run_next_step()
 
@@ -466,42 +672,24 @@ class RunningShow(object):
         """Return str representation."""
         return 'Running Show Instance: "{}" {} {}'.format(self.name, self.show_tokens, self.next_step_index)
 
-    def _replace_tokens(self, **kwargs):
-        keys_replaced = dict()
+    def _get_step(self, index):
+        """Return a step with the tokens of this show bound.
 
-        for token, replacement in kwargs.items():
-            if token in self.show.token_values:
-                for token_path in self.show.token_values[token]:
-                    target = self.show_steps
-                    for x in token_path[:-1]:
-                        target = target[x]
-
-                    target[token_path[-1]] = replacement
-
-        for token, replacement in kwargs.items():
-            if token in self.show.token_keys:
-                key_name = '({})'.format(token)
-                for token_path in self.show.token_keys[token]:
-                    target = self.show_steps
-                    for x in token_path:
-                        if x in keys_replaced:
-                            x = keys_replaced[x]
-
-                        target = target[x]
-
-                    if key_name in target:
-                        target[replacement] = target.pop(key_name)
-                    else:
-                        # Fallback in case the token is no lowercase. Unfortunately, this can happen since every config
-                        # player has its own config validator. Additionally, keys in dicts are not properly lowercased.
-                        for key in target:
-                            if key.lower() == key_name:
-                                target[replacement] = target.pop(key)
-                                break
-                        else:   # pragma: no cover
-                            raise KeyError("Could not find token {}".format(key_name))
-
-                    keys_replaced[key_name] = replacement
+        Steps are shared with the show. Steps with tokens are bound every time
+        they run and not kept so the memory of a running show does not grow
+        with the length of the show.
+        """
+        if not self.show_tokens or not self.show.step_has_tokens(index):
+            return self.show_steps[index]
+
+        return self.show.bind_tokens(index, self.show_tokens)
+
+    def _get_compiled_step(self, index):
+        """Return the compiled step with the tokens of this show bound."""
+        if not self.show_tokens or not self.show.step_has_tokens(index):
+            return self.show.get_compiled_step(index)
+
+        return self.show.compile_step(self._get_step(index))
 
     def stop(self):
         """Stop show."""
@@ -519,14 +707,14 @@ class RunningShow(object):
 
         # clear context in used players
         for player in self._players:
-            self.machine.show_controller.show_players[player].show_stop_callback("show_" + str(self.id))
+            self.machine.show_controller.show_players[player].show_stop_callback(self._context)
 
         if self.callback and callable(self.callback):
             self.callback()
 
     def _remove_delay_handler(self):
         if self._delay_handler:
-            self.machine.clock.unschedule(self._delay_handler)
+            self.machine.show_controller.show_scheduler.unschedule(self._delay_handler)
             self._delay_handler = None
 
     def pause(self):
@@ -575,6 +763,7 @@ class RunningShow(object):
 
     def _run_next_step(self, dt=None):
         del dt
+        self._delay_handler = None
 
         if self.next_step_index < 0:
             self.next_step_index %= self._total_steps
@@ -592,30 +781,124 @@ class RunningShow(object):
                 return False
 
         current_step_index = self.next_step_index
+        duration, actions = self._get_compiled_step(current_step_index)
 
-        for item_type, item_dict in (
-                iter(self.show_steps[current_step_index].items())):
-
-            if item_type == 'duration':
-                continue
-
-            elif item_type in self.machine.show_controller.show_players:
+        for player_name, action in actions:
+            if player_name not in self._players:
+                self.machine.show_controller.show_players[player_name].show_start_callback(self._context)
+                self._players.append(player_name)
 
-                self.machine.show_controller.show_players[item_type].show_play_callback(
-                    settings=item_dict,
-                    context="show_" + str(self.id),
-                    priority=self.priority,
-                    show_tokens=self.show_tokens)
-
-                if item_type not in self._players:
-                    self._players.append(item_type)
+            action(context=self._context, priority=self.priority, show_tokens=self.show_tokens)
 
         self.next_step_index += 1
 
-        time_to_next_step = self.show_steps[current_step_index]['duration'] / self.speed
+        time_to_next_step = duration / self.speed
         if not self.manual_advance and time_to_next_step > 0:
             self.next_step_time += time_to_next_step
-            self._delay_handler = self.machine.clock.schedule_once(self._run_next_step,
-                                                                   self.next_step_time - self.machine.clock.get_time())
+            self._delay_handler = self.machine.show_controller.show_scheduler.schedule(self.next_step_time,
+                                                                                       self._run_next_step)
 
             return time_to_next_step
+
+
+class StreamedShowSteps(object):
+
+    """Steps of a compiled show which are decoded while the show plays.
+
+    Behaves like the list of steps of a loaded show. Steps are read from the
+    compiled show file and validated in windows which start at the first
+    requested step which is not decoded yet. Once half of a window has been
+    requested, the next window is prefetched so it is decoded before the play
+    head reaches it. At most two windows are kept in memory. Older steps are
+    dropped and decoded again when a show loops or steps back.
+    """
+
+    def __init__(self, show_file, window, decode_step, forget_step, schedule=None):
+        """Initialise streamed show steps.
+
+        Args:
+            show_file: CompiledShowFile to read the steps from.
+            window: Number of steps which are decoded at once.
+            decode_step: Callable which gets the index, duration and raw step
+                and returns the validated step.
+            forget_step: Callable which is called with the index of every step
+                which is dropped.
+            schedule: Callable which runs a callback later (e.g.
+                loop.call_soon). Used to prefetch windows outside of the
+                request for a step. Windows are prefetched right away if it
+                is None.
+        """
+        self.show_file = show_file
+        self.tokens = show_file.tokens
+        self.window = max(1, window)
+        self._decode_step = decode_step
+        self._forget_step = forget_step
+        self._schedule = schedule
+        self._prefetch_index = None
+        self._steps = OrderedDict()
+
+    def __len__(self):
+        """Return the number of steps."""
+        return len(self.show_file)
+
+    def __getitem__(self, index):
+        """Return a validated step."""
+        if index < 0:
+            index += len(self)
+
+        try:
+            step = self._steps[index]
+        except KeyError:
+            if not 0 <= index < len(self):
+                raise IndexError("Step {} is out of range".format(index))
+
+            self.load(index)
+            step = self._steps[index]
+
+        self._prefetch(index + (self.window + 1) // 2)
+        return step
+
+    def _prefetch(self, index):
+        """Decode the window which starts at index unless it is decoded already."""
+        if index >= len(self) or index in self._steps or self._prefetch_index is not None:
+            return
+
+        self._prefetch_index = index
+        if self._schedule:
+            self._schedule(self._run_prefetch)
+        else:
+            self._run_prefetch()
+
+    def _run_prefetch(self):
+        index = self._prefetch_index
+        self._prefetch_index = None
+        # the show may have been unloaded in the meantime
+        if index is not None:
+            self.load(index)
+
+    def load(self, index):
+        """Decode and validate the window of steps which starts at index."""
+        if index in self._steps:
+            return
+
+        for step_index in range(index, min(index + self.window, len(self))):
+            if step_index in self._steps:
+                self._steps.move_to_end(step_index)
+                continue
+
+            self._steps[step_index] = self._decode_step(step_index, self.show_file.durations[step_index],
+                                                        self.show_file.read_step(step_index))
+
+        while len(self._steps) > 2 * self.window:
+            step_index, _ = self._steps.popitem(last=False)
+            self._forget_step(step_index)
+
+    def get_decoded_count(self):
+        """Return the number of steps which are in memory."""
+        return len(self._steps)
+
+    def close(self):
+        """Drop all steps and close the show file."""
+        self._steps = OrderedDict()
+        self._prefetch_index = None
+        self.show_file.close()
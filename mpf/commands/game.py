@@ -45,6 +45,14 @@ class Command(object):
                                  "Windows platforms. Must also use -v for "
                                  "this to work.")
 
+        parser.add_argument("-t",
+                            action="store", dest="trace", default=None,
+                            metavar='subsystems',
+                            help="Enables debug tracing for a comma separated "
+                                 "list of subsystems (e.g. events,switches,"
+                                 "leds). Overwrites the log level of these "
+                                 "subsystems to DEBUG.")
+
         parser.add_argument("-x",
                             action="store_const", dest="force_platform",
                             const='virtual',
@@ -1,35 +1,37 @@
 """Coil config player."""
-from copy import deepcopy
+from mpf.config_players.device_config_player import BoundDeviceConfigPlayer
 
-from mpf.config_players.device_config_player import DeviceConfigPlayer
 
-
-class CoilPlayer(DeviceConfigPlayer):
+class CoilPlayer(BoundDeviceConfigPlayer):
 
     """Triggers coils based on config."""
 
     config_file_section = 'coil_player'
     show_section = 'coils'
-
-    def play(self, settings, context, priority=0, **kwargs):
+    machine_collection_name = 'coils'
+    require_devices = True
+
+    def _bind_device(self, coil, device_settings):
+        """Split the action from the other settings."""
+        settings = dict(device_settings)
+        action = settings.pop('action')
+        if not hasattr(coil, action):
+            raise AssertionError("Invalid action {} for coil {} in coil_player".format(action, coil.name))
+        return coil, action, settings
+
+    def _play_actions(self, actions, context, priority=0, **kwargs):
         """Enable, Pulse or disable coils."""
         del kwargs
+        del priority
         instance_dict = self._get_instance_dict(context)
 
-        for coil, s in settings.items():
-            s = deepcopy(s)
-            action = s.pop('action')
-            try:
-                coil = getattr(coil, action)
-            except AttributeError:
-                coil = getattr(self.machine.coils[coil], action)
-
+        for coil, action, settings in actions:
             if action in ("disable", "off") and coil.name in instance_dict:
                 del instance_dict[coil.name]
             elif action in ("on", "enable"):
                 instance_dict[coil.name] = coil
 
-            coil(**s)
+            getattr(coil, action)(**settings)
 
     def clear_context(self, context):
         """Disable enabled coils."""
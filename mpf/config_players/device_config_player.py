@@ -1,7 +1,9 @@
 """Base class for config players which have multiple entries."""
 import abc
+from functools import partial
 
 from mpf.core.config_player import ConfigPlayer
+from mpf.core.utility_functions import Util
 
 
 class DeviceConfigPlayer(ConfigPlayer, metaclass=abc.ABCMeta):
@@ -43,17 +45,13 @@ class DeviceConfigPlayer(ConfigPlayer, metaclass=abc.ABCMeta):
 
         device_settings = self._parse_config(device_settings, device)
 
-        try:
-            if self.device_collection:
-                devices = self.device_collection.items_tagged(device)
-                if not devices:
-                    devices = [self.device_collection[device]]
-
-            else:
-                devices = [device]
-
-        except KeyError:
+        if not self.device_collection:
             devices = [device]
+        elif device in self.device_collection:
+            # only scan tags if this is no device name
+            devices = [self.device_collection[device]]
+        else:
+            devices = self.device_collection.items_tagged(device) or [device]
 
         return_dict = dict()
         for device in devices:
@@ -61,6 +59,40 @@ class DeviceConfigPlayer(ConfigPlayer, metaclass=abc.ABCMeta):
 
         return return_dict
 
+    def register_player_events(self, config, mode=None, priority=0):
+        """Register events for standalone player.
+
+        The action for the settings of every event is built once here (see
+        get_play_action).
+        """
+        key_list = list()
+
+        if config:
+            for event, settings in config.items():
+                key_list.append(
+                    self.machine.events.add_handler(
+                        event=event,
+                        handler=partial(self.config_play_action_callback, self.get_play_action(settings)),
+                        priority=priority,
+                        mode=mode))
+
+        return key_list
+
+    def get_play_action(self, settings):
+        """Return a callable which plays settings.
+
+        The callable is called with context, priority and the kwargs of the
+        event or show.
+
+        Args:
+            settings: Validated settings of this player.
+        """
+        return partial(self.play, settings)
+
+    def get_show_step_action(self, settings):
+        """Return an action for the settings of a show step."""
+        return self.get_play_action(settings)
+
     @abc.abstractmethod
     def play(self, settings, context, priority=0, **kwargs):
         """Directly play player."""
@@ -94,3 +126,100 @@ class DeviceConfigPlayer(ConfigPlayer, metaclass=abc.ABCMeta):
 
         """
         raise NotImplementedError(self.config_file_section)
+
+
+class BoundDeviceConfigPlayer(DeviceConfigPlayer, metaclass=abc.ABCMeta):
+
+    """Base class for device config players which bind settings to their devices once.
+
+    Settings are bound to their devices when events are registered or show
+    steps are compiled (see get_play_action). Bound actions only apply
+    context and priority when they are played. Entries which are no device
+    (e.g. tags or devices which do not exist yet) are resolved again
+    whenever they are played because tags of devices may change.
+    """
+
+    require_devices = False
+    """Raise KeyError in play if a device in the settings does not exist."""
+
+    def get_play_action(self, settings):
+        """Return a callable which plays settings.
+
+        Devices are resolved and settings are parsed once here. The callable
+        only applies context, priority and the kwargs of the event or show.
+
+        Args:
+            settings: Validated settings of this player.
+        """
+        actions = list()
+        unbound_entries = list()
+        for device, device_settings in settings.items():
+            devices = self._get_fixed_devices(device)
+            if devices is None:
+                unbound_entries.append((device, device_settings))
+            else:
+                actions.extend(self._bind_device(device_obj, device_settings) for device_obj in devices)
+
+        if not unbound_entries:
+            return partial(self._play_actions, tuple(actions))
+
+        return partial(self._play_unbound_entries, tuple(actions), tuple(unbound_entries))
+
+    def play(self, settings, context, priority=0, **kwargs):
+        """Bind settings and play them."""
+        self.get_play_action(settings)(context, priority, **kwargs)
+
+    def _play_unbound_entries(self, actions, unbound_entries, context, priority=0, **kwargs):
+        """Resolve tags and devices which were not bound and play them together with the bound actions."""
+        actions = list(actions)
+        for device, device_settings in unbound_entries:
+            devices = self._get_devices(device)
+            if not devices and self.require_devices:
+                raise KeyError("{}: No device with the name or tag {}".format(self.config_file_section, device))
+
+            actions.extend(self._bind_device(device_obj, device_settings) for device_obj in devices)
+
+        self._play_actions(tuple(actions), context, priority, **kwargs)
+
+    def _get_fixed_devices(self, device):
+        """Return a list of devices for entries which always play the same devices.
+
+        Returns None for tags and devices which do not exist (yet).
+        """
+        if not isinstance(device, str) or not self.device_collection:
+            return [device]
+
+        if device in self.device_collection:
+            return [self.device_collection[device]]
+
+        device_list = Util.string_to_list(device)
+        if len(device_list) > 1 and all(device_name in self.device_collection for device_name in device_list):
+            return [self.device_collection[device_name] for device_name in device_list]
+
+        return None
+
+    def _get_devices(self, device):
+        """Return a list of devices for a device, a name, a list of names or a tag."""
+        devices = self._get_fixed_devices(device)
+        if devices is not None:
+            return devices
+
+        if len(Util.string_to_list(device)) > 1:
+            return []
+
+        return self.device_collection.items_tagged(device)
+
+    @abc.abstractmethod
+    def _bind_device(self, device, device_settings):
+        """Return an action for one device which is passed to _play_actions.
+
+        Resolve and parse everything which does not depend on context or
+        priority here.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _play_actions(self, actions, context, priority=0, **kwargs):
+        """Play a tuple of actions which were returned by _bind_device."""
+        # **kwargs since this is an event callback
+        raise NotImplementedError
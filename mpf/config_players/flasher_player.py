@@ -1,25 +1,26 @@
 """Flasher config player."""
-from copy import deepcopy
-from mpf.config_players.device_config_player import DeviceConfigPlayer
+from mpf.config_players.device_config_player import BoundDeviceConfigPlayer
 
 
-class FlasherPlayer(DeviceConfigPlayer):
+class FlasherPlayer(BoundDeviceConfigPlayer):
 
     """Triggers flashers based on config."""
 
     config_file_section = 'flasher_player'
     show_section = 'flashers'
+    machine_collection_name = 'flashers'
+    require_devices = True
 
-    def play(self, settings, context, priority=0, **kwargs):
+    def _bind_device(self, flasher, device_settings):
+        """Nothing to parse for flashers."""
+        return flasher, device_settings
+
+    def _play_actions(self, actions, context, priority=0, **kwargs):
         """Flash flashers."""
         del kwargs
 
-        for flasher, s in settings.items():
-            s = deepcopy(s)
-            try:
-                flasher.flash(**s)
-            except AttributeError:
-                self.machine.flashers[flasher].flash(**s)
+        for flasher, settings in actions:
+            flasher.flash(**settings)
 
     def get_express_config(self, value):
         """Parse express config."""
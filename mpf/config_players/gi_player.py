@@ -1,28 +1,28 @@
 """GI config player."""
-from copy import deepcopy
-from mpf.config_players.device_config_player import DeviceConfigPlayer
+from mpf.config_players.device_config_player import BoundDeviceConfigPlayer
 
 
-class GiPlayer(DeviceConfigPlayer):
+class GiPlayer(BoundDeviceConfigPlayer):
 
     """Enables GIs based on config."""
 
     config_file_section = 'gi_player'
     show_section = 'gis'
+    machine_collection_name = 'gis'
+    require_devices = True
 
-    def play(self, settings, context, priority=0, **kwargs):
+    def _bind_device(self, gi, device_settings):
+        """Nothing to parse for GIs."""
+        return gi, device_settings
+
+    def _play_actions(self, actions, context, priority=0, **kwargs):
         """Enable GIs."""
         del kwargs
         instance_dict = self._get_instance_dict(context)
 
-        for gi, s in settings.items():
-            s = deepcopy(s)
-            try:
-                gi.enable(**s)
-                instance_dict[gi.name] = gi
-            except AttributeError:
-                self.machine.gis[gi].enable(**s)
-                instance_dict[gi] = self.machine.gis[gi]
+        for gi, settings in actions:
+            gi.enable(**settings)
+            instance_dict[gi.name] = gi
 
     def get_express_config(self, value):
         """Parse express config."""
@@ -1,11 +1,10 @@
 """LED config player."""
-from copy import deepcopy
-from mpf.config_players.device_config_player import DeviceConfigPlayer
+from mpf.config_players.device_config_player import BoundDeviceConfigPlayer
 from mpf.core.rgb_color import RGBColor
 from mpf.core.utility_functions import Util
 
 
-class LedPlayer(DeviceConfigPlayer):
+class LedPlayer(BoundDeviceConfigPlayer):
 
     """Sets LED color based on config."""
 
@@ -13,46 +12,24 @@ class LedPlayer(DeviceConfigPlayer):
     show_section = 'leds'
     machine_collection_name = "leds"
 
-    def play(self, settings, context, priority=0, **kwargs):
-        """Set LED color based on config."""
-        instance_dict = self._get_instance_dict(context)
-        full_context = self._get_full_context(context)
-        del kwargs
-
-        for led, s in settings.items():
-            s = deepcopy(s)
-            try:
-                s['priority'] += priority
-            except KeyError:
-                s['priority'] = priority
-
-            try:
-                self._led_color(led, instance_dict, full_context, **s)
+    def _bind_device(self, led, device_settings):
+        """Parse the color once."""
+        if device_settings['color'] == "on":
+            color = RGBColor(led.config['default_color'])
+        else:
+            color = RGBColor(device_settings['color'])
 
-            except AttributeError:
-                try:
-                    self._led_named_color(led, instance_dict, full_context, **s)
-                except KeyError:
-                    led_list = Util.string_to_list(led)
-                    if len(led_list) > 1:
-                        for led1 in led_list:
-                            self._led_named_color(led1, instance_dict, full_context, **s)
-                    else:
-                        for led1 in self.machine.leds.sitems_tagged(led):
-                            self._led_named_color(led1, instance_dict, full_context, **s)
+        return led, color, device_settings.get('fade_ms'), device_settings.get('priority', 0)
 
-    def _led_named_color(self, led_name, instance_dict, full_context, color, **s):
-        led = self.machine.leds[led_name]
-        self._led_color(led, instance_dict, full_context, color, **s)
+    def _play_actions(self, actions, context, priority=0, **kwargs):
+        """Set LED colors."""
+        del kwargs
+        instance_dict = self._get_instance_dict(context)
+        full_context = self._get_full_context(context)
 
-    @staticmethod
-    def _led_color(led, instance_dict, full_context, color, **s):
-        if color == "on":
-            color = led.config['default_color']
-        else:
-            color = RGBColor(color)
-        led.color(color, key=full_context, **s)
-        instance_dict[led.name] = led
+        for led, color, fade_ms, led_priority in actions:
+            led.color(color, fade_ms=fade_ms, priority=led_priority + priority, key=full_context)
+            instance_dict[led.name] = led
 
     def clear_context(self, context):
         """Remove all colors which were set in context."""
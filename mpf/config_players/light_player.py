@@ -1,10 +1,9 @@
 """Light config player."""
-from copy import deepcopy
-from mpf.config_players.device_config_player import DeviceConfigPlayer
+from mpf.config_players.device_config_player import BoundDeviceConfigPlayer
 from mpf.core.utility_functions import Util
 
 
-class LightPlayer(DeviceConfigPlayer):
+class LightPlayer(BoundDeviceConfigPlayer):
 
     """Sets lights based on config."""
 
@@ -12,39 +11,20 @@ class LightPlayer(DeviceConfigPlayer):
     show_section = 'lights'
     machine_collection_name = 'lights'
 
-    def play(self, settings, context, priority=0, **kwargs):
-        """Set brightness based on config."""
+    def _bind_device(self, light, device_settings):
+        """Split priority from the other settings."""
+        settings = {key: value for key, value in device_settings.items() if key != 'priority'}
+        return light, device_settings.get('priority', 0), settings
+
+    def _play_actions(self, actions, context, priority=0, **kwargs):
+        """Set brightness of lights."""
         del kwargs
         instance_dict = self._get_instance_dict(context)
         full_context = self._get_full_context(context)
 
-        for light, s in settings.items():
-            s = deepcopy(s)
-            try:
-                s['priority'] += priority
-            except KeyError:
-                s['priority'] = priority
-
-            try:
-                light.on(key=full_context, **s)
-                instance_dict[light.name] = light
-
-            except AttributeError:
-                try:
-                    self._light_on(light, instance_dict, full_context, **s)
-                except KeyError:
-                    light_list = Util.string_to_list(light)
-                    if len(light_list) > 1:
-                        for light1 in light_list:
-                            self._light_on(light1, instance_dict, full_context, **s)
-                    else:
-                        for light1 in self.machine.lights.sitems_tagged(light):
-                            self._light_on(light1, instance_dict, full_context, **s)
-
-    def _light_on(self, light_name, instance_dict, full_context, **s):
-        light = self.machine.lights[light_name]
-        light.on(key=full_context, **s)
-        instance_dict[light.name] = light
+        for light, light_priority, settings in actions:
+            light.on(key=full_context, priority=light_priority + priority, **settings)
+            instance_dict[light.name] = light
 
     def clear_context(self, context):
         """Remove all brightness which was set in context."""
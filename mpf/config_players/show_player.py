@@ -1,10 +1,8 @@
 """Show config player."""
-from copy import deepcopy
+from mpf.config_players.device_config_player import BoundDeviceConfigPlayer
 
-from mpf.config_players.device_config_player import DeviceConfigPlayer
 
-
-class ShowPlayer(DeviceConfigPlayer):
+class ShowPlayer(BoundDeviceConfigPlayer):
 
     """Plays, starts, stops, pauses, resumes or advances shows based on config."""
 
@@ -12,31 +10,48 @@ class ShowPlayer(DeviceConfigPlayer):
     show_section = 'shows'
     device_collection = None
 
-    def play(self, settings, context, priority=0, **kwargs):
-        """Play, start, stop, pause, resume or advance show based on config."""
-        settings = deepcopy(settings)
+    def _bind_device(self, show, show_settings):
+        """Look up key and action once."""
+        if 'hold' in show_settings and show_settings['hold'] is not None:
+            raise AssertionError("Setting 'hold' is no longer supported for shows. Use duration -1 in your show.")
 
-        # show_tokens = kwargs.get('show_tokens', None)
+        if 'key' in show_settings and show_settings['key']:
+            key = show_settings['key']
+        else:
+            key = show
 
-        for show, show_settings in settings.items():
-            if 'hold' in show_settings and show_settings['hold'] is not None:
-                raise AssertionError("Setting 'hold' is no longer supported for shows. Use duration -1 in your show.")
-            try:
-                show_settings['priority'] += priority
-            except KeyError:
-                show_settings['priority'] = priority
+        actions = {
+            'play': self._play,
+            'stop': self._stop,
+            'pause': self._pause,
+            'resume': self._resume,
+            'advance': self._advance,
+            'step_back': self._step_back,
+            'update': self._update
+        }
 
-            # todo need to add this key back to the config player
+        action = actions.get(show_settings['action'].lower(), None)
+
+        if not callable(action):
+            raise AssertionError("Invalid action {} in show_player {}".format(show_settings['action'], key))
+
+        return key, show, show_settings, action
+
+    def _play_actions(self, actions, context, priority=0, **kwargs):
+        """Play, start, stop, pause, resume or advance show based on config."""
+        del kwargs
+        instance_dict = self._get_instance_dict(context)
 
-            self._update_show(show, show_settings, context)
+        for key, show, show_settings, action in actions:
+            action(key, instance_dict, show, show_settings, show_settings.get('priority', 0) + priority)
 
-    def _play(self, key, instance_dict, show, show_settings):
+    def _play(self, key, instance_dict, show, show_settings, priority):
         if key in instance_dict:
             instance_dict[key].stop()
         try:
             show_instance = self.machine.shows[show].play(
                 show_tokens=show_settings['show_tokens'],
-                priority=show_settings['priority'],
+                priority=priority,
                 speed=show_settings['speed'],
                 start_step=show_settings['start_step'],
                 loops=show_settings['loops'],
@@ -49,72 +64,53 @@ class ShowPlayer(DeviceConfigPlayer):
                            "name.".format(show))
 
     @staticmethod
-    def _stop(key, instance_dict, show, show_settings):
+    def _stop(key, instance_dict, show, show_settings, priority):
         del show
         del show_settings
+        del priority
         if key in instance_dict:
             instance_dict[key].stop()
             del instance_dict[key]
 
     @staticmethod
-    def _pause(key, instance_dict, show, show_settings):
+    def _pause(key, instance_dict, show, show_settings, priority):
         del show
         del show_settings
+        del priority
         if key in instance_dict:
             instance_dict[key].pause()
 
     @staticmethod
-    def _resume(key, instance_dict, show, show_settings):
+    def _resume(key, instance_dict, show, show_settings, priority):
         del show
         del show_settings
+        del priority
         if key in instance_dict:
             instance_dict[key].resume()
 
     @staticmethod
-    def _advance(key, instance_dict, show, show_settings):
+    def _advance(key, instance_dict, show, show_settings, priority):
         del show
         del show_settings
+        del priority
         if key in instance_dict:
             instance_dict[key].advance()
 
     @staticmethod
-    def _step_back(key, instance_dict, show, show_settings):
+    def _step_back(key, instance_dict, show, show_settings, priority):
         del show
         del show_settings
+        del priority
         if key in instance_dict:
             instance_dict[key].step_back()
 
     @staticmethod
-    def _update(key, instance_dict, show, show_settings):
+    def _update(key, instance_dict, show, show_settings, priority):
         del show
         if key in instance_dict:
             instance_dict[key].update(
                 show_tokens=show_settings['show_tokens'],
-                priority=show_settings['priority'])
-
-    def _update_show(self, show, show_settings, context):
-        instance_dict = self._get_instance_dict(context)
-        if 'key' in show_settings and show_settings['key']:
-            key = show_settings['key']
-        else:
-            key = show
-
-        actions = {
-            'play': self._play,
-            'stop': self._stop,
-            'pause': self._pause,
-            'resume': self._resume,
-            'advance': self._advance,
-            'step_back': self._step_back,
-            'update': self._update
-        }
-
-        action = actions.get(show_settings['action'].lower(), None)
-
-        if not callable(action):
-            raise AssertionError("Invalid action {} in show_player {}".format(show_settings['action'], key))
-
-        action(key, instance_dict, show, show_settings)
+                priority=priority)
 
     def clear_context(self, context):
         """Stop running shows from context."""
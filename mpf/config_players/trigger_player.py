@@ -1,20 +1,24 @@
 """Trigger config player."""
-from mpf.config_players.device_config_player import DeviceConfigPlayer
+from mpf.config_players.device_config_player import BoundDeviceConfigPlayer
 
 
-class TriggerPlayer(DeviceConfigPlayer):
+class TriggerPlayer(BoundDeviceConfigPlayer):
 
     """Executes BCP triggers based on config."""
 
     config_file_section = 'trigger_player'
     show_section = 'triggers'
 
-    def play(self, settings, context, priority=0, **kwargs):
+    def _bind_device(self, trigger, device_settings):
+        """Nothing to parse for triggers."""
+        return trigger, device_settings
+
+    def _play_actions(self, actions, context, priority=0, **kwargs):
         """Execute BCP triggers."""
         del kwargs
 
-        for trigger, s in settings.items():
-            self.machine.bcp.bcp_trigger(trigger, **s)
+        for trigger, settings in actions:
+            self.machine.bcp.bcp_trigger(trigger, **settings)
 
     def get_express_config(self, value):
         """Not supported."""
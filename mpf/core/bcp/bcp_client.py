@@ -6,7 +6,12 @@ import asyncio
 
 class BaseBcpClient(metaclass=abc.ABCMeta):
 
-    """Base class for bcp clients."""
+    """Base class for bcp clients.
+
+    Attributes:
+        capabilities: Set of optional protocol features which the remote
+            announced in its hello (e.g. "device_delta").
+    """
 
     def __init__(self, machine, name, bcp):
         """Initialise client."""
@@ -14,6 +19,7 @@ class BaseBcpClient(metaclass=abc.ABCMeta):
         self.machine = machine
         self.bcp = bcp
         self.exit_on_close = False
+        self.capabilities = set()
 
     def connect(self, config):
         """Actively connect client."""
@@ -1,5 +1,6 @@
 """RPC Interface for BCP clients."""
 import logging
+from functools import partial
 
 from mpf.core.player import Player
 from mpf.core.utility_functions import Util
@@ -57,6 +58,13 @@ class BcpInterface(object):
 
         self._monitorable_devices = []
 
+        # device changes which have not been sent yet per client:
+        # {client: {device: {attribute: (value at the last flush, old, new)}}}
+        self._device_changes = dict()
+        self._device_last_flush = dict()
+        max_rate = self.config['device_monitor_max_rate']
+        self._device_flush_interval = 1 / max_rate if max_rate else 0
+
         self.machine.events.add_handler('player_add_success',
                                         self.bcp_player_added)
         self.machine.events.add_handler('machine_reset_phase_1',
@@ -95,10 +103,18 @@ class BcpInterface(object):
             self.machine.events.remove_handler_by_event(event=event, handler=self.bcp_trigger)
 
     def _monitor_devices(self, client):
-        """Register client to get notified of device changes."""
+        """Register client to get notified of device changes.
+
+        The client receives the full state of all devices once. Afterwards,
+        it gets the last change of every attribute together with the full
+        state. Clients with the "device_delta" capability only get the
+        attributes which changed.
+        """
         self.machine.bcp.transport.add_handler_to_transport("_devices", client)
 
-        # initially send all states
+        # initially send all states. this replaces all pending changes
+        if client in self._device_changes:
+            self._device_changes[client] = dict()
         for device in self._monitorable_devices:
             self.machine.bcp.transport.send_to_client(
                 client=client,
@@ -116,17 +132,74 @@ class BcpInterface(object):
         self._monitorable_devices.append(device)
 
     def notify_device_changes(self, device, attribute_name, old_value, new_value):
-        """Notify all listeners about device change."""
+        """Notify all listeners about device change.
+
+        Changes are collected per client and device and sent at the end of the
+        current loop iteration but at most bcp:device_monitor_max_rate times
+        per second to every client.
+        """
         if not self.configured:
             return
 
-        self.machine.bcp.transport.send_to_clients_with_handler(
-            handler="_devices",
-            bcp_command='device',
-            type=device.class_label,
-            name=device.name,
-            changes=(attribute_name, Util.convert_to_simply_type(old_value), Util.convert_to_simply_type(new_value)),
-            state=device.get_monitorable_state())
+        old_value = Util.convert_to_simply_type(old_value)
+        new_value = Util.convert_to_simply_type(new_value)
+        for client in self.machine.bcp.transport.get_transports_for_handler("_devices"):
+            if client not in self._device_changes:
+                self._device_changes[client] = dict()
+                flush_time = max(self.machine.clock.get_time(),
+                                 self._device_last_flush.get(client, 0) + self._device_flush_interval)
+                self.machine.clock.schedule_at(flush_time, partial(self._flush_device_changes, client))
+
+            device_changes = self._device_changes[client].setdefault(device, dict())
+            if attribute_name in device_changes:
+                # keep the value at the last flush and the last change
+                device_changes[attribute_name] = (device_changes[attribute_name][0], old_value, new_value)
+            else:
+                device_changes[attribute_name] = (old_value, old_value, new_value)
+
+    def _flush_device_changes(self, client):
+        """Send all pending device changes to a client."""
+        changes = self._device_changes.pop(client)
+        self._device_last_flush[client] = self.machine.clock.get_time()
+
+        if client not in self.machine.bcp.transport.get_transports_for_handler("_devices"):
+            # client disconnected in the meantime
+            del self._device_last_flush[client]
+            return
+
+        if "device_delta" in client.capabilities:
+            self._send_device_deltas(client, changes)
+            return
+
+        for device, attributes in changes.items():
+            state = device.get_monitorable_state()
+            for attribute_name, (_, old_value, new_value) in attributes.items():
+                self.machine.bcp.transport.send_to_client(
+                    client=client,
+                    bcp_command='device',
+                    type=device.class_label,
+                    name=device.name,
+                    changes=(attribute_name, old_value, new_value),
+                    state=state)
+
+    def _send_device_deltas(self, client, changes):
+        """Send one message per device with the attributes which changed since the last flush."""
+        for device, attributes in changes.items():
+            state = dict()
+            for attribute_name, (flushed_value, _, _) in attributes.items():
+                value = Util.convert_to_simply_type(getattr(device, attribute_name))
+                # skip attributes which changed back in the meantime
+                if value != flushed_value:
+                    state[attribute_name] = value
+
+            if state:
+                self.machine.bcp.transport.send_to_client(
+                    client=client,
+                    bcp_command='device',
+                    type=device.class_label,
+                    name=device.name,
+                    changes=True,
+                    state=state)
 
     def _monitor_player_vars(self, client):
         self.machine.bcp.transport.add_handler_to_transport("_player_vars", client)
@@ -1,13 +1,26 @@
 """BCP socket client."""
+import base64
 import json
 import logging
+import struct
 from urllib.parse import urlsplit, parse_qs, quote, unquote, urlunparse
 
 import asyncio
 
+try:
+    import msgpack
+except ImportError:     # pragma: no cover
+    msgpack = None
+
 from mpf._version import __version__, __bcp_version__
 from mpf.core.bcp.bcp_client import BaseBcpClient
 
+# length of the encoded command and length of the raw bytes which follow it
+BINARY_FRAME_HEADER = struct.Struct('!II')
+
+# optional protocol features which we support and announce in our hello
+CAPABILITIES = ['device_delta']
+
 
 def decode_command_string(bcp_string):
     """Decode a BCP command string into separate command and paramter parts.
@@ -109,12 +122,86 @@ def encode_command_string(bcp_command, **kwargs):
     return str(urlunparse(('', '', bcp_command.lower(), '', kwarg_string, '')))
 
 
+def _encode_json_value(value):
+    """Encode values which JSON does not support. Bytes are sent base64 encoded with a type marker."""
+    if isinstance(value, (bytes, bytearray)):
+        return {"__bytes__": base64.b64encode(value).decode()}
+
+    return str(value)
+
+
+def _decode_json_object(obj):
+    """Decode bytes which were encoded by _encode_json_value."""
+    if len(obj) == 1 and "__bytes__" in obj:
+        return base64.b64decode(obj["__bytes__"])
+
+    return obj
+
+
+def get_binary_codecs():
+    """Return the binary codecs supported on this system in order of preference."""
+    if msgpack:
+        return ['msgpack', 'json']
+    else:   # pragma: no cover
+        return ['json']
+
+
+def encode_command_binary(codec, bcp_command, **kwargs):
+    """Encode a BCP command and kwargs into the payload of a binary frame.
+
+    Args:
+        codec: Name of the negotiated codec (see get_binary_codecs()).
+        bcp_command: String of the BCP command name.
+        **kwargs: Optional pair(s) of kwargs which will be sent with the
+            command. Values which cannot be encoded are sent as strings
+            except bytes which are kept.
+
+    Returns:
+        bytes
+    """
+    message = [bcp_command.lower(), kwargs]
+    if codec == 'msgpack':
+        return msgpack.packb(message, use_bin_type=True, default=str)
+    else:
+        return json.dumps(message, default=_encode_json_value).encode()
+
+
+def decode_command_binary(codec, payload):
+    """Decode the payload of a binary frame.
+
+    Args:
+        codec: Name of the negotiated codec (see get_binary_codecs()).
+        payload: bytes of the encoded command.
+
+    Returns:
+        A tuple of the command string and a dictionary of kwarg pairs.
+    """
+    if codec == 'msgpack':
+        bcp_command, kwargs = msgpack.unpackb(payload, raw=False)
+    else:
+        bcp_command, kwargs = json.loads(payload.decode(), object_hook=_decode_json_object)
+
+    return bcp_command, kwargs
+
+
 class BCPClientSocket(BaseBcpClient):
 
     """Parent class for a BCP client socket.
 
     (There can be multiple of these to connect to multiple BCP media controllers simultaneously.)
 
+    Both sides start with the URL encoded text protocol and announce the binary
+    codecs they support in their hello. When the other side supports one of
+    ours, we send "binary?codec=<codec>" and every following message is sent as
+    binary frame: a header with the length of the encoded command and the
+    length of the raw bytes, the command encoded with the codec and the raw
+    bytes (e.g. DMD frames) as they are. Each direction switches on its own.
+    Clients which do not announce codecs keep using the text protocol.
+
+    Optional features of the protocol are negotiated the same way. Both sides
+    list them in the capabilities of their hello and a feature is only used
+    when the remote announced it.
+
     Args:
         machine: The main MachineController object.
         name: String name this client.
@@ -132,9 +219,12 @@ class BCPClientSocket(BaseBcpClient):
         self._receiver = None
         self._send_goodbye = True
         self._receive_buffer = b''
+        self._send_codec = None
+        self._receive_codec = None
 
         self._bcp_client_socket_commands = {'hello': self._receive_hello,
-                                            'goodbye': self._receive_goodbye}
+                                            'goodbye': self._receive_goodbye,
+                                            'binary': self._receive_binary}
 
     def connect(self, config):
         """Actively connect to server."""
@@ -184,17 +274,40 @@ class BCPClientSocket(BaseBcpClient):
 
         Args:
             bcp_command: command to send
-            bcp_command_args: parameters to command
+            bcp_command_args: parameters to command. rawbytes will be sent
+                as raw bytes after the command.
         """
-        bcp_string = encode_command_string(bcp_command, **bcp_command_args)
+        rawbytes = b''
+        if 'rawbytes' in bcp_command_args:
+            bcp_command_args = dict(bcp_command_args)
+            rawbytes = bcp_command_args.pop('rawbytes')
+
+        if self._send_codec:
+            payload = encode_command_binary(self._send_codec, bcp_command, **bcp_command_args)
 
-        self.log.debug('Sending "%s"', bcp_string)
-        self._sender.write((bcp_string + '\n').encode())
+            self.log.debug('Sending "%s" (binary)', bcp_command)
+            self._sender.write(BINARY_FRAME_HEADER.pack(len(payload), len(rawbytes)) + payload)
+        else:
+            bcp_string = encode_command_string(bcp_command, **bcp_command_args)
+            if rawbytes:
+                bcp_string += '&bytes={}'.format(len(rawbytes))
+
+            self.log.debug('Sending "%s"', bcp_string)
+            self._sender.write((bcp_string + '\n').encode())
+
+        if rawbytes:
+            self._sender.write(rawbytes)
 
     @asyncio.coroutine
     def read_message(self):
         """Read the next message."""
         while True:
+            if self._receive_codec:
+                message_obj = yield from self._read_binary_message()
+                if message_obj:
+                    return message_obj
+                continue
+
             message = yield from self._receiver.readline()
 
             # handle EOF
@@ -218,10 +331,32 @@ class BCPClientSocket(BaseBcpClient):
             if message_obj:
                 return message_obj
 
+    @asyncio.coroutine
+    def _read_binary_message(self):
+        try:
+            header = yield from self._receiver.readexactly(BINARY_FRAME_HEADER.size)
+            payload_length, bytes_length = BINARY_FRAME_HEADER.unpack(header)
+            payload = yield from self._receiver.readexactly(payload_length)
+            if bytes_length:
+                rawbytes = yield from self._receiver.readexactly(bytes_length)
+            else:
+                rawbytes = None
+        except asyncio.IncompleteReadError:
+            # handle EOF
+            raise BrokenPipeError()
+
+        cmd, kwargs = decode_command_binary(self._receive_codec, payload)
+        self.log.debug('Received "%s" (binary)', cmd)
+
+        return self._dispatch_command(cmd, kwargs, rawbytes)
+
     def _process_command(self, message, rawbytes=None):
         self.log.debug('Received "%s"', message)
 
         cmd, kwargs = decode_command_string(message.decode())
+        return self._dispatch_command(cmd, kwargs, rawbytes)
+
+    def _dispatch_command(self, cmd, kwargs, rawbytes):
         if rawbytes:
             kwargs['rawbytes'] = rawbytes
 
@@ -234,6 +369,29 @@ class BCPClientSocket(BaseBcpClient):
         """Process incoming BCP 'hello' command."""
         self.log.debug('Received BCP Hello from host with kwargs: %s', kwargs)
 
+        if kwargs.get('capabilities'):
+            self.capabilities = set(str(kwargs['capabilities']).split(',')).intersection(CAPABILITIES)
+
+        if self._send_codec or not kwargs.get('binary'):
+            return
+
+        remote_codecs = str(kwargs['binary']).split(',')
+        for codec in get_binary_codecs():
+            if codec in remote_codecs:
+                # this is the last text message in this direction
+                self.send('binary', {'codec': codec})
+                self._send_codec = codec
+                self.log.debug('Using binary BCP frames with codec %s', codec)
+                return
+
+    def _receive_binary(self, codec, **kwargs):
+        """Process incoming BCP 'binary' command. All following messages are binary frames."""
+        del kwargs
+        if codec not in get_binary_codecs():
+            raise AssertionError("Remote switched to unsupported BCP codec {}".format(codec))
+
+        self._receive_codec = codec
+
     def _receive_goodbye(self):
         """Process incoming BCP 'goodbye' command."""
         self._send_goodbye = False
@@ -243,7 +401,9 @@ class BCPClientSocket(BaseBcpClient):
         """Send BCP 'hello' command."""
         self.send('hello', {"version": __bcp_version__,
                             "controller_name": 'Mission Pinball Framework',
-                            "controller_version": __version__})
+                            "controller_version": __version__,
+                            "binary": ",".join(get_binary_codecs()),
+                            "capabilities": ",".join(CAPABILITIES)})
 
     def send_goodbye(self):
         """Send BCP 'goodbye' command."""
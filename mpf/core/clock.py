@@ -1,4 +1,6 @@
 """MPF clock and main loop."""
+import heapq
+import itertools
 import logging
 import asyncio
 from functools import partial
@@ -6,23 +8,62 @@ from functools import partial
 from mpf.pyserial_asyncio.serial_asyncio import create_serial_connection
 
 
+class ClockEvent:
+
+    """A callback which is scheduled once on the clock.
+
+    Returned by :meth:`ClockBase.schedule_once`. Cancelling only marks the
+    event. It will be dropped when its deadline is reached.
+    """
+
+    __slots__ = ["_clock", "_callback", "deadline", "_cancelled"]
+
+    def __init__(self, clock, callback, deadline):
+        """Initialise clock event."""
+        self._clock = clock
+        self._callback = callback
+        self.deadline = deadline
+        self._cancelled = False
+
+    def __repr__(self):
+        """Return string representation."""
+        return '<ClockEvent {} at {}{}>'.format(self._callback, self.deadline,
+                                                " (cancelled)" if self._cancelled else "")
+
+    def cancel(self):
+        """Cancel this event."""
+        if not self._cancelled:
+            self._cancelled = True
+            if self._clock:
+                self._clock.timer_cancelled()
+
+    def cancelled(self):
+        """Return true if this event has been cancelled."""
+        return self._cancelled
+
+    def run(self):
+        """Run callback."""
+        self._callback()
+
+
 class PeriodicTask:
 
-    """A periodic asyncio task."""
+    """A periodic task on the clock."""
 
-    def __init__(self, interval, loop, callback):
+    def __init__(self, interval, clock, callback):
         """Initialise periodic task."""
         self._canceled = False
         self._interval = interval
         self._callback = callback
-        self._loop = loop
-        self._last_call = self._loop.time()
+        self._clock = clock
+        self._last_call = self._clock.get_time()
+        self._event = None
         self._schedule()
 
     def _schedule(self):
         if self._canceled:
             return
-        self._loop.call_at(self._last_call + self._interval, self._run)
+        self._event = self._clock.schedule_at(self._last_call + self._interval, self._run)
 
     def get_next_call_time(self):
         """Return time of next call."""
@@ -39,6 +80,8 @@ class PeriodicTask:
     def cancel(self):
         """Cancel periodic task."""
         self._canceled = True
+        if self._event:
+            self._event.cancel()
 
 
 class ClockBase:
@@ -51,6 +94,14 @@ class ClockBase:
         self._log.debug("Starting tickless clock")
         self.loop = self._create_event_loop()
 
+        # heap of (deadline, sequence, ClockEvent). all timers share one loop
+        # wake-up which is scheduled for the earliest deadline.
+        self._timers = []
+        self._timer_sequence = itertools.count()
+        self._cancelled_timers = 0
+        self._wakeup = None
+        self._wakeup_time = None
+
     # pylint: disable-msg=no-self-use
     def _create_event_loop(self):
         return asyncio.get_event_loop()
@@ -138,14 +189,82 @@ class ClockBase:
             raise AssertionError('callback must be a callable, got %s' % callback)
 
         # TODO: remove dt parameter from all callbacks
-        new_callback = partial(callback, None)
-        event = self.loop.call_later(delay=timeout, callback=new_callback)
+        return self.schedule_at(self.loop.time() + timeout, partial(callback, None))
 
-        self._log.debug("Scheduled a one-time clock callback (callback=%s, timeout=%s)",
-                        str(callback), timeout)
+    def schedule_at(self, deadline, callback):
+        """Schedule a callback without arguments at an absolute loop time.
+
+        All callbacks which are due at the same time are run from one single
+        loop wake-up.
+
+        Args:
+            deadline: Absolute time (see :meth:`get_time`) to run the callback.
+            callback: callback to call
+
+        Returns:
+            A :class:`ClockEvent` instance.
+        """
+        event = ClockEvent(self, callback, deadline)
+        heapq.heappush(self._timers, (deadline, next(self._timer_sequence), event))
+
+        if self._wakeup_time is None or deadline < self._wakeup_time:
+            self._schedule_wakeup(deadline)
 
         return event
 
+    def _schedule_wakeup(self, deadline):
+        if self._wakeup:
+            self._wakeup.cancel()
+        self._wakeup_time = deadline
+        self._wakeup = self.loop.call_at(deadline, self._run_timers)
+
+    def _pop_timer(self):
+        """Remove the earliest timer from the heap and return it."""
+        event = heapq.heappop(self._timers)[2]
+        # it is no longer in the heap so cancel does not need to count it
+        event._clock = None     # pylint: disable-msg=protected-access
+        if event.cancelled():
+            self._cancelled_timers -= 1
+        return event
+
+    def timer_cancelled(self):
+        """Account for a cancelled timer and compact the heap when it is mostly cancelled."""
+        self._cancelled_timers += 1
+        if self._cancelled_timers > 100 and self._cancelled_timers * 2 > len(self._timers):
+            self._timers = [timer for timer in self._timers if not timer[2].cancelled()]
+            heapq.heapify(self._timers)
+            self._cancelled_timers = 0
+
+    def _run_timers(self):
+        """Run all timers which are due."""
+        self._wakeup = None
+        self._wakeup_time = None
+
+        now = self.loop.time()
+        due = []
+        while self._timers and self._timers[0][0] <= now:
+            due.append(self._pop_timer())
+
+        for event in due:
+            # an earlier callback in this batch may have cancelled it
+            if event.cancelled():
+                continue
+            # pylint: disable-msg=broad-except
+            try:
+                event.run()
+            except Exception as exc:
+                self.loop.call_exception_handler({
+                    'message': 'Exception in clock callback {!r}'.format(event),
+                    'exception': exc,
+                })
+
+        # drop cancelled timers from the top so we do not wake up for them
+        while self._timers and self._timers[0][2].cancelled():
+            self._pop_timer()
+
+        if self._timers and (self._wakeup_time is None or self._timers[0][0] < self._wakeup_time):
+            self._schedule_wakeup(self._timers[0][0])
+
     def schedule_interval(self, callback, timeout):
         """Schedule an event to be called every <timeout> seconds.
 
@@ -159,7 +278,7 @@ class ClockBase:
         if not callable(callback):
             raise AssertionError('callback must be a callable, got {}'.format(callback))
 
-        periodic_task = PeriodicTask(timeout, self.loop, callback)
+        periodic_task = PeriodicTask(timeout, self, callback)
 
         self._log.debug("Scheduled a recurring clock callback (callback=%s, timeout=%s)",
                         str(callback), timeout)
@@ -173,7 +292,7 @@ class ClockBase:
         Args:
             event: Event to cancel
         """
-        if isinstance(event, (asyncio.Handle, PeriodicTask)):
+        if isinstance(event, (ClockEvent, asyncio.Handle, PeriodicTask)):
             event.cancel()
         else:
             raise AssertionError("Broken unschedule")
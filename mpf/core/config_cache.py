@@ -0,0 +1,180 @@
+"""Versioned cache for parsed config files, config specs and validated config sections."""
+import hashlib
+import logging
+import os
+import pickle
+import threading
+
+from mpf._version import __version__
+
+
+class ConfigCache(object):
+
+    """Cache for everything MPF parses or validates during startup.
+
+    Every entry remembers the content hashes of the files it was created from
+    and is only used as long as all of those files still have the same
+    content. Modification times are not used so the cache stays valid when a
+    machine folder is copied or deployed to a read-only file system, and every
+    edit in ``config/`` or ``modes/`` invalidates exactly the entries which
+    were loaded from the edited file.
+
+    Entries which do not depend on files (e.g. validated config sections) are
+    keyed by a hash of their input instead.
+    """
+
+    version = 1
+    """Bump this when the layout of the cache file or of its entries changes."""
+
+    def __init__(self, filename, load=True, save=True):
+        """Initialise config cache.
+
+        Args:
+            filename: File which stores the cache.
+            load: Whether to load existing entries from the cache file.
+            save: Whether to write new entries back to the cache file.
+        """
+        self.log = logging.getLogger('ConfigCache')
+        self.filename = filename
+        self._save = save
+        self._lock = threading.Lock()
+        self._entries = dict()
+        self._used_entries = set()
+        self._file_hashes = dict()
+        self._dirty = False
+
+        if load:
+            self._load()
+
+    @staticmethod
+    def get_hash(data):
+        """Return the hash which is used to key data in the cache.
+
+        Args:
+            data: bytes or str to hash.
+        """
+        if isinstance(data, str):
+            data = data.encode('UTF-8')
+
+        return hashlib.sha1(data).hexdigest()
+
+    def _load(self):
+        try:
+            with open(self.filename, 'rb') as f:
+                cache = pickle.load(f)
+
+        except FileNotFoundError:
+            return
+
+        # unfortunately pickle can raise all kinds of exceptions and we dont want to crash on corrupted cache
+        # pylint: disable-msg=broad-except
+        except Exception:   # pragma: no cover
+            self.log.warning("Could not load config cache %s", self.filename)
+            return
+
+        if not isinstance(cache, dict) or cache.get('_version') != (self.version, __version__):
+            self.log.info("Config cache %s is from a different version of MPF.", self.filename)
+            return
+
+        self._entries = cache['entries']
+        self.log.info("Loaded config cache %s with %s entries", self.filename, len(self._entries))
+
+    def get_file_hash(self, filename):
+        """Return the content hash of a file or None if the file does not exist.
+
+        Args:
+            filename: Path of the file.
+        """
+        try:
+            return self._file_hashes[filename]
+        except KeyError:
+            pass
+
+        try:
+            with open(filename, 'rb') as f:
+                file_hash = self.get_hash(f.read())
+        except (FileNotFoundError, IsADirectoryError):
+            file_hash = None
+
+        self._file_hashes[filename] = file_hash
+        return file_hash
+
+    def get(self, kind, name):
+        """Return a copy of a cached entry or None if it is missing or stale.
+
+        Args:
+            kind: Type of the entry (e.g. "machine_config", "mode_config").
+            name: Name of the entry within its kind.
+        """
+        key = (kind, name)
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        file_hashes, data = entry
+        for filename, file_hash in file_hashes:
+            if self.get_file_hash(filename) != file_hash:
+                return None
+
+        try:
+            value = pickle.loads(data)
+        # pylint: disable-msg=broad-except
+        except Exception:   # pragma: no cover
+            return None
+
+        with self._lock:
+            self._used_entries.add(key)
+
+        return value
+
+    def set(self, kind, name, value, files=None):
+        """Add or replace an entry.
+
+        The value is pickled right away so later changes to it do not end up
+        in the cache.
+
+        Args:
+            kind: Type of the entry (e.g. "machine_config", "mode_config").
+            name: Name of the entry within its kind.
+            value: Value to cache. Has to be picklable.
+            files: Files the value was created from. The entry becomes stale
+                as soon as one of them changes, is removed or is created.
+        """
+        if not self._save:
+            return
+
+        try:
+            data = pickle.dumps(value, protocol=4)
+        # pylint: disable-msg=broad-except
+        except Exception:
+            self.log.debug("Cannot cache %s %s", kind, name)
+            return
+
+        file_hashes = tuple((filename, self.get_file_hash(filename)) for filename in files or [])
+
+        with self._lock:
+            self._entries[(kind, name)] = (file_hashes, data)
+            self._used_entries.add((kind, name))
+            self._dirty = True
+
+    def save(self):
+        """Write all entries which were used in this run to the cache file."""
+        with self._lock:
+            if not self._dirty:
+                return
+
+            entries = {key: self._entries[key] for key in self._used_entries}
+            self._dirty = False
+
+        temp_filename = '{}.{}.tmp'.format(self.filename, os.getpid())
+        try:
+            with open(temp_filename, 'wb') as f:
+                pickle.dump({'_version': (self.version, __version__), 'entries': entries}, f, protocol=4)
+            os.replace(temp_filename, self.filename)
+        except OSError as e:
+            self.log.warning("Could not write config cache %s: %s", self.filename, e)
+            return
+
+        self.log.info('Config cache written: %s', self.filename)
@@ -1,5 +1,6 @@
 """Base class used for things that "play" from the config files, such as WidgetPlayer, SlidePlayer, etc."""
 import abc
+from functools import partial
 
 
 class ConfigPlayer(object, metaclass=abc.ABCMeta):
@@ -212,6 +213,17 @@ class ConfigPlayer(object, metaclass=abc.ABCMeta):
 
     def config_play_callback(self, settings, priority=0, mode=None, **kwargs):
         """Callback for standalone player."""
+        self.config_play_action_callback(self.play, priority, mode, settings=settings, **kwargs)
+
+    def config_play_action_callback(self, play_action, priority=0, mode=None, **kwargs):
+        """Callback for standalone player which calls play_action with context and priority.
+
+        Args:
+            play_action: Callable which is called with context, priority and
+                kwargs (e.g. a bound action or play with settings).
+            priority: Priority of the event.
+            mode: Mode of the player section or None if it is machine wide.
+        """
         # called when a config_player event is posted
         if mode:
             if not mode.active:
@@ -227,7 +239,7 @@ class ConfigPlayer(object, metaclass=abc.ABCMeta):
         else:
             context = "_global"
 
-        self.play(settings=settings, context=context, priority=priority, **kwargs)
+        play_action(context=context, priority=priority, **kwargs)
 
     def show_play_callback(self, settings, priority, show_tokens, context):
         """Callback if used in a show."""
@@ -241,10 +253,35 @@ class ConfigPlayer(object, metaclass=abc.ABCMeta):
         self.play(settings=settings, priority=priority,
                   show_tokens=show_tokens, context=context)
 
+    def show_start_callback(self, context):
+        """Callback if a show uses this player for the first time.
+
+        Prepares the instance dict of the show so actions returned by
+        get_show_step_action can use it without checking.
+        """
+        if context not in self.instances:
+            self.instances[context] = dict()
+
+        if self.config_file_section not in self.instances[context]:
+            self.instances[context][self.config_file_section] = dict()
+
     def show_stop_callback(self, context):
         """Callback if show stops."""
         self.clear_context(context)
 
+    def get_show_step_action(self, settings):
+        """Return a callable which plays the settings of a show step.
+
+        The callable is called with context, priority and show_tokens. It is
+        created once per step so override this method to resolve devices and
+        parse settings ahead of time. The default plays the settings via
+        show_play_callback.
+
+        Args:
+            settings: Validated settings of this player in a show step.
+        """
+        return partial(self.show_play_callback, settings)
+
     @abc.abstractmethod
     def play(self, settings, context, priority=0, **kwargs):
         """Directly play player."""
@@ -16,10 +16,16 @@ class ConfigProcessor(object):
         pass
 
     @staticmethod
-    def load_config_file(filename, config_type, verify_version=True, halt_on_error=True):   # pragma: no cover
+    def load_config_file(filename, config_type, verify_version=True, halt_on_error=True,
+                         loaded_files=None):   # pragma: no cover
         """Load a config file."""
         # config_type is str 'machine' or 'mode', which specifies whether this
         # file being loaded is a machine config or a mode config file
+        # loaded_files is an optional list which collects the names of all
+        # files (including the ones pulled in via config:) for the config cache
+        if loaded_files is not None:
+            loaded_files.append(filename)
+
         config = FileManager.load(filename, verify_version, halt_on_error)
 
         if not ConfigValidator.config_spec:
@@ -45,7 +51,8 @@ class ConfigProcessor(object):
                     full_file = os.path.join(path, file)
                     config = Util.dict_merge(config,
                                              ConfigProcessor.load_config_file(
-                                                 full_file, config_type))
+                                                 full_file, config_type,
+                                                 loaded_files=loaded_files))
             return config
         except TypeError:
             return dict()
@@ -47,7 +47,8 @@ assets:
         priority: single|int|0
     images: # no image-specific config items
         __allow_others__:
-    shows:  # no show-specific config items
+    shows:
+        stream_window: single|int|64
         __allow_others__:
     sounds:
         __allow_others__:
@@ -295,6 +296,8 @@ fadecandy:
     dithering: single|bool|True
 jr:
     __valid_in__: machine
+    port: single|str|None
+    baud: single|int|9600
     debug: single|bool|False
 fast:
     __valid_in__: machine
@@ -307,9 +310,11 @@ fast:
     default_normal_debounce_open: single|ms|
     default_normal_debounce_close: single|ms|
     hardware_led_fade_time: single|ms|0
+    hardware_led_refresh_interval: single|ms|1s
     debug: single|bool|False
     net_buffer: single|int|10
     rgb_buffer: single|int|3
+    rgb_max_line_length: single|int|256
     dmd_buffer: single|int|3
 file_shows:
     __valid_in__: machine, mode                      # todo add to validator
@@ -411,6 +416,7 @@ led_settings:
     color_correction_profiles: single|dict|None
     default_color_correction_profile: single|str|None
     default_led_fade_ms: single|int|0
+    frame_engine: single|bool|False
 leds:
     __valid_in__: machine
     number: single|str|
@@ -546,6 +552,10 @@ opp:
     baud: single|int|115200
     debug: single|bool|False
     chains: dict|str:str|None
+    poll_active_interval: single|ms|1ms
+    poll_idle_interval: single|ms|10ms
+    poll_active_time: single|ms|500ms
+    poll_timeout: single|ms|100ms
 osc:
     __valid_in__: machine
     client_port: single|int|8000
@@ -567,6 +577,8 @@ p_roc:
     lamp_matrix_strobe_time: single|ms|100ms
     watchdog_time: single|ms|1s
     use_watchdog: single|bool|True
+    use_separate_thread: single|bool|True
+    event_poll_interval: single|ms|1ms
     dmd_timing_cycles: list|int|None
     dmd_update_interval: single|ms|33ms
     debug: single|bool|False
@@ -575,6 +587,8 @@ p3_roc:
     lamp_matrix_strobe_time: single|ms|100ms
     watchdog_time: single|ms|1s
     use_watchdog: single|bool|True
+    use_separate_thread: single|bool|True
+    event_poll_interval: single|ms|1ms
     debug: single|bool|False
 physical_dmd:
     __valid_in__: machine
@@ -606,6 +620,8 @@ physical_rgb_dmds:
     source_display: single|str|dmd
     only_send_changes: single|bool|False
     brightness: single|float|1.0
+    frame_encoding: single|enum(raw,row_delta)|raw
+    width: single|int|128
 playfields:
     __valid_in__: machine
     enable_ball_search: single|bool|None
@@ -47,8 +47,11 @@ class ConfigValidator(object):
             "machine": self._validate_type_machine,
         }
 
+        # spec hashes of sections which can be cached (None if not)
+        self._section_spec_hashes = dict()
+
         if not ConfigValidator.config_spec:
-            ConfigValidator.load_config_spec()
+            ConfigValidator.load_config_spec(config_cache=getattr(machine, 'config_cache', None))
 
     @classmethod
     def load_mode_config_spec(cls, mode_string, config_spec):
@@ -59,13 +62,22 @@ class ConfigValidator(object):
             cls.config_spec['_mode_settings'][mode_string] = YamlInterface.process(config_spec)
 
     @classmethod
-    def load_config_spec(cls, config_spec=None):
+    def load_config_spec(cls, config_spec=None, config_cache=None):
         """Load config specs."""
         if not config_spec:
             config_spec = mpf_config_spec
 
+        if config_cache:
+            spec_hash = config_cache.get_hash(config_spec)
+            cls.config_spec = config_cache.get('config_spec', spec_hash)
+            if cls.config_spec is not None:
+                return
+
         cls.config_spec = YamlInterface.process(config_spec)
 
+        if config_cache:
+            config_cache.set('config_spec', spec_hash, cls.config_spec)
+
     @classmethod
     def unload_config_spec(cls):
         """Unload specs."""
@@ -102,6 +114,76 @@ class ConfigValidator(object):
 
         return this_spec
 
+    def _get_section_spec_hash(self, config_spec, base_spec):
+        key = (config_spec, tuple(base_spec) if isinstance(base_spec, list) else base_spec)
+        try:
+            return self._section_spec_hashes[key]
+        except KeyError:
+            pass
+
+        this_spec = self._build_spec(config_spec, base_spec)
+        if self._is_cacheable_spec(this_spec):
+            spec_hash = self.machine.config_cache.get_hash(repr(this_spec))
+        else:
+            spec_hash = None
+
+        self._section_spec_hashes[key] = spec_hash
+        return spec_hash
+
+    def _is_cacheable_spec(self, spec):
+        """Return true if the validated output of the spec only depends on the config."""
+        if isinstance(spec, dict):
+            return all(self._is_cacheable_spec(value) for value in spec.values())
+
+        try:
+            validators = spec.split('|')[1]
+        except (AttributeError, IndexError):
+            # entries like "ignore"
+            return True
+
+        for validator in validators.split(':'):
+            validator = validator.split('(')[0]
+            if validator not in self.validator_list or validator in ("machine", "subconfig"):
+                return False
+
+        return True
+
+    @classmethod
+    def _is_plain_config(cls, config):
+        """Return true if the config only consists of types which can be keyed by their repr."""
+        if isinstance(config, dict):
+            return all(isinstance(key, str) and cls._is_plain_config(value) for key, value in config.items())
+        elif isinstance(config, (list, tuple)):
+            return all(cls._is_plain_config(value) for value in config)
+        else:
+            return config is None or isinstance(config, (str, int, float))
+
+    def validate_section(self, config_spec, source, section_name=None, base_spec=None):
+        """Validate a whole config section (e.g. a device) and cache the validated output.
+
+        Behaves like validate_config(). The section is looked up in the config
+        cache first and validated output is stored there when the spec only
+        uses validators which do not depend on the machine state.
+        """
+        config_cache = getattr(self.machine, 'config_cache', None)
+        if not config_cache or not isinstance(source, dict) or not self._is_plain_config(source):
+            return self.validate_config(config_spec, source, section_name, base_spec)
+
+        spec_hash = self._get_section_spec_hash(config_spec, base_spec)
+        if not spec_hash:
+            return self.validate_config(config_spec, source, section_name, base_spec)
+
+        cache_name = config_cache.get_hash(repr((spec_hash, type(source).__name__, source)))
+        validated_config = config_cache.get('validated_section', cache_name)
+        if validated_config is not None:
+            # validation only adds or replaces keys in source
+            source.update(validated_config)
+            return source
+
+        validated_config = self.validate_config(config_spec, source, section_name, base_spec)
+        config_cache.set('validated_section', cache_name, validated_config)
+        return validated_config
+
     # pylint: disable-msg=too-many-arguments
     def validate_config(self, config_spec, source, section_name=None,
                         base_spec=None, add_missing_keys=True):
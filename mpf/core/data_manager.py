@@ -4,15 +4,36 @@ import copy
 import logging
 import os
 import errno
-import _thread
+import pickle
+import queue
+import struct
 import threading
+import zlib
 
 from mpf.core.file_manager import FileManager
+from mpf.core.utility_functions import Util
 
 
 class DataManager(object):
 
-    """Handles key value data loading and saving for the machine."""
+    """Handles key value data loading and saving for the machine.
+
+    The data is stored in two files. The YAML file (mpf:paths:<name>) holds a
+    snapshot of all data and stays readable (and editable) for humans. Every
+    change after the snapshot is appended as a per key record to a journal
+    next to it (<file>.journal). Once the journal grows beyond
+    mpf:data_manager_compact_records records (and on shutdown) it is compacted
+    into a new snapshot.
+
+    Changes are coalesced on the main thread for
+    mpf:data_manager_write_window. Only keys which changed are pickled and
+    handed to the writing thread which does the disk IO. Journal appends and
+    snapshots are fsync'd and snapshots are atomically replaced, so a power
+    cut at any point leaves either the old or the new value of a key on disk.
+    A record torn by a power cut is detected by its checksum and ignored.
+    """
+
+    _record_header = struct.Struct('<II')
 
     def __init__(self, machine, name):
         """Initialise data manger.
@@ -31,15 +52,34 @@ class DataManager(object):
         self.name = name
         self.filename = os.path.join(self.machine.machine_path,
                                      self.machine.config['mpf']['paths'][name])
+        self.journal_filename = self.filename + '.journal'
 
         self.log = logging.getLogger('DataInterface')
 
         self.data = dict()
-        self._dirty = threading.Event()
+        self._write_window_ms = Util.string_to_ms(self.machine.config['mpf']['data_manager_write_window'])
+        self._compact_records = self.machine.config['mpf']['data_manager_compact_records']
+
+        # pickled values of all keys as they were last handed to the writer
+        self._records = dict()
+        self._changed_keys = set()
+        self._check_all_keys = False
+        self._write_scheduled = False
+
+        # owned by the writing thread
+        self._write_queue = queue.Queue()
+        self._disk_records = dict()
+        self._journal_records = 0
+        self._journal_size = 0
 
         self._setup_file()
 
-        _thread.start_new_thread(self._writing_thread, ())
+        self._writing_thread = threading.Thread(target=self._run_writing_thread,
+                                                name="DataManager_" + name)
+        self._writing_thread.daemon = True
+        self._writing_thread.start()
+
+        self.machine.events.add_handler('shutdown', self._shutdown)
 
     def _setup_file(self):
         self._make_sure_path_exists(os.path.dirname(self.filename))
@@ -63,6 +103,60 @@ class DataManager(object):
             self.log.debug("Didn't find the %s file. No prob. We'll create "
                            "it when we save.", self.name)
 
+        if not isinstance(self.data, dict):
+            self.data = dict()
+
+        for key, record in self._read_journal():
+            if record is None:
+                self.data.pop(key, None)
+            else:
+                self.data[key] = pickle.loads(record)
+            self._journal_records += 1
+
+        self._truncate_journal()
+
+        for key, value in self.data.items():
+            self._records[key] = pickle.dumps(value, protocol=4)
+
+        self._disk_records = dict(self._records)
+
+    def _read_journal(self):
+        self._journal_size = 0
+        try:
+            with open(self.journal_filename, 'rb') as f:
+                journal = f.read()
+        except FileNotFoundError:
+            return
+
+        self._journal_size = len(journal)
+        position = 0
+        while position < len(journal):
+            if position + self._record_header.size > len(journal):
+                break
+            length, checksum = self._record_header.unpack_from(journal, position)
+            entry = journal[position + self._record_header.size:position + self._record_header.size + length]
+            if len(entry) != length or zlib.crc32(entry) != checksum:
+                break
+
+            yield pickle.loads(entry)
+            position += self._record_header.size + length
+
+        if position < len(journal):
+            self.log.warning("Ignoring incomplete record at the end of %s", self.journal_filename)
+            self._journal_size = position
+
+    def _truncate_journal(self):
+        """Cut off an incomplete record so that new records are appended after the last good one."""
+        try:
+            if os.path.getsize(self.journal_filename) <= self._journal_size:
+                return
+            with open(self.journal_filename, 'rb+') as f:
+                f.truncate(self._journal_size)
+                f.flush()
+                os.fsync(f.fileno())
+        except FileNotFoundError:
+            return
+
     def get_data(self, section=None):
         """Return the value of this DataManager's data.
 
@@ -103,17 +197,11 @@ class DataManager(object):
         if data:
             self.data = data
 
-        if delay_secs:
-            self.machine.delay.add(callback=self._delayed_save_callback,
-                                   ms=delay_secs * 1000)
-        else:
-            self._dirty.set()
-
-    def _delayed_save_callback(self):
-        self._dirty.set()
+        self._check_all_keys = True
+        self._schedule_write(delay_secs)
 
     def save_key(self, key, value, delay_secs=0):
-        """Update an individual key and then write the entire dictionary to disk.
+        """Update an individual key and then write it to disk.
 
         Args:
             key: String name of the key to add/update.
@@ -129,23 +217,122 @@ class DataManager(object):
             self.data = dict()
             self.data[key] = value
 
-        self.save_all(delay_secs=delay_secs)
+        self._changed_keys.add(key)
+        self._schedule_write(delay_secs)
 
     def remove_key(self, key):
         """Remove key by name."""
         try:
             del self.data[key]
-            self.save_all()
+            self._changed_keys.add(key)
+            self._schedule_write(0)
         except KeyError:
             pass
 
-    def _writing_thread(self):  # pragma: no cover
-        while not self.machine.thread_stopper.is_set():
-            if not self._dirty.wait(1):
+    def _schedule_write(self, delay_secs):
+        # all changes until the write happens end up in the same batch
+        if self._write_scheduled:
+            return
+
+        self._write_scheduled = True
+        self.machine.delay.add(callback=self.write_changes,
+                               ms=max(delay_secs * 1000, self._write_window_ms))
+
+    def write_changes(self):
+        """Pass all keys which changed since the last write to the writing thread."""
+        self._write_scheduled = False
+
+        if self._check_all_keys:
+            keys = set(self.data.keys()) | set(self._records.keys())
+        else:
+            keys = self._changed_keys
+
+        self._check_all_keys = False
+        self._changed_keys = set()
+
+        changes = []
+        for key in keys:
+            if key in self.data:
+                record = pickle.dumps(self.data[key], protocol=4)
+            else:
+                record = None
+
+            if self._records.get(key) == record:
                 continue
-            self._dirty.clear()
 
-            data = copy.deepcopy(self.data)
-            self.log.debug("Writing %s to: %s", self.name, self.filename)
-            # save data
-            FileManager.save(self.filename, data)
+            if record is None:
+                del self._records[key]
+            else:
+                self._records[key] = record
+
+            changes.append((key, record))
+
+        if changes:
+            self.log.debug("Writing %s changed key(s) of %s", len(changes), self.name)
+            self._write_queue.put(changes)
+
+    def _shutdown(self, **kwargs):
+        del kwargs
+        # write pending changes and wait until they are on disk
+        self.write_changes()
+        self._write_queue.put(None)
+        self._writing_thread.join(5)
+
+    def _run_writing_thread(self):  # pragma: no cover
+        # drain the queue until the sentinel from _shutdown so no changes are
+        # lost. the thread is a daemon and does not block the exit otherwise
+        while True:
+            changes = self._write_queue.get()
+            if changes is None:
+                break
+
+            self._append_to_journal(changes)
+
+            if self._journal_records > self._compact_records:
+                self._compact()
+
+            self._write_queue.task_done()
+
+        if self._journal_records:
+            self._compact()
+
+    def _append_to_journal(self, changes):
+        frames = []
+        for key, record in changes:
+            entry = pickle.dumps((key, record), protocol=4)
+            frames.append(self._record_header.pack(len(entry), zlib.crc32(entry)))
+            frames.append(entry)
+
+            if record is None:
+                self._disk_records.pop(key, None)
+            else:
+                self._disk_records[key] = record
+
+        with open(self.journal_filename, 'ab') as f:
+            f.write(b''.join(frames))
+            f.flush()
+            os.fsync(f.fileno())
+
+        self._journal_records += len(changes)
+
+    def _compact(self):
+        """Write a new snapshot and empty the journal."""
+        data = {key: pickle.loads(record) for key, record in self._disk_records.items()}
+        self.log.debug("Writing %s to: %s", self.name, self.filename)
+
+        # the journal is only emptied after the snapshot is on disk. if power
+        # is lost in between the journal is replayed on top of the snapshot.
+        FileManager.save(self.filename, data, sync=True)
+
+        with open(self.journal_filename, 'wb') as f:
+            os.fsync(f.fileno())
+
+        self._journal_records = 0
+
+    def export_yaml(self, filename):
+        """Export the current data to a YAML file.
+
+        Args:
+            filename: Name of the file to write.
+        """
+        FileManager.save(filename, copy.deepcopy(self.data))
@@ -74,7 +74,7 @@ class Device(object, metaclass=abc.ABCMeta):
         Returns: Validated config
         """
         del is_mode_config
-        self.machine.config_validator.validate_config(
+        self.machine.config_validator.validate_section(
             self.config_section, config, self.name, "device")
         return config
 
@@ -92,6 +92,9 @@ class Device(object, metaclass=abc.ABCMeta):
         if self.config['debug']:
             self.enable_debugging()
             self.log.debug("Configuring device with settings: '%s'", config)
+        elif self.machine.is_trace_enabled(self.collection):
+            self.log.setLevel(logging.DEBUG)
+            self.enable_debugging()
 
     def __repr__(self):
         """Return string representation."""
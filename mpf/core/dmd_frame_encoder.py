@@ -0,0 +1,98 @@
+"""Encoders which reduce the bandwidth needed to send RGB DMD frames."""
+import struct
+
+FULL_FRAME = 0x01
+"""Full frame without sequence number (raw protocol)."""
+
+DELTA_FRAME = 0x02
+"""Changed rows against a previous frame: base sequence, sequence, row count, rows (index + data)."""
+
+KEY_FRAME = 0x03
+"""Full frame with sequence number: sequence, frame."""
+
+RESYNC_REQUEST = b'R'
+"""Sent by the DMD when it received a delta against a frame which it does not show."""
+
+
+class RowDeltaEncoder(object):
+
+    """Encode frames as the rows which changed since the last sent frame.
+
+    Every frame gets a sequence number. A delta frame names the sequence
+    number of the frame it is based on and the DMD discards deltas against
+    any other frame and answers with RESYNC_REQUEST. Key frames are sent for
+    the first frame, after reset(), every keyframe_interval frames and
+    whenever the delta would not be smaller than the full frame.
+    """
+
+    _delta_header = struct.Struct('BBBB')
+    _key_frame_header = struct.Struct('BB')
+
+    def __init__(self, width, keyframe_interval=60):
+        """Initialise encoder.
+
+        Args:
+            width: Number of pixels per row.
+            keyframe_interval: Maximum number of delta frames between two key
+                frames.
+        """
+        self.row_length = width * 3
+        self.keyframe_interval = keyframe_interval
+
+        self.key_frames = 0
+        self.delta_frames = 0
+        self.bytes_encoded = 0
+
+        self._last_frame = None
+        self._sequence = 0
+        self._frames_since_key_frame = 0
+
+    def reset(self):
+        """Send a key frame next (e.g. after the DMD lost synchronisation)."""
+        self._last_frame = None
+
+    def encode(self, frame):
+        """Return the message which updates the DMD to frame.
+
+        Args:
+            frame: bytes of the frame. Three bytes per pixel.
+        """
+        base_sequence = self._sequence
+        self._sequence = (self._sequence + 1) & 0xFF
+
+        message = None
+        if (self._last_frame is not None and len(self._last_frame) == len(frame) and
+                self._frames_since_key_frame < self.keyframe_interval):
+            message = self._encode_delta(frame, base_sequence)
+
+        if message is None:
+            message = self._key_frame_header.pack(KEY_FRAME, self._sequence) + frame
+            self._frames_since_key_frame = 0
+            self.key_frames += 1
+        else:
+            self._frames_since_key_frame += 1
+            self.delta_frames += 1
+
+        self._last_frame = frame
+        self.bytes_encoded += len(message)
+        return message
+
+    def _encode_delta(self, frame, base_sequence):
+        """Return a delta message or None if a key frame is not larger."""
+        row_length = self.row_length
+        if len(frame) > row_length * 256:
+            return None
+
+        last_frame = self._last_frame
+        rows = []
+        for row, start in enumerate(range(0, len(frame), row_length)):
+            end = start + row_length
+            if frame[start:end] != last_frame[start:end]:
+                rows.append(bytes((row,)))
+                rows.append(frame[start:end])
+
+        row_count = len(rows) // 2
+        if row_count > 255 or row_count * (row_length + 1) + 2 >= len(frame):
+            return None
+
+        return self._delta_header.pack(DELTA_FRAME, base_sequence, self._sequence, row_count) + b''.join(rows)
@@ -0,0 +1,136 @@
+"""Output stage which sends frames to a DMD without queueing stale frames."""
+
+
+class DmdOutputStage(object):
+
+    """Single-slot latest-frame buffer in front of a DMD platform device.
+
+    Frames are sent right away when the DMD is idle and the frame rate
+    allows it. Otherwise the frame waits in the slot and is replaced by every
+    newer frame, so a source which is faster than the link never builds up
+    latency. Frames which equal the last sent frame are not sent again.
+
+    With an encoder (e.g. RowDeltaEncoder) frames are passed to
+    update_encoded() of the hardware device instead of update(). A key frame
+    is sent whenever the device reports that it lost synchronisation. While
+    no new frames are sent the device is checked every resync_check_interval
+    and the last frame is sent again as key frame when it lost
+    synchronisation. Otherwise a static screen would stay corrupted.
+
+    Attributes:
+        sent: Number of frames which were sent to the hardware.
+        dropped: Number of frames which were replaced by a newer frame before
+            they could be sent.
+        skipped: Number of frames which were identical to the last sent frame.
+    """
+
+    busy_retry_interval = .001
+    """Seconds after which a busy DMD is checked again."""
+
+    resync_check_interval = .1
+    """Seconds after which an idle DMD with an encoder is checked for lost synchronisation."""
+
+    def __init__(self, machine, hw_device, fps, encoder=None):
+        """Initialise output stage.
+
+        Args:
+            machine: MachineController which is used
+            hw_device: DmdPlatformInterface which receives the frames.
+            fps: Maximum number of frames per second. 0 for no limit.
+            encoder: Optional frame encoder.
+        """
+        self.machine = machine
+        self.hw_device = hw_device
+        self.encoder = encoder
+        self.interval = 1 / fps if fps else 0
+
+        self.sent = 0
+        self.dropped = 0
+        self.skipped = 0
+
+        self._pending = None
+        self._last_frame = None
+        self._next_send_time = 0
+        self._send_scheduled = False
+        self._resync_check_scheduled = False
+
+    @property
+    def queued(self):
+        """Return the number of frames which wait to be sent (0 or 1)."""
+        return 0 if self._pending is None else 1
+
+    def get_stats(self):
+        """Return a dict with all counters."""
+        return {"sent": self.sent, "dropped": self.dropped, "skipped": self.skipped, "queued": self.queued}
+
+    def put(self, frame):
+        """Send a frame as soon as possible.
+
+        Args:
+            frame: bytes of the frame
+        """
+        if self._pending is not None:
+            # the waiting frame is stale now
+            self.dropped += 1
+            self._pending = None
+
+        if frame == self._last_frame:
+            self.skipped += 1
+            return
+
+        self._pending = frame
+        self._send()
+
+    def _send(self):
+        if self._pending is None or self._send_scheduled:
+            return
+
+        now = self.machine.clock.get_time()
+        if now < self._next_send_time:
+            self._schedule_send(self._next_send_time)
+            return
+
+        if self.hw_device.is_busy():
+            self._schedule_send(now + self.busy_retry_interval)
+            return
+
+        frame = self._pending
+        self._pending = None
+        self._last_frame = frame
+        self._next_send_time = now + self.interval
+        self.sent += 1
+
+        if not self.encoder:
+            self.hw_device.update(frame)
+            return
+
+        if self.hw_device.is_desynced():
+            self.encoder.reset()
+        self.hw_device.update_encoded(self.encoder.encode(frame))
+        self._schedule_resync_check()
+
+    def _schedule_send(self, deadline):
+        self._send_scheduled = True
+        self.machine.clock.schedule_at(deadline, self._send_scheduled_frame)
+
+    def _send_scheduled_frame(self):
+        self._send_scheduled = False
+        self._send()
+
+    def _schedule_resync_check(self):
+        if self._resync_check_scheduled:
+            return
+
+        self._resync_check_scheduled = True
+        self.machine.clock.schedule_at(self.machine.clock.get_time() + self.resync_check_interval,
+                                       self._check_resync)
+
+    def _check_resync(self):
+        """Send the last frame again as key frame if the idle DMD lost synchronisation."""
+        self._resync_check_scheduled = False
+        if self._pending is None and not self._send_scheduled and self.hw_device.is_desynced():
+            self.encoder.reset()
+            self._pending = self._last_frame
+            self._send()
+
+        self._schedule_resync_check()
@@ -21,10 +21,27 @@ class EventManager(object):
         self.log = logging.getLogger("Events")
         self.machine = machine
         self.registered_handlers = {}   # type: {str: [RegisteredHandler]}
+        self._dispatch_tables = {}      # type: {str: (RegisteredHandler)}
         self.event_queue = deque([])
         self.callback_queue = deque([])
+        self.handlers_version = 0
+        # Incremented whenever a handler is added or removed. Used by other
+        # components to invalidate caches which depend on registered handlers.
 
-        self.debug = True
+        self.debug = False
+        self.update_log_level()
+
+    def update_log_level(self):
+        """Resolve whether event processing is logged.
+
+        This is done once on startup so posting and processing events does not
+        create any debug strings when debug logging is disabled. Call it again
+        after changing the level of the "Events" logger at runtime.
+        """
+        if self.machine.is_trace_enabled("events"):
+            self.log.setLevel(logging.DEBUG)
+
+        self.debug = self.log.isEnabledFor(logging.DEBUG)
 
     def add_handler(self, event, handler, priority=1, **kwargs):
         """Register an event handler to respond to an event.
@@ -78,7 +95,16 @@ class EventManager(object):
         # An event 'handler' in our case is a tuple with 4 elements:
         # the handler method, priority, dict of kwargs, & uuid key
 
-        self.registered_handlers[event].append(RegisteredHandler(handler, priority, kwargs, key))
+        # The list is kept sorted by priority (highest first) so we don't have
+        # to do that with each event post. Insert the new handler behind all
+        # handlers with the same or a higher priority.
+        handlers = self.registered_handlers[event]
+        index = len(handlers)
+        while index and handlers[index - 1].priority < priority:
+            index -= 1
+        handlers.insert(index, RegisteredHandler(handler, priority, kwargs, key))
+        self._invalidate_dispatch_table(event)
+
         if self.debug:
             try:
                 self.log.debug("Registered %s as a handler for '%s', priority: %s, "
@@ -87,13 +113,28 @@ class EventManager(object):
             except IndexError:
                 pass
 
-        # Sort the handlers for this event based on priority. We do it now
-        # so the list is pre-sorted so we don't have to do that with each
-        # event post.
-        self.registered_handlers[event].sort(key=lambda x: x.priority, reverse=True)
-
         return EventHandlerKey(key, event)
 
+    def _invalidate_dispatch_table(self, event):
+        """Drop the compiled handlers of an event after its handlers changed."""
+        self._dispatch_tables.pop(event, None)
+        self.handlers_version += 1
+
+    def _get_dispatch_table(self, event):
+        """Return a tuple with all handlers for an event ordered by priority.
+
+        The tuple is built once and reused for every post until a handler is
+        added or removed for this event. Since it is immutable, handlers which
+        are added or removed while the event is processed do not change the
+        handlers which are called for the current post.
+        """
+        try:
+            return self._dispatch_tables[event]
+        except KeyError:
+            handlers = tuple(self.registered_handlers.get(event, ()))
+            self._dispatch_tables[event] = handlers
+            return handlers
+
     def replace_handler(self, event, handler, priority=1, **kwargs):
         """Check to see if a handler (optionally with kwargs) is registered for an event and replaces it if so.
 
@@ -130,6 +171,7 @@ class EventManager(object):
                 for rh in self.registered_handlers[event][:]:
                     if rh[0] == handler:
                         self.registered_handlers[event].remove(rh)
+            self._invalidate_dispatch_table(event)
 
         self.add_handler(event, handler, priority, **kwargs)
 
@@ -144,6 +186,7 @@ class EventManager(object):
             for handler_tup in handler_list[:]:  # copy via slice
                 if handler_tup[0] == method:
                     handler_list.remove(handler_tup)
+                    self._invalidate_dispatch_table(event)
                     if self.debug:
                         self.log.debug("Removing method %s from event %s", (str(method).split(' '))[2], event)
                     events_to_delete_if_empty.append(event)
@@ -171,6 +214,7 @@ class EventManager(object):
             for handler_tup in self.registered_handlers[event][:]:
                 if handler_tup[0] == handler:
                     self.registered_handlers[event].remove(handler_tup)
+                    self._invalidate_dispatch_table(event)
                     if self.debug:
                         self.log.debug("Removing method %s from event %s", (str(handler).split(' '))[2], event)
                     events_to_delete_if_empty.append(event)
@@ -190,6 +234,7 @@ class EventManager(object):
         for handler_tup in self.registered_handlers[key.event][:]:  # copy via slice
             if handler_tup.key == key.key:
                 self.registered_handlers[key.event].remove(handler_tup)
+                self._invalidate_dispatch_table(key.event)
                 if self.debug:
                     self.log.debug("Removing method %s from event %s", (str(handler_tup[0]).split(' '))[2], key.event)
                 events_to_delete_if_empty.append(key.event)
@@ -410,19 +455,25 @@ class EventManager(object):
                            " Args: %s", event, ev_type, callback, kwargs)
 
         # Now let's call the handlers one-by-one, including any kwargs
-        if event in self.registered_handlers:
+        handlers = self._get_dispatch_table(event)
+        if handlers:
 
             if ev_type == 'queue' and callback:
                 queue = QueuedEvent(callback, **kwargs)
                 kwargs['queue'] = queue
 
-            for handler in self.registered_handlers[event][:]:
-                # use slice above so we don't process new handlers that came
-                # in while we were processing previous handlers
+            for handler in handlers:
+                # the dispatch table is immutable so we don't process new
+                # handlers that came in while we were processing previous
+                # handlers
 
                 # merge the post's kwargs with the registered handler's kwargs
                 # in case of conflict, posts kwargs will win
-                merged_kwargs = dict(list(handler.kwargs.items()) + list(kwargs.items()))
+                if handler.kwargs:
+                    merged_kwargs = handler.kwargs.copy()
+                    merged_kwargs.update(kwargs)
+                else:
+                    merged_kwargs = kwargs
 
                 # log if debug is enabled and this event is not the timer tick
                 if self.debug:
@@ -517,7 +568,7 @@ class QueuedEvent(object):
         """Initialise QueueEvent."""
         self.log = logging.getLogger("Queue")
 
-        self.debug = True
+        self.debug = self.log.isEnabledFor(logging.DEBUG)
 
         if self.debug:
             self.log.debug("Creating an event queue. Callback: %s Args: %s",
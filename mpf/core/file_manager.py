@@ -167,8 +167,18 @@ class FileManager(object):
         return config
 
     @staticmethod
-    def save(filename, data, **kwargs):
-        """Save data to file."""
+    def save(filename, data, sync=False, **kwargs):
+        """Save data to file.
+
+        Args:
+            filename: Name of the file. The extension selects the file interface.
+            data: Data to save.
+            sync: If True the file is fsync'd before it replaces the old file so
+                the old or the new content survive a power loss.
+        """
+        if not FileManager.initialized:
+            FileManager.init()
+
         ext = os.path.splitext(filename)[1]
 
         # save to temp file and move afterwards. prevents broken files
@@ -180,5 +190,17 @@ class FileManager(object):
         except KeyError:
             raise AssertionError("No config file processor available for file type {}".format(ext))
 
+        if sync:
+            with open(temp_file, 'rb+') as f:
+                os.fsync(f.fileno())
+
         # move temp file
         os.replace(temp_file, filename)
+
+        if sync and hasattr(os, 'O_DIRECTORY'):
+            # make the rename itself durable
+            directory = os.open(os.path.dirname(filename) or '.', os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(directory)
+            finally:
+                os.close(directory)
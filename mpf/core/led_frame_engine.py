@@ -0,0 +1,217 @@
+"""Vectorised frame engine which calculates the hardware colors of all LEDs at once."""
+try:
+    import numpy
+    numpy_imported = True
+except ImportError:     # pragma: no cover
+    numpy_imported = False
+    numpy = None
+
+from mpf.core.rgb_color import RGBColor
+
+# position of every channel type in the extended color table (r, g, b, w, -, +)
+CHANNEL_POSITIONS = {'r': 0, 'g': 1, 'b': 2, 'w': 3, '-': 4, '+': 5}
+
+
+class LedFrameEngine(object):
+
+    """Calculates fades, brightness, color correction and channel order for all LEDs in one pass.
+
+    The current, start and destination color of every LED are kept in
+    contiguous arrays which are indexed by ``led.frame_index``. The stack of
+    each LED stays the authority on what color it should show. Entries are
+    copied into the arrays when an LED changes and fade results are written
+    back to the stack so ``Led.get_color()`` and the stack behave the same as
+    without the engine.
+
+    The hardware channels of all LEDs end up in ``buffer`` (one byte per
+    channel in the order of the LEDs). Every platform driver gets a
+    memoryview of its slice which it can copy directly (e.g. OPC) or turn
+    into a list for color().
+    """
+
+    def __init__(self, machine):
+        """Initialise frame engine.
+
+        Args:
+            machine: MachineController which is used
+        """
+        if not numpy_imported:
+            raise AssertionError("The LED frame engine requires numpy.")
+
+        self.machine = machine
+        self.leds = []
+        self.buffer = numpy.zeros(0, numpy.uint8)
+
+        self._dirty = True
+        self._color = numpy.zeros((0, 3), numpy.int16)
+        self._start_color = numpy.zeros((0, 3), numpy.int16)
+        self._dest_color = numpy.zeros((0, 3), numpy.int16)
+        self._start_time = numpy.zeros(0, numpy.float64)
+        self._dest_time = numpy.zeros(0, numpy.float64)
+        self._channels = numpy.zeros((0, 6), numpy.uint8)
+
+        self._luts = None
+        self._profile_index = None
+        self._use_brightness = None
+        self._gather = None
+        self._offsets = None
+        self._channel_range = numpy.arange(3)
+
+    def add_led(self, led):
+        """Add an LED to the engine.
+
+        Args:
+            led: The Led which will be updated by this engine.
+        """
+        led.frame_index = len(self.leds)
+        self.leds.append(led)
+        self._dirty = True
+
+    def invalidate(self):
+        """Rebuild the lookup tables before the next frame (e.g. after a color correction profile changed)."""
+        self._dirty = True
+
+    @staticmethod
+    def _grow(array, shape):
+        new_array = numpy.zeros(shape, array.dtype)
+        new_array[:len(array)] = array
+        return new_array
+
+    def _build(self):
+        count = len(self.leds)
+        self._color = self._grow(self._color, (count, 3))
+        self._start_color = self._grow(self._start_color, (count, 3))
+        self._dest_color = self._grow(self._dest_color, (count, 3))
+        self._start_time = self._grow(self._start_time, count)
+        self._dest_time = self._grow(self._dest_time, count)
+        self._channels = self._grow(self._channels, (count, 6))
+        # always off and always on channels never change
+        self._channels[:, 4] = 0
+        self._channels[:, 5] = 255
+
+        # index 0 is the linear profile which is used by LEDs without profile
+        luts = [[list(range(256))] * 3]
+        profiles = {}
+        profile_index = []
+        gather = []
+        offsets = [0]
+        for index, led in enumerate(self.leds):
+            profile = led.get_color_correction_profile()
+            if profile is None:
+                profile_index.append(0)
+            else:
+                if id(profile) not in profiles:
+                    profiles[id(profile)] = len(luts)
+                    luts.append(profile.lookup_table)
+                profile_index.append(profiles[id(profile)])
+
+            for color_name in led.config['type']:
+                if color_name not in CHANNEL_POSITIONS:
+                    raise AssertionError("Invalid element {} in type {} of led {}".format(
+                        color_name, led.config['type'], led.name))
+                gather.append(index * 6 + CHANNEL_POSITIONS[color_name])
+
+            offsets.append(len(gather))
+
+        self._luts = numpy.array(luts, numpy.uint8)
+        self._profile_index = numpy.array(profile_index, numpy.intp)
+        # lights as channels are corrected on their own
+        self._use_brightness = numpy.array([bool(led.platform) for led in self.leds], bool)
+        self._gather = numpy.array(gather, numpy.intp)
+        self._offsets = offsets
+        self.buffer = self._channels.ravel()[self._gather]
+        self._dirty = False
+
+    def _load_stack_entry(self, led):
+        if not led.stack:
+            led.color('off')
+
+        entry = led.stack[0]
+        index = led.frame_index
+        self._color[index] = entry['color'].rgb
+        self._start_color[index] = entry['start_color'].rgb
+        self._dest_color[index] = entry['dest_color'].rgb
+        self._start_time[index] = entry['start_time']
+        self._dest_time[index] = entry['dest_time']
+
+    def _calculate_fades(self, indices):
+        """Blend all running fades and return the LEDs which changed."""
+        indices = indices[self._dest_time[indices] != 0]
+        if not len(indices):
+            return []
+
+        start_time = self._start_time[indices]
+        duration = self._dest_time[indices] - start_time
+        ratio = numpy.ones(len(indices))
+        numpy.divide(self.machine.clock.get_time() - start_time, duration, out=ratio, where=duration != 0)
+
+        start_color = self._start_color[indices]
+        blended = start_color + ((self._dest_color[indices] - start_color) * ratio[:, None]).astype(numpy.int16)
+        done = ratio >= 1.0
+        blended[done] = self._dest_color[indices[done]]
+        self._color[indices] = blended
+
+        changed = []
+        for index, fade_done in zip(indices.tolist(), done.tolist()):
+            led = self.leds[index]
+            color_settings = led.stack[0]
+            if fade_done:
+                led._end_fade()     # pylint: disable-msg=protected-access
+                color_settings['color'] = color_settings['dest_color']
+            else:
+                color_settings['color'] = RGBColor(self._color[index].tolist())
+            changed.append(led)
+
+        return changed
+
+    def _correct_colors(self, indices):
+        color = self._color[indices]
+        factor = self.machine.get_machine_var("brightness")
+        if factor is not None:
+            use_brightness = self._use_brightness[indices]
+            color[use_brightness] = (color[use_brightness] * factor).astype(numpy.int16)
+
+        numpy.clip(color, 0, 255, out=color)
+        corrected = self._luts[self._profile_index[indices][:, None], self._channel_range, color]
+
+        channels = self._channels[indices]
+        channels[:, :3] = corrected
+        channels[:, 3] = corrected.min(axis=1)
+        self._channels[indices] = channels
+        self.buffer = self._channels.ravel()[self._gather]
+        return corrected
+
+    def update(self, leds_to_fade, leds_to_update):
+        """Calculate the next frame and write all changed LEDs to their hardware drivers.
+
+        Args:
+            leds_to_fade: LEDs with a running fade at the start of this frame.
+            leds_to_update: LEDs which changed since the last frame.
+        """
+        if self._dirty:
+            self._build()
+
+        fading = numpy.array([led.frame_index for led in leds_to_fade if led.fade_in_progress], numpy.intp)
+
+        for led in leds_to_update:
+            self._load_stack_entry(led)
+
+        changed = set(leds_to_update)
+        changed.update(self._calculate_fades(fading))
+
+        leds = [led for led in changed if led.update_fade_state()]
+        if not leds:
+            return
+
+        indices = numpy.array([led.frame_index for led in leds], numpy.intp)
+        corrected = self._correct_colors(indices).tolist()
+        color = self._color[indices].tolist()
+        buffer = memoryview(self.buffer)
+        offsets = self._offsets
+
+        for i, led in enumerate(leds):
+            index = led.frame_index
+            # pylint: disable-msg=protected-access
+            led._color = color[i]
+            led._corrected_color = corrected[i]
+            led._write_buffer_to_hw_driver(buffer[offsets[index]:offsets[index + 1]])
@@ -1,10 +1,8 @@
 """Contains the MachineController base class."""
-import errno
 import hashlib
 import importlib
 import logging
 import os
-import pickle
 import tempfile
 
 import queue
@@ -16,6 +14,7 @@ from pkg_resources import iter_entry_points
 from mpf._version import __version__
 from mpf.core.case_insensitive_dict import CaseInsensitiveDict
 from mpf.core.clock import ClockBase
+from mpf.core.config_cache import ConfigCache
 from mpf.core.config_processor import ConfigProcessor
 from mpf.core.config_validator import ConfigValidator
 from mpf.core.data_manager import DataManager
@@ -94,6 +93,7 @@ class MachineController(object):
         self.machine_config = None
         self._set_machine_path()
 
+        self.config_cache = self._load_config_cache()
         self.config_validator = ConfigValidator(self)
 
         self._load_config()
@@ -124,6 +124,7 @@ class MachineController(object):
         self._run_init_phases()
 
         ConfigValidator.unload_config_spec()
+        self.config_cache.save()
 
         self.clear_boot_hold('init')
 
@@ -208,7 +209,7 @@ class MachineController(object):
         if section not in self.config:
             self.config[section] = dict()
 
-        self.config[section] = self.config_validator.validate_config(
+        self.config[section] = self.config_validator.validate_section(
             section, self.config[section], section)
 
     def _register_system_events(self):
@@ -286,34 +287,26 @@ class MachineController(object):
         result = os.path.join(cache_dir, path_hash)
         return result
 
-    def _load_config(self):     # pragma: no cover
-        if self.options['no_load_cache']:
-            load_from_cache = False
-        else:
-            try:
-                if self._get_latest_config_mod_time() > os.path.getmtime(self._get_mpfcache_file_name()):
-                    load_from_cache = False  # config is newer
-                else:
-                    load_from_cache = True  # cache is newer
+    def _load_config_cache(self):
+        return ConfigCache(self._get_mpfcache_file_name(),
+                           load=not self.options['no_load_cache'],
+                           save=self.options['create_config_cache'])
 
-            except OSError as exception:
-                if exception.errno != errno.ENOENT:
-                    raise  # some unknown error?
-                else:
-                    load_from_cache = False  # cache file doesn't exist
-
-        config_loaded = False
-        if load_from_cache:
-            config_loaded = self._load_config_from_cache()
+    def _load_config(self):     # pragma: no cover
+        self.config = self.config_cache.get('machine_config', tuple(self.options['configfile']))
 
-        if not config_loaded:
+        if self.config is None:
             self._load_config_from_files()
+        else:
+            self.log.info("Loaded cached config: %s", self.config_cache.filename)
+
+        self.machine_config = self.config
 
     def _load_config_from_files(self):
         self.log.info("Loading config from original files")
 
-        self.config = self._get_mpf_config()
-        self.config['_mpf_version'] = __version__
+        loaded_files = []
+        self.config = self._get_mpf_config(loaded_files)
 
         for num, config_file in enumerate(self.options['configfile']):
 
@@ -327,60 +320,16 @@ class MachineController(object):
             self.config = Util.dict_merge(self.config,
                                           ConfigProcessor.load_config_file(
                                               config_file,
-                                              config_type='machine'))
+                                              config_type='machine',
+                                              loaded_files=loaded_files))
             self.machine_config = self.config
 
-        if self.options['create_config_cache']:
-            self._cache_config()
+        self.config_cache.set('machine_config', tuple(self.options['configfile']), self.config, loaded_files)
 
-    def _get_mpf_config(self):
+    def _get_mpf_config(self, loaded_files=None):
         return ConfigProcessor.load_config_file(self.options['mpfconfigfile'],
-                                                config_type='machine')
-
-    def _load_config_from_cache(self):
-        self.log.info("Loading cached config: %s", self._get_mpfcache_file_name())
-
-        with open(self._get_mpfcache_file_name(), 'rb') as f:
-
-            try:
-                self.config = pickle.load(f)
-                self.machine_config = self.config
-
-            # unfortunately pickle can raise all kinds of exceptions and we dont want to crash on corrupted cache
-            # pylint: disable-msg=broad-except
-            except Exception:   # pragma: no cover
-                self.log.warning("Could not load config from cache")
-                return False
-
-            if self.config.get('_mpf_version') != __version__:
-                self.log.info(
-                    "Cached config is from a different version of MPF.")
-                return False
-
-            return True
-
-    def _get_latest_config_mod_time(self):
-
-        latest_time = os.path.getmtime(self.options['mpfconfigfile'])
-
-        for root, dirs, files in os.walk(
-                os.path.join(self.machine_path, 'config')):
-            for name in files:
-                if not name.startswith('.'):
-                    if os.path.getmtime(os.path.join(root, name)) > latest_time:
-                        latest_time = os.path.getmtime(os.path.join(root, name))
-
-            for name in dirs:
-                if not name.startswith('.'):
-                    if os.path.getmtime(os.path.join(root, name)) > latest_time:
-                        latest_time = os.path.getmtime(os.path.join(root, name))
-
-        return latest_time
-
-    def _cache_config(self):    # pragma: no cover
-        with open(self._get_mpfcache_file_name(), 'wb') as f:
-            pickle.dump(self.config, f, protocol=4)
-            self.log.info('Config file cache created: %s', self._get_mpfcache_file_name())
+                                                config_type='machine',
+                                                loaded_files=loaded_files)
 
     def verify_system_info(self):
         """Dump information about the Python installation to the log.
@@ -577,6 +526,7 @@ class MachineController(object):
 
         '''
         self.events.process_event_queue()
+        self.config_cache.save()
         self.thread_stopper.set()
         self._platform_stop()
 
@@ -786,6 +736,16 @@ class MachineController(object):
         else:
             return self.default_platform
 
+    def is_trace_enabled(self, subsystem: str) -> bool:
+        """Return true if debug tracing is enabled for a subsystem.
+
+        Tracing can be enabled per subsystem (e.g. ``events``, ``switches`` or
+        a device collection like ``leds``) with the ``trace:`` setting in the
+        ``mpf:`` section of your config or the ``-t`` command line option.
+        """
+        return (subsystem in Util.string_to_lowercase_list(self.config['mpf'].get('trace')) or
+                subsystem in Util.string_to_lowercase_list(self.options.get('trace')))
+
     def register_boot_hold(self, hold):
         """Register a boot hold."""
         if self.is_init_done:
@@ -107,7 +107,18 @@ class ModeController(object):
                              .format(mode_string))
 
     def _load_mode_config(self, mode_string):
+        # the folders are part of the name since they decide which files are
+        # loaded
+        cache_name = (mode_string, self._mpf_mode_folders.get(mode_string),
+                      self._machine_mode_folders.get(mode_string))
+        config = self.machine.config_cache.get('mode_config', cache_name)
+        if config is not None:
+            return config
+
         config = dict()
+        # all candidate files are passed to the cache (even if they do not
+        # exist) so adding a config file to a mode invalidates the entry
+        loaded_files = []
         # Is there an MPF default config for this mode? If so, load it first
         try:
             mpf_mode_config = os.path.join(
@@ -119,10 +130,13 @@ class ModeController(object):
 
             if os.path.isfile(mpf_mode_config):
                 config = ConfigProcessor.load_config_file(mpf_mode_config,
-                                                          config_type='mode')
+                                                          config_type='mode',
+                                                          loaded_files=loaded_files)
 
                 if self.debug:
                     self.log.debug("Loading config from %s", mpf_mode_config)
+            else:
+                loaded_files.append(mpf_mode_config)
 
         except KeyError:
             pass
@@ -140,10 +154,13 @@ class ModeController(object):
             if os.path.isfile(mode_config_file):
                 config = Util.dict_merge(config,
                                          ConfigProcessor.load_config_file(
-                                             mode_config_file, 'mode'))
+                                             mode_config_file, 'mode',
+                                             loaded_files=loaded_files))
 
                 if self.debug:
                     self.log.debug("Loading config from %s", mode_config_file)
+            else:
+                loaded_files.append(mode_config_file)
 
         except KeyError:
             pass
@@ -152,6 +169,8 @@ class ModeController(object):
         if 'mode' not in config:
             config['mode'] = dict()
 
+        self.machine.config_cache.set('mode_config', cache_name, config, loaded_files)
+
         return config
 
     def _load_mode_config_spec(self, mode_string, mode_class):
@@ -1,6 +1,7 @@
 """Contains the parent class for all platforms."""
 import abc
 
+from mpf.core.switch_snapshot import SwitchStateSnapshot
 from mpf.devices.switch import Switch
 
 
@@ -270,6 +271,7 @@ class SwitchPlatform(BasePlatform, metaclass=abc.ABCMeta):
         """Add switch feature."""
         super().__init__(machine)
         self.features['has_switches'] = True
+        self._switch_positions = {}
 
     @abc.abstractmethod
     def configure_switch(self, config):
@@ -341,6 +343,35 @@ class SwitchPlatform(BasePlatform, metaclass=abc.ABCMeta):
         """
         raise NotImplementedError
 
+    def get_switch_position(self, number):
+        """Return the position of a switch in the snapshots of this platform.
+
+        Subclass this method together with get_hw_switch_snapshot in platforms
+        which can read switch states as bitfields. By default every switch
+        number gets the next free bit in bank 0.
+
+        Args:
+            number: Hardware number of the switch.
+
+        Returns: Tuple of bank and bit index.
+        """
+        if number not in self._switch_positions:
+            self._switch_positions[number] = (0, len(self._switch_positions))
+        return self._switch_positions[number]
+
+    def get_hw_switch_snapshot(self) -> SwitchStateSnapshot:
+        """Return the raw hardware states of all switches as bitfields.
+
+        The default implementation converts the dict of get_hw_switch_states.
+        Subclass this method in platforms which receive switch states as
+        bitfields from the hardware.
+        """
+        snapshot = SwitchStateSnapshot()
+        for number, state in self.get_hw_switch_states().items():
+            bank, bit = self.get_switch_position(number)
+            snapshot.set_switch(bank, bit, state)
+        return snapshot
+
 
 class DriverPlatform(BasePlatform, metaclass=abc.ABCMeta):
 
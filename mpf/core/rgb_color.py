@@ -533,6 +533,15 @@ class RGBColorCorrectionProfile(object):
         """
         return self._name
 
+    @property
+    def lookup_table(self):
+        """Return the lookup tables of this profile.
+
+        Returns:
+            list of three lists (red, green, blue) with 256 values each
+        """
+        return self._lookup_table
+
     def apply(self, color):
         """Apply the current color correction profile to the specified RGBColor object.
 
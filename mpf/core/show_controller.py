@@ -3,6 +3,7 @@
 import logging
 
 from mpf.assets.show import Show
+from mpf.core.show_scheduler import ShowScheduler
 
 
 class ShowController(object):
@@ -25,6 +26,7 @@ class ShowController(object):
         self.show_players = {}
         self.running_shows = list()
         self._next_show_id = 0
+        self.show_scheduler = ShowScheduler(machine)
 
         # Registers Show with the asset manager
         Show.initialize(self.machine)
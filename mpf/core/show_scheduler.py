@@ -0,0 +1,80 @@
+"""Scheduler which groups running shows by the deadline of their next step."""
+from functools import partial
+
+
+class ShowScheduler(object):
+
+    """Advance running shows which share a deadline from one clock event.
+
+    Shows are grouped by the deadline of their next step. There is one
+    ClockEvent per deadline and all shows which are due at that deadline are
+    advanced from its callback. Shows with the same step duration which were
+    started on the same sync_ms grid share a deadline. When the last show of a
+    deadline is unscheduled its ClockEvent is cancelled.
+    """
+
+    def __init__(self, machine):
+        """Initialise show scheduler."""
+        self.machine = machine
+        self._callbacks = dict()
+        self._events = dict()
+
+    def schedule(self, deadline, callback):
+        """Call callback (without arguments) at deadline.
+
+        Args:
+            deadline: Absolute time (see clock.get_time()).
+            callback: Callable which advances a show.
+
+        Returns: Handle for unschedule.
+        """
+        callbacks = self._callbacks.get(deadline)
+        if callbacks is None:
+            callbacks = list()
+            self._callbacks[deadline] = callbacks
+            self._events[deadline] = self.machine.clock.schedule_at(deadline, partial(self._run, deadline))
+
+        callbacks.append(callback)
+        return deadline, callback
+
+    def unschedule(self, handle):
+        """Remove a callback which was scheduled before.
+
+        Args:
+            handle: Handle which was returned by schedule().
+        """
+        deadline, callback = handle
+        callbacks = self._callbacks.get(deadline)
+        if not callbacks or callback not in callbacks:
+            return
+
+        callbacks.remove(callback)
+        if not callbacks:
+            del self._callbacks[deadline]
+            event = self._events.pop(deadline, None)
+            if event:
+                event.cancel()
+
+    def get_scheduled_count(self):
+        """Return the number of callbacks which wait for their deadline."""
+        return sum(len(callbacks) for callbacks in self._callbacks.values())
+
+    def _run(self, deadline):
+        """Advance all shows of a deadline."""
+        del self._events[deadline]
+        callbacks = self._callbacks[deadline]
+        # callbacks may unschedule other shows of this deadline or schedule
+        # new ones. both change the list while we run it
+        while callbacks:
+            callback = callbacks.pop(0)
+            # pylint: disable-msg=broad-except
+            try:
+                callback()
+            except Exception as exc:
+                self.machine.clock.loop.call_exception_handler({
+                    'message': 'Exception in show callback {!r}'.format(callback),
+                    'exception': exc,
+                })
+
+        if self._callbacks.get(deadline) is callbacks:
+            del self._callbacks[deadline]
@@ -40,6 +40,7 @@ class SwitchController(MpfController):
         # callbacks.
 
         self._timed_switch_handler_delay = None
+        self._timed_switch_handler_time = None
 
         self.active_timed_switches = defaultdict(list)
         # Dictionary of switches that are currently in a state counting ms
@@ -70,6 +71,49 @@ class SwitchController(MpfController):
 
         self.monitors = list()
 
+        self._switches_by_number = dict()
+        # Dictionary of (platform, hw number) -> switch object. Used to look up
+        # switches when the platform reports changes by number.
+
+        self._switch_number_keys = dict()
+        # Dictionary of switch object -> (platform, hw number). Used to remove
+        # the old entry when a switch gets reconfigured.
+
+        self._switch_layout = dict()
+        # Dictionary of (platform, bank) -> {bit value: [switch objects]}. Used
+        # to find the switches which changed in a switch state snapshot.
+
+        self._switch_bits = dict()
+        # Dictionary of switch object -> ((platform, bank), bit value).
+
+        self._expected_states = dict()
+        # Dictionary of (platform, bank) -> bitfield of the hardware states
+        # which MPF assumes for the switches in that bank.
+
+        self._switch_stages = dict()
+        self._switch_stages_version = None
+        # Dictionary of (switch name, state) -> tuple of a flag whether switch
+        # handlers are registered and the events which need to be posted. Built
+        # on the first change of a switch and dropped whenever switch handlers
+        # or event handlers change.
+
+        self.debug = False
+        self._log_switch_changes = False
+        self.update_log_level()
+
+    def update_log_level(self):
+        """Resolve which switch messages are logged.
+
+        This is done once on startup so processing switches does not call the
+        logger at all when logging is disabled. Call it again after changing
+        the level of the "SwitchController" logger at runtime.
+        """
+        if self.machine.is_trace_enabled("switches"):
+            self.log.setLevel(logging.DEBUG)
+
+        self.debug = self.log.isEnabledFor(logging.DEBUG)
+        self._log_switch_changes = self.log.isEnabledFor(logging.INFO)
+
     def register_switch(self, name):
         """Populate self.registered_switches.
 
@@ -82,6 +126,7 @@ class SwitchController(MpfController):
         self.set_state(name, 0, reset_time=True)
 
     def _initialize_switches(self):
+        self._build_switch_number_index()
         self.update_switches_from_hw()
 
         for switch in self.machine.switches:
@@ -129,64 +174,129 @@ class SwitchController(MpfController):
                     else:
                         switch.deactivation_events.add(event)
 
+        self._switch_stages = dict()
+
+    def _build_switch_number_index(self):
+        """(Re)build the (platform, number) lookup for all switches."""
+        self._switches_by_number = dict()
+        self._switch_number_keys = dict()
+        self._switch_layout = dict()
+        self._switch_bits = dict()
+        self._expected_states = dict()
+        for switch in self.machine.switches:
+            self.update_switch_number_index(switch)
+
+    def _add_switch_to_layout(self, switch: Switch):
+        """Add a switch at its position in the snapshots of its platform."""
+        bank, bit = switch.platform.get_switch_position(switch.hw_switch.number)
+        key = (switch.platform, bank)
+        bit_value = 1 << bit
+        self._switch_layout.setdefault(key, {}).setdefault(bit_value, []).append(switch)
+        self._switch_bits[switch] = (key, bit_value)
+        self._expected_states.setdefault(key, 0)
+        if switch.state ^ switch.invert:
+            self._expected_states[key] |= bit_value
+        else:
+            self._expected_states[key] &= ~bit_value
+
+    def _remove_switch_from_layout(self, switch: Switch):
+        """Remove a switch from the snapshot layout if it is in there."""
+        bits = self._switch_bits.pop(switch, None)
+        if bits is None:
+            return
+
+        key, bit_value = bits
+        switches_by_bit = self._switch_layout[key]
+        switches_by_bit[bit_value].remove(switch)
+        if switches_by_bit[bit_value]:
+            return
+
+        del switches_by_bit[bit_value]
+        self._expected_states[key] &= ~bit_value
+        if not switches_by_bit:
+            del self._switch_layout[key]
+            del self._expected_states[key]
+
+    def update_switch_number_index(self, switch: Switch):
+        """Add or update a switch in the (platform, number) lookup.
+
+        Called when a switch gets (re)configured so a changed hw number or
+        platform is reflected in process_switch_by_num and in the switch
+        snapshots. Only the entries of this switch are touched.
+        """
+        key = self._switch_number_keys.pop(switch, None)
+        if key is not None and self._switches_by_number.get(key) is switch:
+            del self._switches_by_number[key]
+        self._remove_switch_from_layout(switch)
+
+        if switch.hw_switch is not None:
+            key = (switch.platform, switch.hw_switch.number)
+            self._switches_by_number[key] = switch
+            self._switch_number_keys[switch] = key
+            self._add_switch_to_layout(switch)
+
     def update_switches_from_hw(self):
         """Update the states of all the switches be re-reading the states from the hardware platform.
 
         This method works silently and does not post any events if any switches
         changed state.
         """
-        # create a list of hw switch numbers, platforms, and switch objects
-        platforms = set()
-        switches = set()  # (switch_object, number)
+        self._sync_switches_from_hw()
 
-        for switch in self.machine.switches:
-            platforms.add(switch.platform)
-            switches.add((switch, switch.hw_switch.number))
-
-        for platform in platforms:
-            switch_states = platform.get_hw_switch_states()
-
-            for switch, number in switches:
-                # if two platforms have the same number choose the right switch
-                if switch.platform != platform:
-                    continue
-                try:
-                    switch.state = switch_states[number] ^ switch.invert
-                    switch.time = self.machine.clock.get_time()
-                except (IndexError, KeyError):
+    def _sync_switches_from_hw(self):
+        """Read snapshots from all platforms and apply the switches which differ.
+
+        Every bank is compared to the expected states in one operation so only
+        switches which changed are touched.
+
+        Returns: List of tuples of switch object and the state MPF assumed before.
+        """
+        changed_switches = []
+        now = self.machine.clock.get_time()
+        snapshots = dict()
+
+        for key, switches_by_bit in self._switch_layout.items():
+            platform, bank = key
+            if platform not in snapshots:
+                snapshots[platform] = platform.get_hw_switch_snapshot()
+
+            states, mask = snapshots[platform].get_bank(bank)
+            expected = self._expected_states[key]
+
+            changed = (states ^ expected) & mask
+            for bit_value, switches in switches_by_bit.items():
+                if not bit_value & mask:
                     self.log.warning("Received a status update from hardware "
-                                     "switch %s, but that switch is not in "
-                                     "your config. Just FYI.", number)
+                                     "but switch %s is missing in it. Just FYI.",
+                                     switches[0].hw_switch.number)
+                elif bit_value & changed:
+                    for switch in switches:
+                        changed_switches.append((switch, switch.state))
+                        switch.state = (1 if states & bit_value else 0) ^ switch.invert
+                        switch.time = now
+
+            self._expected_states[key] = (expected & ~mask) | states
+
+        return changed_switches
 
     def verify_switches(self) -> bool:
         """Verify that switches states match the hardware.
 
-        Loop through all the switches and queries their hardware states via
-        their platform interfaces and them compares that to the state that MPF
-        thinks the switches are in.
+        Reads the states of all switches from their platforms and compares
+        them to the state that MPF thinks the switches are in.
 
         Throws logging warnings if anything doesn't match.
 
         This method is notification only. It doesn't fix anything.
         """
-        current_states = dict()
+        changed_switches = self._sync_switches_from_hw()
 
-        for switch in self.machine.switches:
-            current_states[switch] = switch.state
-
-        self.update_switches_from_hw()
+        for switch, mpf_state in changed_switches:  # pragma: no cover
+            self.log.warning("Switch State Error! Switch: %s, HW State: "
+                             "%s, MPF State: %s", switch.name,
+                             switch.state, mpf_state)
 
-        ok = True
-
-        for switch in self.machine.switches:
-            if switch.state != current_states[switch]:  # pragma: no cover
-                ok = False
-                self.log.warning("Switch State Error! Switch: %s, HW State: "
-                                 "%s, MPF State: %s", switch.name,
-                                 current_states[switch],
-                                 switch.state)
-
-        return ok
+        return not changed_switches
 
     def is_state(self, switch_name, state, ms=0):
         """Check if switch is in state.
@@ -253,10 +363,10 @@ class SwitchController(MpfController):
 
     def process_switch_by_num(self, num, state, platform, logical=False):
         """Process a switch state change by switch number."""
-        for switch in self.machine.switches:
-            if switch.hw_switch.number == num and switch.platform == platform:
-                self.process_switch_obj(obj=switch, state=state, logical=logical)
-                return
+        switch = self._switches_by_number.get((platform, num))
+        if switch is not None:
+            self.process_switch_obj(obj=switch, state=state, logical=logical)
+            return
 
         # if the switch is not configured still trigger the monitor
         for monitor in self.monitors:
@@ -289,7 +399,8 @@ class SwitchController(MpfController):
         handles NC versus NO switches and translates them to 'active' versus
         'inactive'.)
         """
-        self.log.debug("Processing switch. Name: %s, state: %s, logical: %s,", name, state, logical)
+        if self.debug:
+            self.log.debug("Processing switch. Name: %s, state: %s, logical: %s,", name, state, logical)
 
         try:
             obj = self.machine.switches[name]
@@ -353,6 +464,14 @@ class SwitchController(MpfController):
 
         obj.state = state  # update the switch device
 
+        bits = self._switch_bits.get(obj)
+        if bits is not None:
+            key, bit_value = bits
+            if hw_state:
+                self._expected_states[key] |= bit_value
+            else:
+                self._expected_states[key] &= ~bit_value
+
         if state:
             # update the switch's next recycle clear time
             obj.recycle_clear_time = (self.machine.clock.get_time() +
@@ -361,7 +480,7 @@ class SwitchController(MpfController):
         # if the switch is already in this state, then abort
         if self.switches[obj.name]['state'] == state:
 
-            if not obj.recycle_secs:
+            if not obj.recycle_secs and self._log_switch_changes:
                 self.log.info("Received duplicate switch state, which means "
                               "this switch had some non-debounced state changes. This "
                               "could be nothing, but if it happens a lot it could "
@@ -369,20 +488,50 @@ class SwitchController(MpfController):
                               obj.name)
             return
 
-        self.log.info("<<<<< switch: %s, State:%s >>>>>", obj.name, state)
+        if self._log_switch_changes:
+            self.log.info("<<<<< switch: %s, State:%s >>>>>", obj.name, state)
 
         # Update the switch controller's logical state for this switch
         self.set_state(obj.name, state)
 
-        self._call_handlers(obj.name, state)
+        # skip all stages without subscribers. for switches which are only
+        # used in hardware rules (e.g. flippers) this is all of them
+        has_handlers, events = self._get_switch_stages(obj, state)
 
-        self._cancel_timed_handlers(obj.name, state)
+        if has_handlers:
+            self._call_handlers(obj.name, state)
+
+        if self.active_timed_switches:
+            self._cancel_timed_handlers(obj.name, state)
 
         for monitor in self.monitors:
             monitor(MonitoredSwitchChange(name=obj.name, label=obj.label, platform=obj.platform,
                                           num=obj.hw_switch.number, state=state))
 
-        self._post_switch_events(obj.name, state)
+        for event in events:
+            self.machine.events.post(event)
+
+    def _get_switch_stages(self, switch, state):
+        """Return whether handlers are registered and which events to post for a switch change."""
+        if self._switch_stages_version != self.machine.events.handlers_version:
+            self._switch_stages = dict()
+            self._switch_stages_version = self.machine.events.handlers_version
+
+        try:
+            return self._switch_stages[(switch.name, state)]
+        except KeyError:
+            pass
+
+        has_handlers = bool(self.registered_switches.get(switch.name + '-' + str(state)))
+
+        # post all events of the switch if any of them has a handler to keep
+        # the order of events. skip them only if nobody listens
+        events = tuple(self._get_switch_events(switch, state))
+        if not any(self.machine.events.does_event_exist(event) for event in events):
+            events = tuple()
+
+        self._switch_stages[(switch.name, state)] = (has_handlers, events)
+        return has_handlers, events
 
     def _recycle_passed(self, obj, state, logical, hw_state):
         if obj.hw_state == hw_state:
@@ -436,12 +585,22 @@ class SwitchController(MpfController):
 
     def _add_timed_switch_handler(self, key, value):
         self.active_timed_switches[key].append(value)
+        self._schedule_timed_switch_handlers(key)
 
+    def _schedule_timed_switch_handlers(self, next_event_time):
+        """Make sure timed switch handlers are processed at next_event_time.
+
+        Only reschedules if there is no earlier wake-up scheduled already.
+        """
         if self._timed_switch_handler_delay:
+            if self._timed_switch_handler_time <= next_event_time:
+                return
             self.machine.clock.unschedule(self._timed_switch_handler_delay)
+
+        self._timed_switch_handler_time = next_event_time
         self._timed_switch_handler_delay = self.machine.clock.schedule_once(
             self._process_active_timed_switches,
-            self.get_next_timed_switch_event() - self.machine.clock.get_time())
+            next_event_time - self.machine.clock.get_time())
 
     def _call_handlers(self, name, state):
         # Combine name & state so we can look it up
@@ -465,9 +624,10 @@ class SwitchController(MpfController):
                              'return_info': entry['return_info'],
                              'callback_kwargs': entry['callback_kwargs']}
                     self._add_timed_switch_handler(key, value)
-                    self.log.debug(
-                        "Found timed switch handler for k/v %s / %s",
-                        key, value)
+                    if self.debug:
+                        self.log.debug(
+                            "Found timed switch handler for k/v %s / %s",
+                            key, value)
                 else:
                     # This entry doesn't have a timed delay, so do the action
                     # now
@@ -530,6 +690,7 @@ class SwitchController(MpfController):
         entry_key = str(switch_name) + '-' + str(state)
 
         self.registered_switches[entry_key].append(entry_val)
+        self._switch_stages = dict()
 
         # If the switch handler that was just registered has a delay (i.e. ms>0,
         # then let's see if the switch is currently in the state that the
@@ -594,6 +755,7 @@ class SwitchController(MpfController):
                     self.registered_switches[entry_key]):
                 if settings['ms'] == ms and settings['callback'] == callback:
                     self.registered_switches[entry_key].remove(settings)
+            self._switch_stages = dict()
 
         for dummy_timed_key, timed_entry in self.active_timed_switches.items():
             for dummy_key, entry in enumerate(timed_entry):
@@ -625,16 +787,16 @@ class SwitchController(MpfController):
                 switch.recycle_jitter_count += 1
             return False
 
-    def _post_switch_events(self, switch_name, state):
-        """Post the game events based on this switch changing state."""
+    def _get_switch_events(self, switch, state):
+        """Return the game events which are posted when this switch changes state."""
+        events = []
         # the following events all fire the moment a switch goes active
         if state == 1:
 
-            for event in self.machine.switches[switch_name].activation_events:
-                self.machine.events.post(event)
+            events.extend(switch.activation_events)
 
-            for tag in self.machine.switches[switch_name].tags:
-                self.machine.events.post(self.switch_tag_event.replace('%', tag))
+            for tag in switch.tags:
+                events.append(self.switch_tag_event.replace('%', tag))
                 '''event: sw_(tag_name)
 
                 desc: A switch tagged with *tag_name* was just activated.
@@ -648,15 +810,16 @@ class SwitchController(MpfController):
 
                 '''
 
-                self.machine.events.post(self.switch_tag_event.replace('%', tag) + "_active")
+                events.append(self.switch_tag_event.replace('%', tag) + "_active")
 
         # the following events all fire the moment a switch becomes inactive
         elif state == 0:
-            for event in self.machine.switches[switch_name].deactivation_events:
-                self.machine.events.post(event)
+            events.extend(switch.deactivation_events)
 
-            for tag in self.machine.switches[switch_name].tags:
-                self.machine.events.post(self.switch_tag_event.replace('%', tag) + "_inactive")
+            for tag in switch.tags:
+                events.append(self.switch_tag_event.replace('%', tag) + "_inactive")
+
+        return events
 
     def get_next_timed_switch_event(self):
         """Return time of the next timed switch event."""
@@ -672,16 +835,20 @@ class SwitchController(MpfController):
         removes that entry from the list.
         """
         del dt
+        self._timed_switch_handler_delay = None
+        self._timed_switch_handler_time = None
+
         next_event_time = False
         for k in list(self.active_timed_switches.keys()):
             if k <= self.machine.clock.get_time():  # change to generator?
                 for entry in self.active_timed_switches[k]:
                     if entry['removed']:
                         continue
-                    self.log.debug(
-                        "Processing timed switch handler. Switch: %s "
-                        " State: %s, ms: %s", entry['switch_name'],
-                        entry['state'], entry['ms'])
+                    if self.debug:
+                        self.log.debug(
+                            "Processing timed switch handler. Switch: %s "
+                            " State: %s, ms: %s", entry['switch_name'],
+                            entry['state'], entry['ms'])
                     if entry['return_info']:
                         entry['callback'](switch_name=entry['switch_name'],
                                           state=entry['state'],
@@ -696,8 +863,4 @@ class SwitchController(MpfController):
 
         self.machine.events.process_event_queue()
         if next_event_time:
-            if self._timed_switch_handler_delay:
-                self.machine.clock.unschedule(self._timed_switch_handler_delay)
-            self._timed_switch_handler_delay = self.machine.clock.schedule_once(
-                self._process_active_timed_switches,
-                next_event_time - self.machine.clock.get_time())
+            self._schedule_timed_switch_handlers(next_event_time)
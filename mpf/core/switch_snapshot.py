@@ -0,0 +1,64 @@
+"""Bitfield representation of the hardware states of all switches of a platform."""
+
+
+class SwitchStateSnapshot(object):
+
+    """Hardware states of all switches of a platform as one bitfield per bank.
+
+    Platforms group their switches into banks (e.g. a board or a switch
+    connection) and every switch is one bit in its bank. Besides the states
+    the snapshot stores a mask of all bits which were reported by the hardware
+    so switches which are missing in a report can be told apart from inactive
+    switches.
+
+    States are raw hardware states. They do not compensate for NO or NC
+    switches.
+    """
+
+    __slots__ = ["states", "masks"]
+
+    def __init__(self):
+        """Initialise empty snapshot."""
+        self.states = {}
+        self.masks = {}
+
+    def set_bank(self, bank, states, mask):
+        """Set the states of all switches in a bank.
+
+        Args:
+            bank: Hashable name of the bank.
+            states: Int with one bit per switch. 1 = active.
+            mask: Int with all bits set which were reported by the hardware.
+        """
+        self.states[bank] = states & mask
+        self.masks[bank] = mask
+
+    def set_switch(self, bank, bit, state):
+        """Set the state of a single switch.
+
+        Args:
+            bank: Hashable name of the bank.
+            bit: Index of the switch in the bank.
+            state: 1 = active, 0 = inactive.
+        """
+        bit_value = 1 << bit
+        self.masks[bank] = self.masks.get(bank, 0) | bit_value
+        if state:
+            self.states[bank] = self.states.get(bank, 0) | bit_value
+        else:
+            self.states[bank] = self.states.get(bank, 0) & ~bit_value
+
+    def get_bank(self, bank):
+        """Return a tuple of states and mask of a bank.
+
+        Both are 0 if the hardware did not report the bank.
+        """
+        return self.states.get(bank, 0), self.masks.get(bank, 0)
+
+    def get_state(self, bank, bit):
+        """Return the state of a single switch or None if it was not reported."""
+        states, mask = self.get_bank(bank)
+        bit_value = 1 << bit
+        if not mask & bit_value:
+            return None
+        return 1 if states & bit_value else 0
@@ -2,6 +2,7 @@
 from operator import itemgetter
 
 from mpf.core.device_monitor import DeviceMonitor
+from mpf.core.led_frame_engine import LedFrameEngine, numpy_imported
 from mpf.core.machine import MachineController
 from mpf.core.mode import Mode
 from mpf.core.rgb_color import RGBColor
@@ -23,6 +24,7 @@ class Led(SystemWideDevice):
     leds_to_update = set()
     leds_to_fade = set()
     _updater_task = None
+    _frame_engine = None
 
     @classmethod
     def device_class_init(cls, machine: MachineController):
@@ -37,6 +39,15 @@ class Led(SystemWideDevice):
 
         machine.validate_machine_config_section('led_settings')
 
+        cls._frame_engine = None
+        if machine.config['led_settings']['frame_engine']:
+            if numpy_imported:
+                cls._frame_engine = LedFrameEngine(machine)
+            else:   # pragma: no cover
+                machine.log.warning("led_settings: frame_engine is enabled "
+                                    "but numpy is not installed. Falling "
+                                    "back to per LED updates.")
+
         if machine.config['led_settings']['color_correction_profiles'] is None:
             machine.config['led_settings']['color_correction_profiles'] = (
                 dict())
@@ -87,6 +98,12 @@ class Led(SystemWideDevice):
         Args:
             dt: time since last call
         """
+        if cls._frame_engine:
+            if Led.leds_to_fade or Led.leds_to_update:
+                cls._frame_engine.update(Led.leds_to_fade, Led.leds_to_update)
+                Led.leds_to_update = set()
+            return
+
         for led in list(Led.leds_to_fade):
             if led.fade_in_progress:
                 led.fade_task(dt)
@@ -122,6 +139,7 @@ class Led(SystemWideDevice):
         self.default_fade_ms = None
 
         self._color_correction_profile = None
+        self.frame_index = None
 
         self.stack = list()
         """A list of dicts which represents different commands that have come
@@ -171,6 +189,9 @@ class Led(SystemWideDevice):
     def _initialize(self):
         self._load_hw_driver()
 
+        if self._frame_engine:
+            self._frame_engine.add_led(self)
+
         self.config['default_color'] = RGBColor(self.config['default_color'])
 
         if self.config['color_correction_profile'] is not None:
@@ -209,6 +230,13 @@ class Led(SystemWideDevice):
         """
         self._color_correction_profile = profile
 
+        if self._frame_engine:
+            self._frame_engine.invalidate()
+
+    def get_color_correction_profile(self):
+        """Return the color correction profile of this LED or None if there is none."""
+        return self._color_correction_profile
+
     # pylint: disable-msg=too-many-arguments
     def color(self, color, fade_ms=None, priority=0, key=None, mode=None):
         """Add or update a color entry in this LED's stack, which is how you tell this LED what color you want it to be.
@@ -279,14 +307,9 @@ class Led(SystemWideDevice):
         self.stack.sort(key=itemgetter('priority', 'start_time'), reverse=True)
 
         if self.debug:
-            self.log.debug("+-------------- Adding to stack ----------------+")
-            self.log.debug("priority: %s", priority)
-            self.log.debug("start_time: %s", self.machine.clock.get_time())
-            self.log.debug("start_color: %s", curr_color)
-            self.log.debug("dest_time: %s", dest_time)
-            self.log.debug("dest_color: %s", color)
-            self.log.debug("color: %s", new_color)
-            self.log.debug("key: %s", key)
+            self.log.debug("Adding to stack. priority: %s, start_time: %s, start_color: %s, dest_time: %s, "
+                           "dest_color: %s, color: %s, key: %s", priority, self.machine.clock.get_time(),
+                           curr_color, dest_time, color, new_color, key)
 
         Led.leds_to_update.add(self)
 
@@ -360,14 +383,20 @@ class Led(SystemWideDevice):
             for i in range(len(self.hw_driver)):
                 self.hw_driver[i].on(reordered_color[i])
 
-    def write_color_to_hw_driver(self):
-        """Set color to hardware platform.
+    def _write_buffer_to_hw_driver(self, channels):
+        """Write the channels of this LED from the frame buffer of the LED frame engine."""
+        if self.platform:
+            self.hw_driver.color_from_buffer(channels)
+        else:
+            self._write_color_to_hw_driver(channels.tolist())
 
-        Physically update the LED hardware object based on the 'color'
-        setting of the highest priority setting from the stack.
+    def update_fade_state(self):
+        """Start or stop the fade task depending on the top entry of the stack.
 
-        This method is automatically called whenever a color change has been
-        made (including when fades are active).
+        Returns:
+            True if the current color should be written to the hardware.
+            False if a fade was just set up (it will write the color on the
+            next update).
         """
         if not self.stack:
             self.color('off')
@@ -379,10 +408,22 @@ class Led(SystemWideDevice):
         # If the new command has a fade, but the fade task isn't running
         if self.stack[0]['dest_time'] and not self.fade_in_progress:
             self._setup_fade()
+            return False
 
         # If there's no current fade and no new fade, or a current fade and new
         # fade
-        else:
+        return True
+
+    def write_color_to_hw_driver(self):
+        """Set color to hardware platform.
+
+        Physically update the LED hardware object based on the 'color'
+        setting of the highest priority setting from the stack.
+
+        This method is automatically called whenever a color change has been
+        made (including when fades are active).
+        """
+        if self.update_fade_state():
             corrected_color = self.gamma_correct(self.stack[0]['color'])
             corrected_color = self.color_correct(corrected_color)
 
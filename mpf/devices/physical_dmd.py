@@ -1,4 +1,5 @@
 """Support for physical DMDs."""
+from mpf.core.dmd_output_stage import DmdOutputStage
 from mpf.core.machine import MachineController
 
 from mpf.core.system_wide_device import SystemWideDevice
@@ -26,11 +27,13 @@ class PhysicalDmd(SystemWideDevice):
     def __init__(self, machine, name):
         """Initialise DMD."""
         self.hw_device = None
+        self.output_stage = None
         super().__init__(machine, name)
 
     def _initialize(self):
         self.load_platform_section("dmd")
         self.hw_device = self.platform.configure_dmd()
+        self.output_stage = DmdOutputStage(self.machine, self.hw_device, self.config['fps'])
 
     @classmethod
     def _bcp_receive_dmd_frame(cls, client, name, rawbytes, **kwargs):
@@ -46,7 +49,9 @@ class PhysicalDmd(SystemWideDevice):
     def update(self, data: bytes):
         """Update data on the dmd.
 
+        Frames which arrive faster than the dmd can show them are dropped.
+
         Args:
             data: bytes to send
         """
-        self.hw_device.update(data)
+        self.output_stage.put(data)
@@ -1,4 +1,6 @@
 """Support for physical RGB DMDs."""
+from mpf.core.dmd_frame_encoder import RowDeltaEncoder
+from mpf.core.dmd_output_stage import DmdOutputStage
 from mpf.core.machine import MachineController
 
 from mpf.core.system_wide_device import SystemWideDevice
@@ -26,11 +28,17 @@ class PhysicalRgbDmd(SystemWideDevice):
     def __init__(self, machine, name):
         """Initialise DMD."""
         self.hw_device = None
+        self.output_stage = None
         super().__init__(machine, name)
 
     def _initialize(self):
         self.load_platform_section("rgb_dmd")
         self.hw_device = self.platform.configure_rgb_dmd()
+        if self.config['frame_encoding'] == "row_delta":
+            encoder = RowDeltaEncoder(self.config['width'])
+        else:
+            encoder = None
+        self.output_stage = DmdOutputStage(self.machine, self.hw_device, self.config['fps'], encoder)
 
     @classmethod
     def _bcp_receive_dmd_frame(cls, client, name, rawbytes, **kwargs):
@@ -46,7 +54,9 @@ class PhysicalRgbDmd(SystemWideDevice):
     def update(self, data: bytes):
         """Update data on the dmd.
 
+        Frames which arrive faster than the dmd can show them are dropped.
+
         Args:
             data: bytes to send
         """
-        self.hw_device.update(data)
+        self.output_stage.put(data)
@@ -55,6 +55,7 @@ class Switch(SystemWideDevice):
         self.recycle_secs = self.config['ignore_window_ms'] / 1000.0
 
         self.hw_switch = self.platform.configure_switch(self.config)
+        self.machine.switch_controller.update_switch_number_index(self)
 
     def get_configured_switch(self):
         """Reconfigure switch."""
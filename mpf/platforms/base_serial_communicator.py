@@ -2,9 +2,84 @@
 import asyncio
 
 
+class FrameDecoder(object):
+
+    """Split received bytes into frames.
+
+    All received bytes are appended to one receive buffer. Complete frames are
+    sliced out of it and the parsed part of the buffer is removed once per
+    call to feed() so bursts of messages do not reallocate the buffer for
+    every frame.
+
+    This base class passes received data on as it is (e.g. for raw DMD
+    connections). Subclasses implement _decode() for their protocol.
+    """
+
+    def __init__(self):
+        """Initialise decoder."""
+        self.buffer = bytearray()
+        self.position = 0
+
+    def feed(self, data):
+        """Add received data and yield all complete frames.
+
+        Args:
+            data: Bytes which were received.
+        """
+        self.buffer.extend(data)
+        try:
+            yield from self._decode(self.buffer)
+        finally:
+            del self.buffer[:self.position]
+            self.position = 0
+
+    def _decode(self, buffer):
+        """Yield all complete frames in buffer starting at self.position.
+
+        Advance self.position past every consumed byte.
+        """
+        if buffer:
+            self.position = len(buffer)
+            yield bytes(buffer)
+
+
+class SeparatorFrameDecoder(FrameDecoder):
+
+    """Decoder for frames which are terminated by a separator (e.g. CR).
+
+    The separator is not part of the frames.
+    """
+
+    def __init__(self, separator):
+        """Initialise decoder.
+
+        Args:
+            separator: Bytes which terminate every frame.
+        """
+        super().__init__()
+        self.separator = separator
+
+    def _decode(self, buffer):
+        while True:
+            end = buffer.find(self.separator, self.position)
+            if end == -1:
+                return
+
+            frame = bytes(buffer[self.position:end])
+            self.position = end + len(self.separator)
+            yield frame
+
+
 class BaseSerialCommunicator(object):
 
-    """Basic Serial Communcator for platforms."""
+    """Basic Serial Communcator for platforms.
+
+    Received data is passed to the frame decoder of the connection (see
+    _create_frame_decoder()) and every complete frame is handled by
+    _process_frame().
+    """
+
+    read_size = 4096
 
     # pylint: disable=too-many-arguments
     def __init__(self, platform, port: str, baud: int):
@@ -23,6 +98,7 @@ class BaseSerialCommunicator(object):
         self.baud = baud
         self.reader = None
         self.writer = None
+        self.frame_decoder = self._create_frame_decoder()
 
         self.machine.clock.loop.run_until_complete(self._connect_to_hardware(port, baud))
 
@@ -47,21 +123,34 @@ class BaseSerialCommunicator(object):
         """
         future.result()
 
+    def _create_frame_decoder(self):
+        """Return the FrameDecoder for this connection."""
+        return FrameDecoder()
+
     @asyncio.coroutine
     def readuntil(self, separator, min_chars: int=0):
         """Read until separator.
 
+        Bytes which are read after the separator stay in the receive buffer of
+        the frame decoder.
+
         Args:
             separator: Read until this separator byte.
             min_chars: Minimum message length before separator
         """
         # asyncio StreamReader only supports this from python 3.5.2 on
-        buffer = b''
+        buffer = self.frame_decoder.buffer
         while True:
-            char = yield from self.reader.readexactly(1)
-            buffer += char
-            if char == separator and len(buffer) > min_chars:
-                return buffer
+            position = buffer.find(separator, min_chars)
+            if position != -1:
+                message = bytes(buffer[:position + len(separator)])
+                del buffer[:position + len(separator)]
+                return message
+
+            data = yield from self.reader.read(self.read_size)
+            if not data:
+                raise asyncio.IncompleteReadError(bytes(buffer), None)
+            buffer.extend(data)
 
     @asyncio.coroutine
     def _identify_connection(self):
@@ -84,20 +173,43 @@ class BaseSerialCommunicator(object):
             self.log.debug("Sending: %s (%s)", msg, "".join(" 0x%02x" % b for b in msg))
         self.writer.write(msg)
 
+    def is_busy(self):
+        """Return true while sent data waits in the write buffer."""
+        return bool(self.writer.transport.get_write_buffer_size())
+
     def _parse_msg(self, msg):
         """Parse a message.
 
         Msg may be partial.
         Args:
             msg: Bytes of the message (part) received.
+
+        Returns the number of complete frames which were processed.
+        """
+        frames = 0
+        for frame in self.frame_decoder.feed(msg):
+            self._process_frame(frame)
+            frames += 1
+
+        return frames
+
+    def _process_frame(self, frame):
+        """Process a complete frame.
+
+        Args:
+            frame: Bytes of the frame.
         """
         raise NotImplementedError("Implement!")
 
     @asyncio.coroutine
     def _socket_reader(self):
+        # process data which was read after the last message during identify
+        if self.frame_decoder.buffer:
+            self._parse_msg(b'')
+
         while True:
             try:
-                resp = yield from self.reader.read(100)
+                resp = yield from self.reader.read(self.read_size)
             # pylint: disable-msg=broad-except
             except Exception as e:
                 self.log.warning("Serial error: {}".format(e))
@@ -21,6 +21,7 @@ from mpf.platforms.fast.fast_switch import FASTSwitch
 from mpf.devices.switch import Switch
 from mpf.core.platform import ServoPlatform, MatrixLightsPlatform, GiPlatform, DmdPlatform, LedPlatform, \
     SwitchPlatform, DriverPlatform
+from mpf.core.switch_snapshot import SwitchStateSnapshot
 from mpf.core.utility_functions import Util
 
 
@@ -48,10 +49,12 @@ class HardwarePlatform(ServoPlatform, MatrixLightsPlatform, GiPlatform,
         self.rgb_connection = None
         self.serial_connections = set()
         self.fast_leds = set()
+        self.dirty_leds = set()
+        self._next_led_refresh = 0
         self.flag_led_tick_registered = False
         self.config = None
         self.machine_type = None
-        self.hw_switch_data = None
+        self.hw_switch_snapshot = SwitchStateSnapshot()
         self.io_boards = {}     # type: dict[int, 'mpf.platform.fast.fast_io_board.FastIoBoard']
 
         self.fast_commands = {'ID': lambda x: None,  # processor ID
@@ -177,24 +180,59 @@ class HardwarePlatform(ServoPlatform, MatrixLightsPlatform, GiPlatform,
     def update_leds(self, dt):
         """Update all the LEDs connected to a FAST controller.
 
-        This is done once per game loop for efficiency (i.e. all LEDs are sent as a single
-        update rather than lots of individual ones).
+        This is done once per game loop for efficiency (i.e. all LEDs are sent
+        in as few messages as possible rather than lots of individual ones).
 
-        Also, every LED is updated every loop, even if it doesn't change. This
-        is in case some interference causes a LED to change color. Since we
-        update every loop, it will only be the wrong color for one tick.
+        Only LEDs which changed since the last update are sent. Every
+        fast:hardware_led_refresh_interval all LEDs are sent even if they did
+        not change. This is in case some interference causes a LED to change
+        color.
 
         Args:
             dt: time since last call
         """
         del dt
-        msg = 'RS:' + ','.join(["%s%s" % (led.number, led.current_color)
-                                for led in self.fast_leds])
+        now = self.machine.clock.get_time()
+        if now >= self._next_led_refresh:
+            self._next_led_refresh = now + self.config['hardware_led_refresh_interval'] / 1000
+            leds = self.fast_leds
+        elif self.dirty_leds:
+            leds = self.dirty_leds
+        else:
+            return
+
+        max_length = self.config['rgb_max_line_length']
+        msg = 'RS:'
+        for led in leds:
+            led_string = led.number + led.current_color
+            if len(msg) > 3 and len(msg) + len(led_string) + 1 > max_length:
+                self.rgb_connection.send(msg)
+                msg = 'RS:'
+
+            if len(msg) > 3:
+                msg += ','
+            msg += led_string
+
         self.rgb_connection.send(msg)
+        self.dirty_leds.clear()
 
     def get_hw_switch_states(self):
         """Return hardware states."""
-        return self.hw_switch_data
+        hw_states = dict()
+        for connection, mask in self.hw_switch_snapshot.masks.items():
+            states = self.hw_switch_snapshot.states[connection]
+            for index in range(mask.bit_length()):
+                if mask & (1 << index):
+                    hw_states[(Util.int_to_hex_string(index), connection)] = 1 if states & (1 << index) else 0
+        return hw_states
+
+    def get_hw_switch_snapshot(self):
+        """Return hardware states as received in the last SA message."""
+        return self.hw_switch_snapshot
+
+    def get_switch_position(self, number):
+        """Return connection (0 = local, 1 = network) and index of a switch."""
+        return number[1], int(number[0], 16)
 
     def receive_nw_open(self, msg):
         """Process network switch open.
@@ -239,36 +277,23 @@ class HardwarePlatform(ServoPlatform, MatrixLightsPlatform, GiPlatform,
     def receive_sa(self, msg):
         """Receive all switch states.
 
+        The message contains the local and network switch states as hex
+        strings with one bit per switch (least significant bit of the first
+        byte is switch 0).
+
         Args:
             msg: switch states as bytearray
         """
         self.debug_log("Received SA: %s", msg)
 
-        hw_states = dict()
-
-        num_local, local_states, num_nw, nw_states = msg.split(',')
-        num_local = Util.hex_string_to_int(num_local) - 1
-        num_nw = Util.hex_string_to_int(num_nw) - 1
-
-        for offset, byte in enumerate(bytearray.fromhex(nw_states)):
-            for i in range(num_nw):
-                num = Util.int_to_hex_string((offset * 8) + i)
-                if byte & (2**i):
-                    hw_states[(num, 1)] = 1
-                else:
-                    hw_states[(num, 1)] = 0
-
-        for offset, byte in enumerate(bytearray.fromhex(local_states)):
-            for i in range(num_local):
-
-                num = Util.int_to_hex_string((offset * 8) + i)
+        _, local_states, _, nw_states = msg.split(',')
+        snapshot = SwitchStateSnapshot()
 
-                if byte & (2**i):
-                    hw_states[(num, 0)] = 1
-                else:
-                    hw_states[(num, 0)] = 0
+        for connection, states in ((0, local_states), (1, nw_states)):
+            states = bytes.fromhex(states)
+            snapshot.set_bank(connection, int.from_bytes(states, 'little'), (1 << (8 * len(states))) - 1)
 
-        self.hw_switch_data = hw_states
+        self.hw_switch_snapshot = snapshot
 
     def convert_number_from_config(self, number):
         """Convert a number from config format to int."""
@@ -503,7 +528,7 @@ class HardwarePlatform(ServoPlatform, MatrixLightsPlatform, GiPlatform,
         else:
             number = self.convert_number_from_config(config['number'])
 
-        this_fast_led = FASTDirectLED(number)
+        this_fast_led = FASTDirectLED(number, self.dirty_leds)
         self.fast_leds.add(this_fast_led)
 
         return this_fast_led
@@ -557,7 +582,7 @@ class HardwarePlatform(ServoPlatform, MatrixLightsPlatform, GiPlatform,
                                  "but no connection to a DMD processor is "
                                  "available.")
 
-        return FASTDMD(self.machine, self.dmd_connection.send)
+        return FASTDMD(self.machine, self.dmd_connection)
 
     @classmethod
     def get_coil_config_section(cls):
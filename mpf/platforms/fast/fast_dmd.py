@@ -6,10 +6,10 @@ class FASTDMD(DmdPlatformInterface):
 
     """Object for a FAST DMD."""
 
-    def __init__(self, machine, sender):
+    def __init__(self, machine, connection):
         """Initialise DMD."""
         self.machine = machine
-        self.send = sender
+        self.connection = connection
 
         # Clear the DMD
         # todo
@@ -20,4 +20,8 @@ class FASTDMD(DmdPlatformInterface):
         Args:
             data: bytes to send to DMD
         """
-        self.send(data)
+        self.connection.send(data)
+
+    def is_busy(self):
+        """Return true while the last frame has not been written to the serial port."""
+        return self.connection.is_busy()
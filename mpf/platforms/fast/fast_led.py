@@ -3,16 +3,26 @@ import logging
 
 from mpf.platforms.interfaces.rgb_led_platform_interface import RGBLEDPlatformInterface
 
+# two digit lower case hex string of every channel value
+HEX_TABLE = ["{:02x}".format(value) for value in range(256)]
+
 
 class FASTDirectLED(RGBLEDPlatformInterface):
 
     """Represents a single RGB LED connected to the Fast hardware platform."""
 
-    def __init__(self, number):
-        """Initialise LED."""
+    def __init__(self, number, dirty_leds):
+        """Initialise LED.
+
+        Args:
+            number: Hardware number of the LED.
+            dirty_leds: Set of LEDs which changed since the last update. The
+                LED adds itself when its color changes.
+        """
         self.log = logging.getLogger('FASTLED')
         self.number = number
         self._current_color = '000000'
+        self._dirty_leds = dirty_leds
 
         # All FAST LEDs are 3 element RGB and are set using hex strings
 
@@ -25,9 +35,10 @@ class FASTDirectLED(RGBLEDPlatformInterface):
         Args:
             color: an RGBColor object
         """
-        self._current_color = "{0}{1}{2}".format(hex(int(color[0]))[2:].zfill(2),
-                                                 hex(int(color[1]))[2:].zfill(2),
-                                                 hex(int(color[2]))[2:].zfill(2))
+        new_color = HEX_TABLE[int(color[0])] + HEX_TABLE[int(color[1])] + HEX_TABLE[int(color[2])]
+        if new_color != self._current_color:
+            self._current_color = new_color
+            self._dirty_leds.add(self)
 
     @property
     def current_color(self):
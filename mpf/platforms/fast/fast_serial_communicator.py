@@ -2,7 +2,7 @@
 import asyncio
 from distutils.version import StrictVersion
 
-from mpf.platforms.base_serial_communicator import BaseSerialCommunicator
+from mpf.platforms.base_serial_communicator import BaseSerialCommunicator, SeparatorFrameDecoder
 
 # Minimum firmware versions needed for this module
 from mpf.platforms.fast.fast_io_board import FastIoBoard
@@ -60,8 +60,6 @@ class FastSerialCommunicator(BaseSerialCommunicator):
         self.send_ready = asyncio.Event(loop=platform.machine.clock.loop)
         self.send_ready.set()
 
-        self.received_msg = b''
-
         self.send_queue = asyncio.Queue(loop=platform.machine.clock.loop)
 
         super().__init__(platform, port, baud)
@@ -209,6 +207,10 @@ class FastSerialCommunicator(BaseSerialCommunicator):
         """
         self.send_queue.put_nowait(msg)
 
+    def is_busy(self):
+        """Return true while messages wait in the send queue or in the write buffer."""
+        return not self.send_queue.empty() or super().is_busy()
+
     def _send(self, msg):
         debug = self.platform.config['debug']
         if self.dmd:
@@ -244,32 +246,24 @@ class FastSerialCommunicator(BaseSerialCommunicator):
 
             self._send(msg)
 
-    def _parse_msg(self, msg):
-        self.received_msg += msg
+    def _create_frame_decoder(self):
+        return SeparatorFrameDecoder(b'\r')
 
-        while True:
-            pos = self.received_msg.find(b'\r')
-
-            # no more complete messages
-            if pos == -1:
-                break
+    def _process_frame(self, frame):
+        if frame[:2] not in self.ignored_messages_in_flight:
 
-            msg = self.received_msg[:pos]
-            self.received_msg = self.received_msg[pos + 1:]
-
-            if msg[:2] not in self.ignored_messages_in_flight:
-
-                self.messages_in_flight -= 1
-                if self.messages_in_flight <= self.max_messages_in_flight:
-                    self.send_ready.set()
-                if self.messages_in_flight < 0:
-                    self.log.warning("Port %s received more messages than "
-                                     "were sent! Resetting!",
-                                     self.remote_processor)
-                    self.messages_in_flight = 0
+            self.messages_in_flight -= 1
+            if self.messages_in_flight <= self.max_messages_in_flight:
+                self.send_ready.set()
+            if self.messages_in_flight < 0:
+                self.log.warning("Port %s received more messages than "
+                                 "were sent! Resetting!",
+                                 self.remote_processor)
+                self.messages_in_flight = 0
 
-            if not msg:
-                continue
+        if not frame:
+            return
 
-            if msg.decode() not in self.ignored_messages:
-                self.platform.process_received_message(msg.decode())
+        msg = frame.decode()
+        if msg not in self.ignored_messages:
+            self.platform.process_received_message(msg)
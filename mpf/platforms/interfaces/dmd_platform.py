@@ -14,3 +14,23 @@ class DmdPlatformInterface(metaclass=abc.ABCMeta):
             data: bytes to send to DMD
         """
         raise NotImplementedError('implement')
+
+    def is_busy(self):
+        """Return true while the last frame is still being sent.
+
+        The output stage holds back new frames until the DMD is ready again.
+        """
+        return False
+
+    def update_encoded(self, message: bytes):
+        """Send a message of a frame encoder (see mpf.core.dmd_frame_encoder) to the DMD.
+
+        Args:
+            message: encoded frame
+        """
+        del message
+        raise AssertionError("This DMD does not support encoded frames.")
+
+    def is_desynced(self):
+        """Return true if the DMD requested a key frame since the last call."""
+        return False
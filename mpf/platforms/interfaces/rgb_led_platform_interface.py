@@ -22,3 +22,16 @@ class RGBLEDPlatformInterface(metaclass=abc.ABCMeta):
             None
         """
         raise NotImplementedError('color method must be defined to use this base class')
+
+    def color_from_buffer(self, channels):
+        """Set the LED to the channels in a slice of the frame buffer of the LED frame engine.
+
+        Platforms which can copy the bytes directly (e.g. into a preallocated
+        message) override this. By default the channels are passed to color()
+        as a list.
+
+        Args:
+            channels: memoryview with one byte per channel. It is only valid
+                during this call.
+        """
+        self.color(channels.tolist())
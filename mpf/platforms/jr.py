@@ -1,28 +1,32 @@
-"""Contains the hardware interface and drivers for the JR Pinball platform
-"""
+"""Contains the hardware interface and drivers for the JR Pinball platform.
+
+The JR controller is connected via a serial port. It sends a two byte frame
+for every switch change (``P`` + switch number when a switch is pressed and
+``R`` + switch number when it is released) and accepts the following
+commands:
 
+* ``P`` + drivers: pulse drivers
+* ``A`` + drivers: enable drivers
+* ``E`` + drivers: disable drivers
+* ``I`` + switch + drivers: pulse drivers when the switch is pressed
+
+Drivers are a 32 bit big endian bitmask with one bit per driver number.
+"""
+import asyncio
 import logging
-import time
-#import sys
-#import threading
-#import queue
-import traceback
-import io
-from serial.tools import list_ports
 import struct
 
 from mpf.core.platform import SwitchPlatform, DriverPlatform
+from mpf.platforms.base_serial_communicator import BaseSerialCommunicator, FrameDecoder
 from mpf.platforms.interfaces.driver_platform_interface import DriverPlatformInterface
+from mpf.platforms.interfaces.switch_platform_interface import SwitchPlatformInterface
 
-try:
-    import serial
-    serial_imported = True
-except ImportError:
-    serial_imported = False
-    serial = None
+DRIVER_MASK = struct.Struct('>I')
+SWITCH_RULE = struct.Struct('>BI')
 
 
 class HardwarePlatform(SwitchPlatform, DriverPlatform):
+
     """Platform class for the JR hardware controller.
 
     Args:
@@ -31,296 +35,216 @@ class HardwarePlatform(SwitchPlatform, DriverPlatform):
     """
 
     def __init__(self, machine):
+        """Initialise JR platform."""
         super(HardwarePlatform, self).__init__(machine)
-        self.log = logging.getLogger('JR Controler')
-        self.log.info("Configuring JR Controller")
-
-        if not serial_imported:
-            raise AssertionError('Could not import "pySerial". This is required for '
-                                 'the JR platform interface')
-
-            #self.features['max_pulse'] = 255  # todo
-        #self.features['hw_rule_coil_delay'] = False  # todo
-        #self.features['variable_recycle_time'] = False  # todo
-        #self.features['variable_debounce_time'] = False  # todo
-        # Make the platform features available to everyone
-        #self.machine.config['platform'] = self.features
-        # ----------------------------------------------------------------------
-
-        #self.hw_rules = dict()
-        #self.dmd_connection = None
-        #self.net_connection = None
-        #self.rgb_connection = None
-        #self.fast_nodes = list()
-        #self.connection_threads = set()
-        #self.receive_queue = queue.Queue()
-        #self.fast_leds = set()
-        #self.flag_led_tick_registered = False
-        #self.fast_io_boards = list()
-        #self.waiting_for_switch_data = False
-        self.config = None
-        #self.watchdog_command = None
-        #self.machine_type = None
-        self.hw_switch_data = {}
-
+        self.log = logging.getLogger('JR')
+        self.log.info("Configuring JR hardware.")
 
-        self.ser=None
+        self.features['tickless'] = True
 
+        self.config = None
+        self.serial_connection = None
+        self.hw_switch_data = {}
+        self.hw_rules = {}
 
     def initialize(self):
+        """Connect to the JR controller."""
         self.config = self.machine.config['jr']
         self.machine.config_validator.validate_config("jr", self.config)
 
-        #self.watchdog_command = 'WD:' + str(hex(self.config['watchdog']))[2:]
+        if not self.config['port']:
+            raise AssertionError("Please configure the serial port of the JR controller in jr:port")
 
-        print("JR : " + str(self.machine.config['hardware']))
-
-        self._connect_to_hardware()
+        self.serial_connection = JRSerialCommunicator(platform=self, port=self.config['port'],
+                                                      baud=self.config['baud'])
 
+    def stop(self):
+        """Close the connection."""
+        if self.serial_connection:
+            self.serial_connection.stop()
+            self.serial_connection = None
 
     def __repr__(self):
+        """Return string representation."""
         return '<Platform.JR>'
 
-    #def process_received_message(self, msg):
-    #    """Sends an incoming message from the FAST controller to the proper
-    #    method for servicing.
-    #    """
-    #    print("process_received_message TODO")
-    #    return
-
-    def _connect_to_hardware(self): # TODO have this in config files
-        liste_ports=list_ports.grep("usb")
-        for i in liste_ports:
-            print(i.serial_number)
-            if (i.serial_number=="853323130363516072E1"):
-                self.ser=serial.Serial(i.device)
-            if (i.serial_number=="854383638383517120C1"):
-                self.ser=serial.Serial(i.device)
-            if (i.serial_number=="85438303233351D0B121"):
-                self.ser=serial.Serial(i.device)
-    def _write(self,x):
-        if self.ser:
-            print("serv:"+str(x))
-            self.ser.write(x)
-        else:
-            self._connect_to_hardware()
-
-
-    def waitInterrupteurs(self):
-        res={}
-        if not self.ser:
-            print("Pas connecte!")
-            time.sleep(1)
-            return res
-        def readOnce():
-            x=self.ser.read(size=2)
-            if(x[:1]==b'P'): # bouton appuyé
-                numero=ord(x[1:])
-                res[numero]=True
-            if(x[:1]==b'R'): # bouton relaché
-                numero=ord(x[1:])
-                res[numero]=False
-            print(repr(x))
-            print("RES:"+str(res))
-        #readOnce()
-        while(self.ser.in_waiting>=2):
-            readOnce()
-        return res
+    def process_switch_frame(self, frame):
+        """Process a switch change received from the controller.
+
+        Args:
+            frame: Two bytes. ``P`` or ``R`` followed by the switch number.
+        """
+        number = frame[1]
+        state = 1 if frame[0] == ord('P') else 0
+
+        if number in self.hw_switch_data:
+            self.hw_switch_data[number].state = state
+
+        self.machine.switch_controller.process_switch_by_num(num=number, state=state, platform=self)
 
+    def send(self, cmd):
+        """Queue a command for the controller.
 
+        Args:
+            cmd: Bytes of the command.
+        """
+        self.serial_connection.queue_command(cmd)
 
     def get_hw_switch_states(self):
-        print("GET HW STATES")
-        new_states=self.waitInterrupteurs()
-        for numero, etat in new_states.items():
-            self.hw_switch_data[numero].state=etat
-        return {x.numero : x.state for x in self.hw_switch_data.values()}
+        """Return the state of all switches.
 
-    def set_pulse_on_hit_and_enable_and_release_and_disable_rule(self, enable_switch, disable_switch, coil):
-        """Set pulse on hit and enable and release and disable rule on driver."""
-        print("SET PULSE ON HIT AND RELEASE AND DISABLE" + str(enable_switch) + str(coil))
-        pass
-    def set_pulse_on_hit_and_enable_and_release_rule(self, enable_switch, coil):
-        """Set pulse on hit and enable and relase rule on driver."""
-        print("SET PULSE ON HIT AND ENABLE AND RELEASE" + str(enable_switch) + str(coil))
-        #TODO
-        pass
-    
-    def set_pulse_on_hit_and_release_rule(self, enable_switch, coil):
-        """Set pulse on hit and release rule to driver."""
-        print("SET PULSE ON HIT AND RELEASE" + str(enable_switch) + str(coil))
-        #TODO
-        pass
+        The controller only reports changes so all switches start inactive.
+        """
+        return {number: switch.state for number, switch in self.hw_switch_data.items()}
+
+    def configure_switch(self, config):
+        """Configure a switch on the JR controller."""
+        switch = JRSwitch(config)
+        self.hw_switch_data[switch.number] = switch
+        return switch
+
+    def configure_driver(self, config):
+        """Configure a driver on the JR controller."""
+        return JRDriver(self, config)
+
+    def _write_hw_rule(self, switch_number):
+        self.send(b'I' + SWITCH_RULE.pack(switch_number, self.hw_rules.get(switch_number, 0)))
 
     def set_pulse_on_hit_rule(self, enable_switch, coil):
-        """Set pulse on hit rule on driver."""
-        print("SET PULSE ON HIT" + str(enable_switch) + str(coil))
-        drivers=(1<<int(coil.number))
-        self._write(b"I")
-        self._write(struct.pack("b",int(enable_switch.number)))
-        self._write(struct.pack(">i",drivers))
-    def stop(self):
-        #TODO
-        pass
+        """Pulse the driver when the switch is pressed."""
+        switch_number = enable_switch.hw_switch.number
+        self.hw_rules[switch_number] = self.hw_rules.get(switch_number, 0) | coil.hw_driver.mask
+        self._write_hw_rule(switch_number)
+
+    def set_pulse_on_hit_and_release_rule(self, enable_switch, coil):
+        """Not supported by the JR controller."""
+        self.log.warning("The JR controller only supports pulse on hit rules. Switch: %s, Coil: %s",
+                         enable_switch.name, coil.name)
 
+    def set_pulse_on_hit_and_enable_and_release_rule(self, enable_switch, coil):
+        """Not supported by the JR controller."""
+        self.log.warning("The JR controller only supports pulse on hit rules. Switch: %s, Coil: %s",
+                         enable_switch.name, coil.name)
 
-    #def receive_nw_open(self, msg):
-    #    self.machine.switch_controller.process_switch_by_num(state=0,
-    #                                                         num=(msg, 1))
+    def set_pulse_on_hit_and_enable_and_release_and_disable_rule(self, enable_switch, disable_switch, coil):
+        """Not supported by the JR controller."""
+        del disable_switch
+        self.log.warning("The JR controller only supports pulse on hit rules. Switch: %s, Coil: %s",
+                         enable_switch.name, coil.name)
 
-    #def receive_nw_closed(self, msg):
-    #    self.machine.switch_controller.process_switch_by_num(state=1,
-    #                                                         num=(msg, 1))
+    def clear_hw_rule(self, switch, coil):
+        """Remove the driver from the rule of the switch."""
+        switch_number = switch.hw_switch.number
+        drivers = self.hw_rules.get(switch_number, 0)
+        if not drivers & coil.hw_driver.mask:
+            return False
 
-    #def receive_local_open(self, msg):
-    #    self.machine.switch_controller.process_switch_by_num(state=0,
-    #                                                         num=(msg, 0))
+        self.hw_rules[switch_number] = drivers & ~coil.hw_driver.mask
+        self._write_hw_rule(switch_number)
+        return True
 
-    #def receive_local_closed(self, msg):
-    #    self.machine.switch_controller.process_switch_by_num(state=1,
-    #                                                         num=(msg, 0))
 
-    # def receive_sa(self, msg):
-    #    print("receive SA")
-    #    return 
+class JRFrameDecoder(FrameDecoder):
 
-    def configure_driver(self, config, device_type='coil'):
-        print("Configure driver" + str(config))
-        return JRDriver(self,config)
+    """Decoder for the two byte switch frames of the JR controller.
 
-    def configure_switch(self, config):
-        """Configures the switch object  for a JR controller
-        """
-        print("Configure switch" + str(config) )
-        switch=JRSwitch(config)
-        self.hw_switch_data[config["number"]]=switch
-        return switch 
-
-    def tick(self, dt):
-       etats_inter=self.waitInterrupteurs()
-       for num, etat in etats_inter.items():
-           print("NUM:"+str(num))
-           self.machine.switch_controller.process_switch_by_num( str(num),state=etat)
-    
-    def write_hw_rule(self, switch_obj, sw_activity, driver_obj, driver_action,
-                      disable_on_release=True, drive_now=False,
-                      **driver_settings_overrides):
-        """Used to write (or update) a hardware rule to the JR controller.
-
-        *Hardware Rules* are used to configure the hardware controller to
-        automatically change driver states based on switch changes. These rules
-        are completely handled by the hardware (i.e. with no interaction from
-        the Python game code). They're used for things that you want to happen
-        fast, like firing coils when flipper buttons are pushed, slingshots, pop
-        bumpers, etc.
-
-        You can overwrite existing hardware rules at any time to change or
-        remove them.
+    Bytes which cannot start a frame are skipped.
+    """
 
-        Args:
-            switch_obj: Which switch you're creating this rule for. The
-                parameter is a reference to the switch object itself.
-            sw_activity: Int which specifies whether this coil should fire when
-                the switch becomes active (1) or inactive (0)
-            driver_obj: Driver object this rule is being set for.
-            driver_action: String 'pulse' or 'hold' which describe what action
-                will be applied to this driver
-            drive_now: Should the hardware check the state of the switches when
-                this rule is first applied, and fire the coils if they should
-                be? Typically this is True, especially with flippers because you
-                want them to fire if the player is holding in the buttons when
-                the machine enables the flippers (which is done via several
-                calls to this method.)
+    def _decode(self, buffer):
+        while len(buffer) - self.position >= 2:
+            if buffer[self.position] not in b'PR':
+                self.position += 1
+                continue
 
-        """
-        # Si on voulait envoyer plusieurs drivers .. 
-        #res=0
-        #for drive in self.drivers:
-        #   res+=(1<<drive.numero)
-        drivers=(1<<int(driver_obj.number))
-        self._write(b"I")
-        self._write(struct.pack("b",int(switch_obj.number)))
-        self._write(struct.pack(">i",drivers))
-
-        print("write_hw_rule"+str(switch_obj.config)+str(driver_obj.config) )
-        return
-
-    def clear_hw_rule(self, sw_name):
-        """Clears a hardware rule.
-
-        This is used if you want to remove the linkage between a switch and
-        some driver activity. For example, if you wanted to disable your
-        flippers (so that a player pushing the flipper buttons wouldn't cause
-        the flippers to flip), you'd call this method with your flipper button
-        as the *sw_num*.
+            frame = bytes(buffer[self.position:self.position + 2])
+            self.position += 2
+            yield frame
 
-        Args:
-            sw_name: The string name of the switch whose rule you want to clear.
 
+class JRSerialCommunicator(BaseSerialCommunicator):
+
+    """Serial connection to the JR controller.
+
+    All commands of one loop iteration are sent in one write.
+    """
+
+    def __init__(self, platform, port, baud):
+        """Initialise serial connection to the JR controller."""
+        self._commands = []
+        self._write_scheduled = False
+        super().__init__(platform, port, baud)
+
+    @asyncio.coroutine
+    def _identify_connection(self):
+        """The controller has no handshake. Switch frames will be processed by the reader."""
+        self.log.info("Connected to JR controller on %s", self.port)
+
+    def _create_frame_decoder(self):
+        return JRFrameDecoder()
+
+    def _process_frame(self, frame):
+        self.platform.process_switch_frame(frame)
+
+    def queue_command(self, cmd):
+        """Send a command with the next write.
+
+        Args:
+            cmd: Bytes of the command.
         """
-        print("TODO TODO Clear hw_rule"+str(sw_name))  # TODO
-        return
+        self._commands.append(cmd)
+        if not self._write_scheduled:
+            self._write_scheduled = True
+            self.machine.clock.loop.call_soon(self._send_commands)
+
+    def _send_commands(self):
+        self._write_scheduled = False
+        commands = self._commands
+        self._commands = []
+        if commands:
+            self.send(b''.join(commands))
 
 
-class JRSwitch(object):
+class JRSwitch(SwitchPlatformInterface):
+
+    """A switch connected to the JR controller."""
 
     def __init__(self, config):
-        self.config=config
-        self.numero=int(config["number"])
-        self.number=int(config["number"])
+        """Initialise switch."""
+        super().__init__(config, int(config['number']))
+        self.state = 0
 
-        self.state=False
 
 class JRDriver(DriverPlatformInterface):
-    """Base class for drivers connected to a JR Controller.
 
-    """
+    """A driver connected to the JR controller."""
 
     def __init__(self, platform, config):
-        """
-        """
-        self.config=config
-        self.numero=int(config["number"])
-        self.platform=platform
-        self.driver_settings={"pulse_ms":3,'pwm1' :'ff','pwm2':'ff','recycle_ms':'00'}
-        self.number=int(config["number"])
+        """Initialise driver."""
+        super().__init__(config, int(config['number']))
+        self.platform = platform
+        self.mask = 1 << self.number
+        self._mask_bytes = DRIVER_MASK.pack(self.mask)
 
-    def reset(self):
-        """
-
-        Resets a driver
-
-        """
-        print("RESET")
-
-
-    def disable(self):
-        """Disables (turns off) this driver. """
-        print("DISABLE" + str(self.config))
-        platform._write(b"E")
-        res=0
-        res+=1<<self.config["numero"]
-        platform._write(struct.pack(">i",res))
-        return
-
-    def enable(self):
-        """Enables (turns on) this driver. """
-        print("ENABLE" + str(self.config))
-        platform._write(b"A")
-        res=0
-        res+=1<<self.config["numero"]
-        platform._write(struct.pack(">i",res))
-        return
-    def pulse(self, milliseconds=None):
-        """Pulses this driver. """
-        print("PULSE" + str(self.config))
-        self.platform._write(b"P")
-        res=0
-        res+=1<<int(self.config["number"])
-        self.platform._write(struct.pack(">i",res))
-        return 3
     def get_board_name(self):
         """Return the name of the board of this driver."""
-        return "une seule carte"
+        return "JR"
 
+    def disable(self, coil):
+        """Disable (turn off) this driver."""
+        del coil
+        self.platform.send(b'E' + self._mask_bytes)
 
+    def enable(self, coil):
+        """Enable (turn on) this driver."""
+        del coil
+        self.platform.send(b'A' + self._mask_bytes)
+
+    def pulse(self, coil, milliseconds):
+        """Pulse this driver.
+
+        The pulse time is configured in the controller.
+        """
+        del coil
+        self.platform.send(b'P' + self._mask_bytes)
+        return milliseconds
@@ -5,10 +5,14 @@ https://github.com/zestyping/openpixelcontrol/blob/master/python_clients/opc.py
 """
 
 import logging
+import struct
 
 from mpf.core.platform import LedPlatform
 from mpf.platforms.interfaces.rgb_led_platform_interface import RGBLEDPlatformInterface
 
+# channel, command and length of the data
+OPC_HEADER = struct.Struct('!BBH')
+
 
 class HardwarePlatform(LedPlatform):
 
@@ -95,11 +99,25 @@ class OpenPixelLED(RGBLEDPlatformInterface):
             self.log.debug("Setting color: %s", color)
         self.opc_client.set_pixel_color(self.channel, self.led, color)
 
+    def color_from_buffer(self, channels):
+        """Copy the channels of the led from the frame buffer into the OPC message.
+
+        Args:
+            channels: memoryview with one byte per channel
+        """
+        if self.debug:
+            self.log.debug("Setting color: %s", channels.tolist())
+        self.opc_client.set_pixel_color(self.channel, self.led, channels)
+
 
 class OpenPixelClient(object):
 
     """Base class of an OPC client which connects to a FadeCandy server.
 
+    Every channel has one preallocated OPC message (header and pixel data)
+    which is updated in place when a pixel changes. Only channels with
+    changed pixels are sent and all of them go out in one write.
+
     Args:
         machine: The main ``MachineController`` instance.
         config: Config to use
@@ -110,10 +128,10 @@ class OpenPixelClient(object):
         self.log = logging.getLogger('OpenPixelClient')
 
         self.machine = machine
-        self.dirty = True
         self.update_every_tick = False
         self.socket_sender = None
         self.channels = list()
+        self.dirty_channels = set()
 
         connector = self.machine.clock.open_connection(config['host'], config['port'])
         _, self.socket_sender = self.machine.clock.loop.run_until_complete(connector)
@@ -136,15 +154,16 @@ class OpenPixelClient(object):
         """
         if len(self.channels) < channel + 1:
 
-            channels_to_add = channel + 1 - len(self.channels)
-
-            self.channels += [list() for _ in range(channels_to_add)]
+            for channel_index in range(len(self.channels), channel + 1):
+                self.channels.append(bytearray(OPC_HEADER.pack(channel_index, 0, 0)))
 
-        if len(self.channels[channel]) < led + 1:
+        message = self.channels[channel]
+        if len(message) < OPC_HEADER.size + (led + 1) * 3:
 
-            leds_to_add = led + 1 - len(self.channels[channel])
+            message.extend(bytes(OPC_HEADER.size + (led + 1) * 3 - len(message)))
+            OPC_HEADER.pack_into(message, 0, channel, 0, len(message) - OPC_HEADER.size)
 
-            self.channels[channel] += [(0, 0, 0) for _ in range(leds_to_add)]
+        self.dirty_channels.add(channel)
 
     def set_pixel_color(self, channel, pixel, color):
         """Set an invidual pixel color.
@@ -152,11 +171,16 @@ class OpenPixelClient(object):
         Args:
             channel: Int of the OPC channel for this pixel.
             pixel: Int of the number for this pixel on that channel.
-            color: 3-item list or tuple of (red, green, blue) color values, each
-                an integer between 0-255.
+            color: 3-item list, tuple or buffer of (red, green, blue) color
+                values, each an integer between 0-255.
         """
-        self.channels[channel][pixel] = color
-        self.dirty = True
+        position = OPC_HEADER.size + pixel * 3
+        try:
+            self.channels[channel][position:position + 3] = color
+        except (ValueError, TypeError):
+            self.channels[channel][position:position + 3] = [min(255, max(0, int(value))) for value in color]
+
+        self.dirty_channels.add(channel)
 
     def tick(self, dt):
         """Called once per machine loop to update the pixels.
@@ -165,11 +189,12 @@ class OpenPixelClient(object):
             dt: time since last update
         """
         del dt
-        if self.update_every_tick or self.dirty:
-            for channel_index, pixel_list in enumerate(self.channels):
-                self.update_pixels(pixel_list, channel_index)
+        if self.update_every_tick:
+            self.send(b''.join(self.channels))
+        elif self.dirty_channels:
+            self.send(b''.join(self.channels[channel] for channel in sorted(self.dirty_channels)))
 
-            self.dirty = False
+        self.dirty_channels.clear()
 
     def update_pixels(self, pixels, channel=0):
         """Send the list of pixel colors to the OPC server.
@@ -181,28 +206,15 @@ class OpenPixelClient(object):
                 pixel on the channel, the second item is the second one, etc.
             channel: Which OPC channel the pixel data will be written to.
 
-        Returns:
-            True on success. False if it was unable to connect to the OPC
-            server.
-
         Note that you must send color data for all the pixels in a channel (or
         all the pixels up until the point you want. e.g. if you have 30 LEDs on
         the channel and you just want to update LED #10, then you need to send
         pixel data for the first 10 pixels.)
         """
         # Build the OPC message
-        msg = bytearray()
-        len_hi_byte = int(len(pixels) * 3 / 256)
-        len_lo_byte = (len(pixels) * 3) % 256
-        header = bytes([channel, 0, len_hi_byte, len_lo_byte])
-        msg.extend(header)
-        for r, g, b in pixels:
-            r = min(255, max(0, int(r)))
-            g = min(255, max(0, int(g)))
-            b = min(255, max(0, int(b)))
-            msg.append(r)
-            msg.append(g)
-            msg.append(b)
+        msg = bytearray(OPC_HEADER.pack(channel, 0, len(pixels) * 3))
+        for pixel in pixels:
+            msg.extend(min(255, max(0, int(value))) for value in pixel)
         self.send(bytes(msg))
 
     def send(self, message):
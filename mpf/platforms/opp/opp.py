@@ -7,7 +7,7 @@ boards.
 import logging
 import asyncio
 
-from mpf.platforms.base_serial_communicator import BaseSerialCommunicator
+from mpf.platforms.base_serial_communicator import BaseSerialCommunicator, FrameDecoder
 
 from mpf.platforms.opp.opp_coil import OPPSolenoidCard
 from mpf.platforms.opp.opp_incand import OPPIncandCard
@@ -16,6 +16,7 @@ from mpf.platforms.opp.opp_switch import OPPInputCard
 from mpf.platforms.opp.opp_rs232_intf import OppRs232Intf
 from mpf.devices.driver import ConfiguredHwDriver
 from mpf.core.platform import MatrixLightsPlatform, LedPlatform, SwitchPlatform, DriverPlatform
+from mpf.core.switch_snapshot import SwitchStateSnapshot
 
 # Minimum firmware versions needed for this module
 MIN_FW = 0x00000100
@@ -55,8 +56,7 @@ class HardwarePlatform(MatrixLightsPlatform, LedPlatform, SwitchPlatform, Driver
         self.gen2AddrArr = []
         self.badCRC = 0
         self.minVersion = 0xffffffff
-        self._poll_task = None
-        self._light_update_task = None
+        self._poll_tasks = []
 
         self.features['tickless'] = True
 
@@ -87,16 +87,15 @@ class HardwarePlatform(MatrixLightsPlatform, LedPlatform, SwitchPlatform, Driver
         """Initialise connections to OPP hardware."""
         self._connect_to_hardware()
         self.opp_commands[ord(OppRs232Intf.READ_GEN2_INP_CMD)] = self.read_gen2_inp_resp
-        self._poll_task = self.machine.clock.loop.create_task(self._poll_sender())
-        self._poll_task.add_done_callback(self._done)
+        for chain_serial in self.read_input_msg:
+            poll_task = self.machine.clock.loop.create_task(self.opp_connection[chain_serial].poll_inputs())
+            poll_task.add_done_callback(self._done)
+            self._poll_tasks.append(poll_task)
 
     def stop(self):
         """Stop hardware and close connections."""
-        if self._poll_task:
-            self._poll_task.cancel()
-
-        if self._light_update_task:
-            self._light_update_task.cancel()
+        for poll_task in self._poll_tasks:
+            poll_task.cancel()
 
         for connections in self.serial_connections:
             connections.stop()
@@ -160,47 +159,31 @@ class HardwarePlatform(MatrixLightsPlatform, LedPlatform, SwitchPlatform, Driver
     def send_to_processor(self, chain_serial, msg):
         """Send message to processor with specific serial number.
 
+        Commands which are queued for the next frame of the chain are sent
+        first.
+
         Args:
             chain_serial: Serial of the processor.
             msg: Message to send.
         """
         self.opp_connection[chain_serial].send(msg)
 
-    def update_incand(self):
-        """Update all the incandescents connected to OPP hardware.
-
-        This is done once per game loop if changes have been made.
-
-        It is currently assumed that the oversampling will guarantee proper communication
-        with the boards.  If this does not end up being the case, this will be changed
-        to update all the incandescents each loop.
-
-        Note:  This could be made much more efficient by supporting a command
-        that simply sets the state of all 32 of the LEDs as either on or off.
-        """
-        for incand in self.opp_incands:
-            whole_msg = bytearray()
-            # Check if any changes have been made
-            if (incand.oldState ^ incand.newState) != 0:
-                # Update card
-                incand.oldState = incand.newState
-                msg = bytearray()
-                msg.append(incand.addr)
-                msg.extend(OppRs232Intf.INCAND_CMD)
-                msg.extend(OppRs232Intf.INCAND_SET_ON_OFF)
-                msg.append((incand.newState >> 24) & 0xff)
-                msg.append((incand.newState >> 16) & 0xff)
-                msg.append((incand.newState >> 8) & 0xff)
-                msg.append(incand.newState & 0xff)
-                msg.extend(OppRs232Intf.calc_crc8_whole_msg(msg))
-                whole_msg.extend(msg)
-
-            if len(whole_msg) != 0:
-                whole_msg.extend(OppRs232Intf.EOM_CMD)
-                send_cmd = bytes(whole_msg)
-
-                self.send_to_processor(incand.chain_serial, send_cmd)
-                self.log.debug("Update incand cmd:%s", "".join(" 0x%02x" % b for b in send_cmd))
+    def queue_to_processor(self, chain_serial, msg):
+        """Send a command with the next frame of a chain.
+
+        Args:
+            chain_serial: Serial of the processor.
+            msg: Command without EOM.
+        """
+        self.opp_connection[chain_serial].queue_command(msg)
+
+    def update_card(self, card):
+        """Add the update commands of a card to the next frame of its chain.
+
+        Args:
+            card: Card with a get_update_commands() method.
+        """
+        self.opp_connection[card.chain_serial].update_card(card)
 
     @classmethod
     def get_coil_config_section(cls):
@@ -221,6 +204,19 @@ class HardwarePlatform(MatrixLightsPlatform, LedPlatform, SwitchPlatform, Driver
                 curr_bit <<= 1
         return hw_states
 
+    def get_hw_switch_snapshot(self):
+        """Get initial hardware switch states with one bank per input card."""
+        snapshot = SwitchStateSnapshot()
+        for opp_inp in self.opp_inputs:
+            # inputs read 0 when they are active
+            snapshot.set_bank(opp_inp.chain_serial + '-' + opp_inp.cardNum, ~opp_inp.oldState, opp_inp.mask)
+        return snapshot
+
+    def get_switch_position(self, number):
+        """Return card and index of an input."""
+        card, index = number.rsplit('-', 1)
+        return card, int(index)
+
     def inv_resp(self, chain_serial, msg):
         """Parse inventory response.
 
@@ -268,7 +264,7 @@ class HardwarePlatform(MatrixLightsPlatform, LedPlatform, SwitchPlatform, Driver
                 has_neo = True
             wing_index += 1
         if incand_mask != 0:
-            self.opp_incands.append(OPPIncandCard(chain_serial, msg[0], incand_mask, self.incandDict))
+            self.opp_incands.append(OPPIncandCard(chain_serial, msg[0], incand_mask, self.incandDict, self))
         if sol_mask != 0:
             self.opp_solenoid.append(
                 OPPSolenoidCard(chain_serial, msg[0], sol_mask, self.solDict, self))
@@ -409,12 +405,14 @@ class HardwarePlatform(MatrixLightsPlatform, LedPlatform, SwitchPlatform, Driver
         if len(msg) < 6:
             self.log.warning("Msg too shortC: %s.", "".join(" 0x%02x" % b for b in msg))
             self.opp_connection[chain_serial].lost_synch()
+            self.opp_connection[chain_serial].input_reply_failed()
             return
 
         crc8 = OppRs232Intf.calc_crc8_part_msg(msg, 0, 6)
         if msg[6] != ord(crc8):
             self.badCRC += 1
             self.log.warning("Msg contains bad CRC:%s.", "".join(" 0x%02x" % b for b in msg))
+            self.opp_connection[chain_serial].input_reply_failed()
         else:
             opp_inp = self.inpAddrDict[chain_serial + '-' + str(msg[0])]
             new_state = (msg[2] << 24) | \
@@ -424,6 +422,7 @@ class HardwarePlatform(MatrixLightsPlatform, LedPlatform, SwitchPlatform, Driver
 
             # Update the state which holds inputs that are active
             changes = opp_inp.oldState ^ new_state
+            self.opp_connection[chain_serial].inputs_received(changes != 0)
             if changes != 0:
                 curr_bit = 1
                 for index in range(0, 32):
@@ -477,11 +476,10 @@ class HardwarePlatform(MatrixLightsPlatform, LedPlatform, SwitchPlatform, Driver
         msg.append(pulse_len)
         msg.append(hold + (minimum_off << 4))
         msg.extend(OppRs232Intf.calc_crc8_whole_msg(msg))
-        msg.extend(OppRs232Intf.EOM_CMD)
         final_cmd = bytes(msg)
 
         self.log.debug("Writing individual config: %s", "".join(" 0x%02x" % b for b in final_cmd))
-        self.send_to_processor(driver.hw_driver.solCard.chain_serial, final_cmd)
+        self.queue_to_processor(driver.hw_driver.solCard.chain_serial, final_cmd)
 
     def _get_dict_index(self, input_str):
         try:
@@ -597,9 +595,6 @@ class HardwarePlatform(MatrixLightsPlatform, LedPlatform, SwitchPlatform, Driver
                                  "light (incand board), with number %s "
                                  "which doesn't exist", number)
 
-        if not self._light_update_task:
-            self._light_update_task = self.machine.clock.loop.create_task(self._update_lights())
-            self._light_update_task.add_done_callback(self._done)
         return self.incandDict[number]
 
     @staticmethod
@@ -610,25 +605,26 @@ class HardwarePlatform(MatrixLightsPlatform, LedPlatform, SwitchPlatform, Driver
         """
         future.result()
 
-    @asyncio.coroutine
-    def _poll_sender(self):
-        """Poll switches."""
-        while True:
-            for chain_serial in self.read_input_msg:
-                self.send_to_processor(chain_serial, self.read_input_msg[chain_serial])
-                yield from self.opp_connection[chain_serial].writer.drain()
-                # the line above saturates the link and seems to overhelm the hardware. limit it to 100Hz
-                yield from asyncio.sleep(.01, loop=self.machine.clock.loop)
+    def get_poll_stats(self):
+        """Return switch poll statistics of all chains.
 
-    @asyncio.coroutine
-    def _update_lights(self):
-        """Update matrix lights."""
-        while True:
-            self.update_incand()
-            for connection in self.opp_connection.values():
-                yield from connection.writer.drain()
-            # limit to 50Hz
-            yield from asyncio.sleep(.02, loop=self.machine.clock.loop)
+        Returns a dict with an entry per chain which contains the number of
+        polls, the current poll rate in Hz, the last and maximum round trip
+        time in seconds and the number of replies which arrived after their
+        poll timed out.
+        """
+        stats = {}
+        for chain_serial in self.read_input_msg:
+            connection = self.opp_connection[chain_serial]
+            stats[chain_serial] = {
+                "polls": connection.poll_count,
+                "poll_rate": connection.poll_rate,
+                "rtt": connection.poll_rtt,
+                "max_rtt": connection.poll_max_rtt,
+                "late_replies": connection.late_replies
+            }
+
+        return stats
 
     @classmethod
     def _verify_coil_and_switch_fit(cls, switch, coil):
@@ -745,6 +741,59 @@ class HardwarePlatform(MatrixLightsPlatform, LedPlatform, SwitchPlatform, Driver
         self.reconfigure_driver(coil, not coil.hw_driver.can_be_pulsed)
 
 
+class OppFrameDecoder(FrameDecoder):
+
+    """Decoder for the 7 byte input responses (address, command, 4 data bytes, CRC8) of an OPP chain.
+
+    EOM bytes between responses are skipped. After garbage the decoder skips
+    bytes until it finds the next card address and calls
+    lost_synch_callback because responses may have been dropped. The CRC8 is
+    verified when the response is processed.
+    """
+
+    def __init__(self, lost_synch_callback=None):
+        """Initialise decoder."""
+        super().__init__()
+        self.lost_synch = False
+        self._lost_synch_callback = lost_synch_callback
+
+    def _start_synch(self):
+        self.lost_synch = True
+        if self._lost_synch_callback:
+            self._lost_synch_callback()
+
+    def _decode(self, buffer):
+        length = len(buffer)
+        while self.position < length:
+            if self.lost_synch:
+                if (buffer[self.position] & 0xe0) != 0x20:
+                    self.position += 1
+                    continue
+                self.lost_synch = False
+
+            # Check if this is a gen2 card address
+            if (buffer[self.position] & 0xe0) == 0x20:
+                if length - self.position < 7:
+                    return
+
+                # Only command expect to receive back is
+                if buffer[self.position + 1] == ord(OppRs232Intf.READ_GEN2_INP_CMD):
+                    frame = bytes(buffer[self.position:self.position + 7])
+                    self.position += 7
+                    yield frame
+                else:
+                    # Lost synch
+                    self.position += 2
+                    self._start_synch()
+
+            elif buffer[self.position] == ord(OppRs232Intf.EOM_CMD):
+                self.position += 1
+            else:
+                # Lost synch
+                self.position += 1
+                self._start_synch()
+
+
 class OPPSerialCommunicator(BaseSerialCommunicator):
 
     """Manages a Serial connection to the first processor in a OPP serial chain."""
@@ -752,9 +801,24 @@ class OPPSerialCommunicator(BaseSerialCommunicator):
     # pylint: disable=too-many-arguments
     def __init__(self, platform: HardwarePlatform, port, baud):
         """Initialise Serial Connection to OPP Hardware."""
-        self.partMsg = b""
         self.chain_serial = None
-        self._lost_synch = False
+
+        # switch polling
+        self.poll_count = 0
+        self.poll_rate = 0.0
+        self.poll_rtt = 0.0
+        self.poll_max_rtt = 0.0
+        self.late_replies = 0
+        self._inputs_pending = 0
+        self._poll_failed = False
+        self._repoll = False
+        self._last_input_change = 0
+        self._inputs_done = asyncio.Event(loop=platform.machine.clock.loop)
+
+        # commands and cards for the next frame
+        self._frame_commands = []
+        self._dirty_cards = []
+        self._frame_scheduled = False
 
         super().__init__(platform, port, baud)
 
@@ -819,12 +883,15 @@ class OPPSerialCommunicator(BaseSerialCommunicator):
                                  format(self._create_vers_str(MIN_FW),
                                         self._create_vers_str(self.platform.minVersion)))
 
-        # get initial value for inputs
+        # get initial value for inputs. bytes which were read after the last
+        # response are already in the buffer of the frame decoder so all
+        # input responses are consumed through the decoder only
         self.writer.write(self.platform.read_input_msg[self.chain_serial])
-        while True:
-            resp = yield from self.readuntil(b'\xff', 6)
-            if self._parse_msg(resp):
-                break
+        data = b''
+        while not self._parse_msg(data):
+            data = yield from self.reader.read(self.read_size)
+            if not data:
+                raise asyncio.IncompleteReadError(bytes(self.frame_decoder.buffer), None)
 
         self.platform.register_processor_connection(self.chain_serial, self)
 
@@ -876,45 +943,177 @@ class OPPSerialCommunicator(BaseSerialCommunicator):
                                          ((version_int >> 16) & 0xff), ((version_int >> 8) & 0xff),
                                          (version_int & 0xff)))
 
-    def lost_synch(self):
-        """Mark connection as desynchronised."""
-        self._lost_synch = True
-
-    def _parse_msg(self, msg):
-        self.partMsg += msg
-        strlen = len(self.partMsg)
-        messaged_found = 0
-        # Split into individual responses
-        while strlen >= 7:
-            if self._lost_synch:
-                while strlen > 0:
-                    if (self.partMsg[0] & 0xe0) == 0x20:
-                        self._lost_synch = False
-                        break
-                    self.partMsg = self.partMsg[1:]
-                    strlen -= 1
+    def _create_frame_decoder(self):
+        return OppFrameDecoder(self._replies_dropped)
 
-            # Check if this is a gen2 card address
-            if (self.partMsg[0] & 0xe0) == 0x20:
-                # Only command expect to receive back is
-                if self.partMsg[1] == ord(OppRs232Intf.READ_GEN2_INP_CMD):
-                    self.platform.process_received_message(self.chain_serial, self.partMsg[:7])
-                    messaged_found += 1
-                    self.partMsg = self.partMsg[7:]
-                    strlen -= 7
-                else:
-                    # Lost synch
-                    self.partMsg = self.partMsg[2:]
-                    strlen -= 2
-                    self._lost_synch = True
+    def send(self, msg):
+        """Send the pending frame and a message to the chain.
+
+        Args:
+            msg: Bytes of the message you want to send.
+        """
+        if self._frame_commands or self._dirty_cards:
+            self.send_frame()
+
+        super().send(msg)
+
+    def queue_command(self, cmd):
+        """Add a command to the next frame.
+
+        Args:
+            cmd: Command without EOM.
+        """
+        self._frame_commands.append(cmd)
+        self._schedule_frame()
+
+    def update_card(self, card):
+        """Add the update commands of a card to the next frame.
+
+        Args:
+            card: Card with a get_update_commands() method.
+        """
+        if card not in self._dirty_cards:
+            self._dirty_cards.append(card)
+        self._schedule_frame()
+
+    def _schedule_frame(self):
+        if not self._frame_scheduled:
+            self._frame_scheduled = True
+            self.machine.clock.loop.call_soon(self.send_frame)
+
+    def send_frame(self):
+        """Send all commands of this tick in one write."""
+        self._frame_scheduled = False
+        commands = self._frame_commands
+        for card in self._dirty_cards:
+            commands.extend(card.get_update_commands())
+
+        self._frame_commands = []
+        self._dirty_cards = []
+        if not commands:
+            return
+
+        commands.append(OppRs232Intf.EOM_CMD)
+        super().send(b''.join(commands))
+
+    def inputs_received(self, changed):
+        """Handle an input response of a card in this chain.
+
+        Args:
+            changed: True if any input of the card changed.
+        """
+        if changed:
+            self._last_input_change = self.machine.clock.get_time()
+
+        self._count_reply()
+
+    def input_reply_failed(self):
+        """Handle an input response which was too short or had a bad CRC.
+
+        The response still counts for the running poll. The inputs of the card
+        are unknown so the next poll is sent right away.
+        """
+        self._repoll = True
+        self._count_reply()
+
+    def _replies_dropped(self):
+        """End the running poll after the decoder dropped garbage.
 
-            elif self.partMsg[0] == ord(OppRs232Intf.EOM_CMD):
-                self.partMsg = self.partMsg[1:]
-                strlen -= 1
+        It is unknown how many responses were lost so the poll cannot
+        complete. Remaining responses are counted as late replies.
+        """
+        if not self._inputs_pending:
+            return
+
+        self._inputs_pending = 0
+        self._poll_failed = True
+        self._repoll = True
+        self._inputs_done.set()
+
+    def _count_reply(self):
+        if self._inputs_pending:
+            self._inputs_pending -= 1
+            if not self._inputs_pending:
+                self._inputs_done.set()
+        else:
+            # reply to a poll which timed out or failed. the inputs are still valid
+            self.late_replies += 1
+
+    def _get_next_poll_interval(self, interval):
+        """Poll at full rate while inputs change and back off when they are idle."""
+        config = self.platform.config
+        if self.machine.clock.get_time() - self._last_input_change < config['poll_active_time'] / 1000:
+            return config['poll_active_interval'] / 1000
+
+        return min(interval * 2, config['poll_idle_interval'] / 1000)
+
+    @asyncio.coroutine
+    def poll_inputs(self):
+        """Poll all inputs of this chain.
+
+        There is at most one poll in flight so the link and the hardware are
+        never overwhelmed. The next poll is sent as soon as all cards
+        responded while inputs change and the interval grows up to
+        opp:poll_idle_interval when they are idle.
+        """
+        config = self.platform.config
+        read_input_msg = self.platform.read_input_msg[self.chain_serial]
+        # every card responds with one message. the last byte is EOM
+        input_cards = len(read_input_msg) // 7
+        interval = config['poll_active_interval'] / 1000
+        last_poll = None
+        while True:
+            start = self.machine.clock.get_time()
+            self._inputs_pending = input_cards
+            self._poll_failed = False
+            self._repoll = False
+            self._inputs_done.clear()
+            self.send(read_input_msg)
+            try:
+                yield from asyncio.wait_for(self._inputs_done.wait(), config['poll_timeout'] / 1000,
+                                            loop=self.machine.clock.loop)
+            except asyncio.TimeoutError:
+                self.log.warning("Chain %s did not answer poll within %sms.", self.chain_serial,
+                                 config['poll_timeout'])
+                self._poll_failed = True
+
+            if self._poll_failed:
+                self._inputs_pending = 0
+                yield from self._wait_for_late_replies()
+
+            now = self.machine.clock.get_time()
+            self.poll_count += 1
+            self.poll_rtt = now - start
+            self.poll_max_rtt = max(self.poll_max_rtt, self.poll_rtt)
+            if last_poll is not None and start > last_poll:
+                # moving average over roughly the last ten polls
+                self.poll_rate = self.poll_rate * 0.9 + 0.1 / (start - last_poll)
+            last_poll = start
+
+            if self._repoll:
+                # a response was lost. poll again at full rate
+                interval = config['poll_active_interval'] / 1000
             else:
-                # Lost synch
-                self.partMsg = self.partMsg[1:]
-                strlen -= 1
-                self._lost_synch = True
+                interval = self._get_next_poll_interval(interval)
+            yield from asyncio.sleep(interval, loop=self.machine.clock.loop)
+
+    @asyncio.coroutine
+    def _wait_for_late_replies(self):
+        """Wait until the chain did not send replies for opp:poll_timeout.
+
+        Replies do not identify their poll. Replies of a poll which timed out
+        must have arrived before the next poll is sent or they would count
+        against it.
+        """
+        while True:
+            late_replies = self.late_replies
+            yield from asyncio.sleep(self.platform.config['poll_timeout'] / 1000, loop=self.machine.clock.loop)
+            if late_replies == self.late_replies:
+                return
+
+    def lost_synch(self):
+        """Mark connection as desynchronised."""
+        self.frame_decoder.lost_synch = True
 
-            return messaged_found
+    def _process_frame(self, frame):
+        self.platform.process_received_message(self.chain_serial, frame)
@@ -10,15 +10,20 @@ class OPPIncandCard(object):
 
     """An incandescent wing card."""
 
-    def __init__(self, chain_serial, addr, mask, incand_dict):
+    def __init__(self, chain_serial, addr, mask, incand_dict, platform):
         """Initialise OPP incandescent card."""
         self.log = logging.getLogger('OPPIncand')
         self.addr = addr
         self.chain_serial = chain_serial
+        self.platform = platform
         self.oldState = 0
         self.newState = 0
         self.mask = mask
 
+        # all 32 lamps are set at once with one bit per lamp
+        self._set_prefix = bytes([addr]) + OppRs232Intf.INCAND_CMD + OppRs232Intf.INCAND_SET_ON_OFF
+        self._set_crc = OppRs232Intf.calc_crc8(self._set_prefix)
+
         self.log.debug("Creating OPP Incand at hardware address: 0x%02x", addr)
 
         card = str(addr - ord(OppRs232Intf.CARD_ID_GEN2_CARD))
@@ -27,6 +32,29 @@ class OPPIncandCard(object):
                 number = card + '-' + str(index)
                 incand_dict[chain_serial + '-' + number] = OPPIncand(self, number)
 
+    def set_state(self, new_state):
+        """Set the state of all lamps and send it with the next frame if it changed.
+
+        Args:
+            new_state: Bitmask with one bit per lamp.
+        """
+        if new_state == self.newState:
+            return
+
+        self.newState = new_state
+        self.platform.update_card(self)
+
+    def get_update_commands(self):
+        """Return the commands to bring the card to its new state."""
+        if self.oldState == self.newState:
+            return []
+
+        self.oldState = self.newState
+        state = self.newState.to_bytes(4, 'big')
+        msg = self._set_prefix + state + bytes([OppRs232Intf.calc_crc8(state, self._set_crc)])
+        self.log.debug("Update incand cmd:%s", "".join(" 0x%02x" % b for b in msg))
+        return [msg]
+
 
 class OPPIncand(GIPlatformInterface):
 
@@ -36,12 +64,12 @@ class OPPIncand(GIPlatformInterface):
         """Initialise Incandescent wing card driver."""
         self.incandCard = incand_card
         self.number = number
+        _, incand = number.split("-")
+        self._bit = 1 << int(incand)
 
     def off(self):
         """Disable (turns off) this light."""
-        _, incand = self.number.split("-")
-        curr_bit = (1 << int(incand))
-        self.incandCard.newState &= ~curr_bit
+        self.incandCard.set_state(self.incandCard.newState & ~self._bit)
 
     def on(self, brightness: int=255):
         """Enable (turns on) this driver.
@@ -49,9 +77,7 @@ class OPPIncand(GIPlatformInterface):
         Args:
             brightness: brightness 0 (off) to 255 (on) for this incandescent light. OPP only supports on (>0) or off.
         """
-        _, incand = self.number.split("-")
-        curr_bit = (1 << int(incand))
         if brightness == 0:
-            self.incandCard.newState &= ~curr_bit
+            self.incandCard.set_state(self.incandCard.newState & ~self._bit)
         else:
-            self.incandCard.newState |= curr_bit
+            self.incandCard.set_state(self.incandCard.newState | self._bit)
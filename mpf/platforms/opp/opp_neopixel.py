@@ -20,8 +20,12 @@ class OPPNeopixelCard(object):
         self.numPixels = 0
         self.numColorEntries = 0
         self.colorTableDict = dict()
+        self.dirty_pixels = dict()
         neo_card_dict[chain_serial + '-' + self.card] = self
 
+        self._set_prefix = bytes([addr]) + OppRs232Intf.SET_IND_NEO_CMD
+        self._set_crc = OppRs232Intf.calc_crc8(self._set_prefix)
+
         self.log.debug("Creating OPP Neopixel card at hardware address: 0x%02x", addr)
 
     def add_neopixel(self, number, neo_dict):
@@ -33,6 +37,61 @@ class OPPNeopixelCard(object):
         neo_dict[pixel_number] = pixel
         return pixel
 
+    def get_color_table_entry(self, color):
+        """Return the color table entry of a color and add it to the table if it is missing.
+
+        Args:
+            color: Tuple of red, green and blue values.
+
+        Returns None when the table is full.
+        """
+        if color in self.colorTableDict:
+            return self.colorTableDict[color]
+
+        # Check if there are available spaces in the table
+        if self.numColorEntries >= 32:
+            self.log.warning("Not enough Neo color table entries. OPP only supports 32.")
+            return None
+
+        # Send the command to add color table entry with the next frame
+        self.colorTableDict[color] = self.numColorEntries + OppRs232Intf.NEO_CMD_ON
+        msg = bytearray()
+        msg.append(self.addr)
+        msg.extend(OppRs232Intf.CHNG_NEO_COLOR_TBL)
+        msg.append(self.numColorEntries)
+        msg.append(color[1])
+        msg.append(color[0])
+        msg.append(color[2])
+        msg.extend(OppRs232Intf.calc_crc8_whole_msg(msg))
+        cmd = bytes(msg)
+        self.log.debug("Add Neo color table entry: %s", "".join(" 0x%02x" % b for b in cmd))
+        self.platform.queue_to_processor(self.chain_serial, cmd)
+        self.numColorEntries += 1
+
+        return self.colorTableDict[color]
+
+    def set_pixel(self, index, table_entry):
+        """Set a pixel to a color table entry with the next frame.
+
+        Args:
+            index: Index of the pixel on the card.
+            table_entry: Color table entry.
+        """
+        self.dirty_pixels[index] = table_entry
+        self.platform.update_card(self)
+
+    def get_update_commands(self):
+        """Return the commands to set all pixels which changed since the last frame."""
+        commands = []
+        for index, table_entry in self.dirty_pixels.items():
+            data = bytes([index, table_entry])
+            msg = self._set_prefix + data + bytes([OppRs232Intf.calc_crc8(data, self._set_crc)])
+            self.log.debug("Set Neopixel color: %s", "".join(" 0x%02x" % b for b in msg))
+            commands.append(msg)
+
+        self.dirty_pixels = dict()
+        return commands
+
 
 class OPPNeopixel(RGBLEDPlatformInterface):
 
@@ -45,52 +104,19 @@ class OPPNeopixel(RGBLEDPlatformInterface):
         self.current_color = '000000'
         self.neoCard = neo_card
         _, index = number.split('-')
-        self.index_char = chr(int(index))
+        self.index = int(index)
 
         self.log.debug("Creating OPP Neopixel: %s", number)
 
     def color(self, color):
         """Instantly set this LED to the color passed.
 
+        The pixel is sent with the next frame of the chain.
+
         Args:
             color: a 3-item list of integers representing R, G, and B values,
             0-255 each.
         """
-        new_color = "{0}{1}{2}".format(hex(int(color[0]))[2:].zfill(2),
-                                       hex(int(color[1]))[2:].zfill(2),
-                                       hex(int(color[2]))[2:].zfill(2))
-        error = False
-
-        # Check if this color exists in the color table
-        if new_color not in self.neoCard.colorTableDict:
-            # Check if there are available spaces in the table
-            if self.neoCard.numColorEntries < 32:
-                # Send the command to add color table entry
-                self.neoCard.colorTableDict[new_color] = self.neoCard.numColorEntries + OppRs232Intf.NEO_CMD_ON
-                msg = bytearray()
-                msg.append(self.neoCard.addr)
-                msg.extend(OppRs232Intf.CHNG_NEO_COLOR_TBL)
-                msg.append(self.neoCard.numColorEntries)
-                msg.append(int(new_color[2:4], 16))
-                msg.append(int(new_color[:2], 16))
-                msg.append(int(new_color[-2:], 16))
-                msg.extend(OppRs232Intf.calc_crc8_whole_msg(msg))
-                cmd = bytes(msg)
-                self.log.debug("Add Neo color table entry: %s", "".join(" 0x%02x" % b for b in cmd))
-                self.neoCard.platform.send_to_processor(self.neoCard.chain_serial, cmd)
-                self.neoCard.numColorEntries += 1
-            else:
-                error = True
-                self.log.warning("Not enough Neo color table entries. OPP only supports 32.")
-
-        # Send msg to set the neopixel
-        if not error:
-            msg = bytearray()
-            msg.append(self.neoCard.addr)
-            msg.extend(OppRs232Intf.SET_IND_NEO_CMD)
-            msg.append(ord(self.index_char))
-            msg.append(self.neoCard.colorTableDict[new_color])
-            msg.extend(OppRs232Intf.calc_crc8_whole_msg(msg))
-            cmd = bytes(msg)
-            self.log.debug("Set Neopixel color: %s", "".join(" 0x%02x" % b for b in cmd))
-            self.neoCard.platform.send_to_processor(self.neoCard.chain_serial, cmd)
+        table_entry = self.neoCard.get_color_table_entry((int(color[0]), int(color[1]), int(color[2])))
+        if table_entry is not None:
+            self.neoCard.set_pixel(self.index, table_entry)
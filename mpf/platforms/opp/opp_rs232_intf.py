@@ -97,14 +97,22 @@ class OppRs232Intf:
         0xae, 0xa9, 0xa0, 0xa7, 0xb2, 0xb5, 0xbc, 0xbb, 0x96, 0x91, 0x98, 0x9f, 0x8a, 0x8d, 0x84, 0x83,
         0xde, 0xd9, 0xd0, 0xd7, 0xc2, 0xc5, 0xcc, 0xcb, 0xe6, 0xe1, 0xe8, 0xef, 0xfa, 0xfd, 0xf4, 0xf3]
 
+    @staticmethod
+    def calc_crc8(msg_chars, crc8_byte=0xff):
+        """Calculate the CRC state after a message.
+
+        Pass the state of a constant message prefix as crc8_byte to only
+        calculate the CRC of the rest of the message.
+        """
+        lookup = OppRs232Intf.CRC8_LOOKUP
+        for ind_int in msg_chars:
+            crc8_byte = lookup[crc8_byte ^ ind_int]
+        return crc8_byte
+
     @staticmethod
     def calc_crc8_whole_msg(msg_chars):
         """Calculate CRC for message."""
-        crc8_byte = 0xff
-        for ind_char in msg_chars:
-            ind_int = ind_char
-            crc8_byte = OppRs232Intf.CRC8_LOOKUP[crc8_byte ^ ind_int]
-        return bytes([crc8_byte])
+        return bytes([OppRs232Intf.calc_crc8(msg_chars)])
 
     @staticmethod
     def calc_crc8_part_msg(msg_chars, start_index, num_chars):
@@ -35,7 +35,7 @@ class HardwarePlatform(PROCBasePlatform, I2cPlatform, AccelerometerPlatform):
         self.debug_log("Configuring P3-ROC hardware.")
 
         # validate config for p3_roc
-        self.machine.config_validator.validate_config("p3_roc", self.machine.config['p_roc'])
+        self.config = self.machine.config_validator.validate_config("p3_roc", self.machine.config['p_roc'])
 
         if self.machine_type != self.pinproc.MachineTypePDB:
             raise AssertionError("P3-Roc can only handle PDB driver boards")
@@ -61,6 +61,7 @@ class HardwarePlatform(PROCBasePlatform, I2cPlatform, AccelerometerPlatform):
     def i2c_write8(self, address, register, value):
         """Write an 8-bit value to the I2C bus of the P3-Roc."""
         self.proc.write_data(7, address << 9 | register, value)
+        self.schedule_flush()
 
     def i2c_read8(self, address, register):
         """Read an 8-bit value from the I2C bus of the P3-Roc."""
@@ -152,7 +153,7 @@ class HardwarePlatform(PROCBasePlatform, I2cPlatform, AccelerometerPlatform):
         if proc_num == -1:
             raise AssertionError("Gi Driver {} cannot be controlled by the P3-ROC. ".format(str(config['number'])))
 
-        proc_driver_object = PROCGiString(proc_num, self.proc, config)
+        proc_driver_object = PROCGiString(proc_num, self, config)
 
         return proc_driver_object
 
@@ -163,7 +164,7 @@ class HardwarePlatform(PROCBasePlatform, I2cPlatform, AccelerometerPlatform):
         if proc_num == -1:
             raise AssertionError("Matrixlight {} cannot be controlled by the P3-ROC. ".format(str(config['number'])))
 
-        proc_driver_object = PROCMatrixLight(proc_num, self.proc)
+        proc_driver_object = PROCMatrixLight(proc_num, self)
 
         return proc_driver_object
 
@@ -205,14 +206,13 @@ class HardwarePlatform(PROCBasePlatform, I2cPlatform, AccelerometerPlatform):
 
         return states
 
-    def tick(self, dt):
-        """Check the P3-ROC for any events (switch state changes).
+    def process_events(self, events):
+        """Process events from the P3-ROC.
 
-        Also tickles the watchdog and flushes any queued commands to the P3-ROC.
+        Args:
+            events: List of event dicts as returned by get_events.
         """
-        del dt
-        # Get P3-ROC events
-        for event in self.proc.get_events():
+        for event in events:
             event_type = event['type']
             event_value = event['value']
             if event_type == self.pinproc.EventTypeSwitchClosedDebounced:
@@ -255,9 +255,6 @@ class HardwarePlatform(PROCBasePlatform, I2cPlatform, AccelerometerPlatform):
                 self.log.warning("Received unrecognized event from the P3-ROC. "
                                  "Type: %s, Value: %s", event_type, event_value)
 
-        self.proc.watchdog_tickle()
-        self.proc.flush()
-
 
 class PROCAccelerometer(object):
 
@@ -40,7 +40,7 @@ class HardwarePlatform(PROCBasePlatform, DmdPlatform):
         self.debug_log("Configuring P-ROC hardware")
 
         # validate config for p_roc
-        self.machine.config_validator.validate_config("p_roc", self.machine.config['p_roc'])
+        self.config = self.machine.config_validator.validate_config("p_roc", self.machine.config['p_roc'])
 
         self.dmd = None
 
@@ -114,7 +114,7 @@ class HardwarePlatform(PROCBasePlatform, DmdPlatform):
                 raise AssertionError("Gi Driver {} cannot be controlled by the P-ROC. ".format(str(config['number'])))
         else:
             proc_num = self.pinproc.decode(self.machine_type, str(config['number']))
-        proc_driver_object = PROCGiString(proc_num, self.proc, config)
+        proc_driver_object = PROCGiString(proc_num, self, config)
 
         return proc_driver_object
 
@@ -129,7 +129,7 @@ class HardwarePlatform(PROCBasePlatform, DmdPlatform):
         else:
             proc_num = self.pinproc.decode(self.machine_type, str(config['number']))
 
-        return PROCMatrixLight(proc_num, self.proc)
+        return PROCMatrixLight(proc_num, self)
 
     def configure_switch(self, config):
         """Configure a P-ROC switch.
@@ -177,17 +177,16 @@ class HardwarePlatform(PROCBasePlatform, DmdPlatform):
 
     def configure_dmd(self):
         """Configure a hardware DMD connected to a classic P-ROC."""
-        self.dmd = PROCDMD(self.pinproc, self.proc, self.machine)
+        self.dmd = PROCDMD(self.pinproc, self, self.machine)
         return self.dmd
 
-    def tick(self, dt):
-        """Check the P-ROC for any events (switch state changes or notification that a DMD frame was updated).
+    def process_events(self, events):
+        """Process events from the P-ROC.
 
-        Also tickles the watchdog and flushes any queued commands to the P-ROC.
+        Args:
+            events: List of event dicts as returned by get_events.
         """
-        del dt
-        # Get P-ROC events (switches & DMD frames displayed)
-        for event in self.proc.get_events():
+        for event in events:
             event_type = event['type']
             event_value = event['value']
             if event_type == self.pinproc.EventTypeDMDFrameDisplayed:
@@ -208,16 +207,13 @@ class HardwarePlatform(PROCBasePlatform, DmdPlatform):
                 self.log.warning("Received unrecognized event from the P-ROC. "
                                  "Type: %s, Value: %s", event_type, event_value)
 
-        self.proc.watchdog_tickle()
-        self.proc.flush()
-
 
 class PROCDMD(DmdPlatformInterface):
 
     """Parent class for a physical DMD attached to a P-ROC.
 
     Args:
-        proc: Reference to the MachineController's proc attribute.
+        platform: The P-ROC platform.
         machine: Reference to the MachineController
 
     Attributes:
@@ -225,9 +221,10 @@ class PROCDMD(DmdPlatformInterface):
 
     """
 
-    def __init__(self, pinproc, proc, machine):
+    def __init__(self, pinproc, platform, machine):
         """Set up DMD."""
-        self.proc = proc
+        self.platform = platform
+        self.proc = platform.proc
         self.machine = machine
 
         # size is hardcoded here since 128x32 is all the P-ROC hw supports
@@ -250,6 +247,7 @@ class PROCDMD(DmdPlatformInterface):
         if len(data) == 4096:
             self.dmd.set_data(data)
             self.proc.dmd_draw(self.dmd)
+            self.platform.schedule_flush()
         else:
             self.machine.log.warning("Received DMD frame of length %s instead"
                                      "of 4096. Discarding...", len(data))
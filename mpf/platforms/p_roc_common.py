@@ -3,7 +3,9 @@ import abc
 import logging
 import platform
 import sys
+import threading
 import time
+import traceback
 
 from mpf.platforms.p_roc_devices import PROCSwitch
 
@@ -28,6 +30,34 @@ except ImportError:     # pragma: no cover
 
 from mpf.platforms.interfaces.rgb_led_platform_interface import RGBLEDPlatformInterface
 from mpf.core.platform import MatrixLightsPlatform, GiPlatform, LedPlatform, SwitchPlatform, DriverPlatform
+from mpf.core.switch_snapshot import SwitchStateSnapshot
+
+
+class ThreadSafePinProc(object):
+
+    """Wraps a pinproc.PinPROC handle and serialises all calls with a lock.
+
+    Used when events are read in a separate thread while the loop sends
+    commands. pypinproc does not guarantee that one handle can be used from
+    two threads at the same time.
+    """
+
+    def __init__(self, proc):
+        """Wrap handle."""
+        self._proc = proc
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        """Return attribute of the handle. Methods are called with the lock held."""
+        attr = getattr(self._proc, name)
+        if not callable(attr):
+            return attr
+
+        def locked_call(*args, **kwargs):
+            with self._lock:
+                return attr(*args, **kwargs)
+
+        return locked_call
 
 
 # pylint does not understand that this class is abstract
@@ -58,19 +88,98 @@ class PROCBasePlatform(MatrixLightsPlatform, GiPlatform, LedPlatform, SwitchPlat
         self.pinproc = pinproc
         self.proc = None
         self.log = None
+        self.config = None
         self.hw_switch_rules = {}
 
         self.machine_type = pinproc.normalize_machine_type(
             self.machine.config['hardware']['driverboards'])
 
+        # events are pumped by _run_event_reader instead of tick
+        self.features['tickless'] = True
+        self._event_reader = None
+        self._event_reader_stop = threading.Event()
+        self._flush_scheduled = False
+
     def initialize(self):
-        """Nothing to late initialise."""
-        pass
+        """Start the event pump and the watchdog timer."""
+        if self.config['use_separate_thread']:
+            # all calls to proc are serialised by ThreadSafePinProc (see connect)
+            self._event_reader = threading.Thread(target=self._run_event_reader,
+                                                  name="PROC_event_reader")
+            self._event_reader.daemon = True
+            self._event_reader.start()
+        else:
+            self.machine.clock.schedule_interval(self._poll_events, self.config['event_poll_interval'] / 1000)
+
+        if self.config['use_watchdog']:
+            self.machine.clock.schedule_interval(self._tickle_watchdog, self.config['watchdog_time'] / 2000)
+
+        # send everything which was queued during configuration
+        self.schedule_flush()
 
     def stop(self):
         """Stop proc."""
+        self._event_reader_stop.set()
+        if self._event_reader:
+            self._event_reader.join(1)
         self.proc.reset(1)
 
+    def _run_event_reader(self):
+        """Read events from the P-ROC and hand every batch over to the loop."""
+        poll_interval = self.config['event_poll_interval'] / 1000
+        loop = self.machine.clock.loop
+        try:
+            while not self._event_reader_stop.is_set() and not self.machine.thread_stopper.is_set():
+                events = self.proc.get_events()
+                if events:
+                    loop.call_soon_threadsafe(self.process_events, events)
+                else:
+                    time.sleep(poll_interval)
+
+        # the loop has to know when the reader dies
+        # pylint: disable-msg=broad-except
+        except Exception:
+            exc_type, exc_value, exc_traceback = sys.exc_info()
+            lines = traceback.format_exception(exc_type, exc_value, exc_traceback)
+            self.machine.crash_queue.put(''.join(lines))
+
+    def _poll_events(self, dt):
+        """Read events from the P-ROC on the loop when the reader thread is disabled."""
+        del dt
+        events = self.proc.get_events()
+        if events:
+            self.process_events(events)
+
+    @abc.abstractmethod
+    def process_events(self, events):
+        """Process a batch of events from the P-ROC/P3-ROC.
+
+        Args:
+            events: List of event dicts as returned by get_events.
+        """
+        raise NotImplementedError()
+
+    def _tickle_watchdog(self, dt):
+        del dt
+        self.proc.watchdog_tickle()
+        self.schedule_flush()
+
+    def schedule_flush(self):
+        """Flush queued commands to the P-ROC once the current loop iteration is done.
+
+        Commands issued in the same iteration of the loop (e.g. all drivers
+        pulsed by one switch event) are sent together with a single flush.
+        """
+        if self._flush_scheduled:
+            return
+
+        self._flush_scheduled = True
+        self.machine.clock.loop.call_soon(self._flush)
+
+    def _flush(self):
+        self._flush_scheduled = False
+        self.proc.flush()
+
     def connect(self):
         """Connect to the P-ROC.
 
@@ -86,8 +195,24 @@ class PROCBasePlatform(MatrixLightsPlatform, GiPlatform, LedPlatform, SwitchPlat
                 print("Retrying...")
                 time.sleep(1)
 
+        if self.config['use_separate_thread']:
+            # the event reader thread and the loop share the handle
+            self.proc = ThreadSafePinProc(self.proc)
+
         self.log.info("Successfully connected to P-ROC/P3-ROC")
 
+    def get_hw_switch_snapshot(self):
+        """Return the states of all switches as one bitfield indexed by switch number."""
+        states = self.get_hw_switch_states()
+        snapshot = SwitchStateSnapshot()
+        snapshot.set_bank(0, int("".join("1" if state else "0" for state in reversed(states)) or "0", 2),
+                          (1 << len(states)) - 1)
+        return snapshot
+
+    def get_switch_position(self, number):
+        """Return the position of a switch in the snapshot."""
+        return 0, number
+
     @classmethod
     def _get_event_type(cls, sw_activity, debounced):
         if sw_activity == 0 and debounced in ("normal", "auto"):
@@ -161,6 +286,8 @@ class PROCBasePlatform(MatrixLightsPlatform, GiPlatform, LedPlatform, SwitchPlat
             else:
                 self.proc.switch_update_rule(switch.hw_switch.number, event_type, rule, driver, drive_now)
 
+        self.schedule_flush()
+
     def set_pulse_on_hit_rule(self, enable_switch, coil):
         """Set pulse on hit rule on driver."""
         self.debug_log("Setting HW Rule on pulse on hit. Switch: %s, Driver: %s",
@@ -249,7 +376,7 @@ class PROCBasePlatform(MatrixLightsPlatform, GiPlatform, LedPlatform, SwitchPlat
                                int(number_parts[2]),
                                int(number_parts[3])],
                       polarity=config['polarity'],
-                      proc_driver=self.proc)
+                      platform=self)
 
     def _configure_switch(self, config, proc_num):
         """Configure a P3-ROC switch.
@@ -795,12 +922,13 @@ class PDBLED(RGBLEDPlatformInterface):
 
     """Represents an RGB LED connected to a PD-LED board."""
 
-    def __init__(self, board, address, polarity, proc_driver):
+    def __init__(self, board, address, polarity, platform):
         """Initialise PDB LED."""
         self.log = logging.getLogger('PDBLED')
         self.board = board
         self.address = address
-        self.proc = proc_driver
+        self.platform = platform
+        self.proc = platform.proc
         self.polarity = polarity
 
         # make sure self.address is a 3-element list
@@ -829,6 +957,7 @@ class PDBLED(RGBLEDPlatformInterface):
         self.proc.led_color(self.board, self.address[0], self._normalise_color(color[0]))
         self.proc.led_color(self.board, self.address[1], self._normalise_color(color[1]))
         self.proc.led_color(self.board, self.address[2], self._normalise_color(color[2]))
+        self.platform.schedule_flush()
 
 
 def is_pdb_address(addr):
@@ -37,6 +37,7 @@ class PROCDriver(DriverPlatformInterface):
         """Initialise driver."""
         self.log = logging.getLogger('PROCDriver')
         super().__init__(config, number)
+        self.platform = platform
         self.proc = platform.proc
         self.machine = platform.machine
         self.pdbconfig = getattr(platform, "pdbconfig", None)
@@ -90,6 +91,7 @@ class PROCDriver(DriverPlatformInterface):
         del coil
         self.log.debug('Disabling Driver')
         self.proc.driver_disable(self.number)
+        self.platform.schedule_flush()
 
     def enable(self, coil):
         """Enable (turn on) this driver."""
@@ -104,6 +106,7 @@ class PROCDriver(DriverPlatformInterface):
                                     self.get_pwm_on_ms(coil),
                                     self.get_pwm_off_ms(coil),
                                     self.get_pulse_ms(coil), True)
+            self.platform.schedule_flush()
         else:
             self.log.debug('Enabling at 100%')
 
@@ -114,6 +117,7 @@ class PROCDriver(DriverPlatformInterface):
 
             self.proc.driver_schedule(number=self.number, schedule=0xffffffff,
                                       cycle_seconds=0, now=True)
+            self.platform.schedule_flush()
 
     def pulse(self, coil, milliseconds):
         """Enable this driver for `milliseconds`.
@@ -125,6 +129,7 @@ class PROCDriver(DriverPlatformInterface):
 
         self.log.debug('Pulsing for %sms', milliseconds)
         self.proc.driver_pulse(self.number, milliseconds)
+        self.platform.schedule_flush()
 
         return milliseconds
 
@@ -137,11 +142,12 @@ class PROCGiString(GIPlatformInterface):
 
     """A P-ROc GI hardware device."""
 
-    def __init__(self, number, proc_driver, config):
+    def __init__(self, number, platform, config):
         """Initialise GI."""
         self.log = logging.getLogger('PROCGiString')
         self.number = number
-        self.proc = proc_driver
+        self.platform = platform
+        self.proc = platform.proc
         self.config = config
 
     def on(self, brightness=255):
@@ -159,31 +165,36 @@ class PROCGiString(GIPlatformInterface):
                                 int(duty_on),
                                 int(duty_off),
                                 0, True)
+        self.platform.schedule_flush()
 
     def off(self):
         """Turn off a GI."""
         self.proc.driver_disable(self.number)
+        self.platform.schedule_flush()
 
 
 class PROCMatrixLight(MatrixLightPlatformInterface):
 
     """A P-ROC matrix light device."""
 
-    def __init__(self, number, proc_driver):
+    def __init__(self, number, platform):
         """Initialise matrix light device."""
         self.log = logging.getLogger('PROCMatrixLight')
         self.number = number
-        self.proc = proc_driver
+        self.platform = platform
+        self.proc = platform.proc
 
     def off(self):
         """Disable (turns off) this driver."""
         self.proc.driver_disable(self.number)
+        self.platform.schedule_flush()
 
     def on(self, brightness=255):
         """Enable (turns on) this driver."""
         if brightness >= 255:
             self.proc.driver_schedule(number=self.number, schedule=0xffffffff,
                                       cycle_seconds=0, now=True)
+            self.platform.schedule_flush()
         elif brightness == 0:
             self.off()
         else:
@@ -4,8 +4,9 @@ import logging
 import sys
 import threading
 import traceback
-from queue import Queue
+from queue import Queue, Empty
 import serial
+from mpf.core.dmd_frame_encoder import RESYNC_REQUEST
 from mpf.core.platform import RgbDmdPlatform
 
 
@@ -13,6 +14,9 @@ class HardwarePlatform(RgbDmdPlatform):
 
     """SmartMatrix shield via Teensy."""
 
+    RESYNC_CHECK_INTERVAL = .1
+    """Seconds between checks for resync requests while no frames are sent."""
+
     def __init__(self, machine):
         """Initialise smart matrix."""
         super().__init__(machine)
@@ -21,9 +25,12 @@ class HardwarePlatform(RgbDmdPlatform):
         self.log.debug("Configuring SmartMatrix hardware interface.")
 
         self.queue = None
+        self.sending = threading.Event()
+        self.resync_requested = threading.Event()
         self.serial_port = None
         self.dmd_thread = None
         self.update = None
+        self.update_encoded = None
 
         self.config = self.machine.config_validator.validate_config(
             config_spec='smartmatrix',
@@ -53,13 +60,16 @@ class HardwarePlatform(RgbDmdPlatform):
                                          baudrate=2500000)
 
         if self.config['use_separate_thread']:
-            self.queue = Queue()
+            # the output stage of the dmd only sends a frame when the last one has been written
+            self.queue = Queue(maxsize=1)
             self.dmd_thread = threading.Thread(target=self._dmd_sender_thread)
             self.dmd_thread.daemon = True
             self.dmd_thread.start()
             self.update = self._update_separate_thread
+            self.update_encoded = self._send_separate_thread
         else:
             self.update = self._update_non_thread
+            self.update_encoded = self._send_non_thread
 
         return self
 
@@ -70,16 +80,54 @@ class HardwarePlatform(RgbDmdPlatform):
         except TypeError:
             pass
 
+    def _send_non_thread(self, message):
+        self.serial_port.write(message)
+
     def _update_separate_thread(self, data):
-        self.queue.put(bytearray(data))
+        self._send_separate_thread(bytearray([0x01]) + bytearray(data))
+
+    def _send_separate_thread(self, message):
+        self.sending.set()
+        self.queue.put(message)
+
+    def is_busy(self):
+        """Return true while the sender thread writes a frame."""
+        return self.sending.is_set()
+
+    def is_desynced(self):
+        """Return true if the Teensy discarded a delta frame and requested a key frame.
+
+        With a separate thread the serial port is only accessed by the sender
+        thread which flags resync requests.
+        """
+        if not self.dmd_thread:
+            return self._read_resync_request()
+
+        desynced = self.resync_requested.is_set()
+        self.resync_requested.clear()
+        return desynced
+
+    def _read_resync_request(self):
+        """Read the responses of the Teensy and return true if it requested a key frame."""
+        waiting = self.serial_port.in_waiting
+        if not waiting:
+            return False
+
+        return RESYNC_REQUEST in self.serial_port.read(waiting)
 
     def _dmd_sender_thread(self):
         while True:
-            data = self.queue.get()  # this will block
+            try:
+                message = self.queue.get(timeout=self.RESYNC_CHECK_INTERVAL)
+            except Empty:
+                message = None
 
             try:
-                self.serial_port.write(bytearray([0x01]))
-                self.serial_port.write(bytearray(data))
+                if message is not None:
+                    self.serial_port.write(message)
+
+                if self._read_resync_request():
+                    self.resync_requested.set()
 
             except IOError:
                 exc_type, exc_value, exc_traceback = sys.exc_info()
@@ -87,3 +135,6 @@ class HardwarePlatform(RgbDmdPlatform):
                                                    exc_traceback)
                 msg = ''.join(line for line in lines)
                 self.machine.crash_queue.put(msg)
+
+            if message is not None:
+                self.sending.clear()
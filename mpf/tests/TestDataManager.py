@@ -6,6 +6,10 @@ class TestDataManager(DataManager):
 
     def __init__(self, data):
         self.data = data
+        self._changed_keys = set()
 
     def save_all(self, data=None, delay_secs=0):
         pass
+
+    def _schedule_write(self, delay_secs):
+        pass
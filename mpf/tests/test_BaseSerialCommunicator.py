@@ -0,0 +1,47 @@
+import unittest
+
+from mpf.platforms.base_serial_communicator import FrameDecoder, SeparatorFrameDecoder
+from mpf.platforms.opp.opp import OppFrameDecoder
+
+
+class TestFrameDecoder(unittest.TestCase):
+
+    def test_raw(self):
+        decoder = FrameDecoder()
+        self.assertEqual([b'\x01\x02'], list(decoder.feed(b'\x01\x02')))
+        self.assertEqual([], list(decoder.feed(b'')))
+        self.assertEqual(b'', decoder.buffer)
+
+    def test_separator(self):
+        decoder = SeparatorFrameDecoder(b'\r')
+        self.assertEqual([], list(decoder.feed(b'SA:01')))
+        self.assertEqual([b'SA:0102', b'', b'WX:P'], list(decoder.feed(b'02\r\rWX:P\rRX')))
+        self.assertEqual(b'RX', decoder.buffer)
+        self.assertEqual([b'RX:P'], list(decoder.feed(b':P\r')))
+        self.assertEqual(b'', decoder.buffer)
+
+    def test_burst(self):
+        decoder = SeparatorFrameDecoder(b'\r')
+        frames = list(decoder.feed(b'-N:01\r' * 1000 + b'-N:0'))
+        self.assertEqual([b'-N:01'] * 1000, frames)
+        self.assertEqual(b'-N:0', decoder.buffer)
+
+    def test_opp(self):
+        decoder = OppFrameDecoder()
+        response = b'\x20\x08\x00\x00\x00\x01\x55'
+        # EOM is skipped and partial responses stay in the buffer
+        self.assertEqual([response], list(decoder.feed(b'\xff' + response + b'\xff' + response[:3])))
+        self.assertEqual(response[:3], decoder.buffer)
+        self.assertEqual([response], list(decoder.feed(response[3:])))
+        self.assertEqual(b'', decoder.buffer)
+
+        # garbage is skipped until the next card address
+        self.assertEqual([response], list(decoder.feed(b'\x01\x02' + response)))
+        self.assertFalse(decoder.lost_synch)
+
+        # unexpected command
+        self.assertEqual([response], list(decoder.feed(b'\x20\x07\x03' + response)))
+
+        # decoder resyncs when the platform reports lost synch
+        decoder.lost_synch = True
+        self.assertEqual([response], list(decoder.feed(b'\x00' + response)))
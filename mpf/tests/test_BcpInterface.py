@@ -51,11 +51,11 @@ class TestBcpInterface(MpfBcpTestCase):
 
         # change switch
         self.release_switch_and_run("s_test", .1)
-        self.assertIn(
-            ("device", {"type": "switch",
-                        "name": "s_test",
-                        "state": {'state': 0, 'recycle_jitter_count': 0},
-                        "changes": ('state', 1, 0)}),
+        self.assertEqual(
+            [("device", {"type": "switch",
+                         "name": "s_test",
+                         "state": {'state': 0, 'recycle_jitter_count': 0},
+                         "changes": ('state', 1, 0)})],
             self._bcp_client.send_queue)
         self._bcp_client.send_queue.clear()
 
@@ -65,11 +65,115 @@ class TestBcpInterface(MpfBcpTestCase):
 
         # change again
         self.hit_switch_and_run("s_test", .1)
+        self.assertEqual(
+            [("device", {"type": "switch",
+                         "name": "s_test",
+                         "state": {'state': 1, 'recycle_jitter_count': 0},
+                         "changes": ('state', 0, 1)})],
+            self._bcp_client.send_queue)
+        self._bcp_client.send_queue.clear()
+
+        # multiple changes in one loop iteration are coalesced to the last change per attribute
+        switch = self.machine.switches.s_test
+        switch.state = 0
+        switch.recycle_jitter_count = 5
+        switch.state = 1
+        switch.recycle_jitter_count = 3
+        self.advance_time_and_run(.1)
+        self.assertEqual(2, len(self._bcp_client.send_queue))
         self.assertIn(
             ("device", {"type": "switch",
                         "name": "s_test",
-                        "state": {'state': 1, 'recycle_jitter_count': 0},
-                        "changes": ('state', 0, 1)}),
+                        "state": {'state': 1, 'recycle_jitter_count': 3},
+                        "changes": ('state', 0, 1)}), self._bcp_client.send_queue)
+        self.assertIn(
+            ("device", {"type": "switch",
+                        "name": "s_test",
+                        "state": {'state': 1, 'recycle_jitter_count': 3},
+                        "changes": ('recycle_jitter_count', 5, 3)}), self._bcp_client.send_queue)
+        self._bcp_client.send_queue.clear()
+
+        # changes are sent at most 30 times per second
+        switch.state = 0
+        self.advance_time_and_run(.01)
+        switch.state = 1
+        self.advance_time_and_run(.01)
+        switch.state = 0
+        self.advance_time_and_run(.01)
+        self.assertEqual(
+            [("device", {"type": "switch",
+                         "name": "s_test",
+                         "state": {'state': 0, 'recycle_jitter_count': 3},
+                         "changes": ('state', 1, 0)})],
+            self._bcp_client.send_queue)
+        self._bcp_client.send_queue.clear()
+        self.advance_time_and_run(.1)
+        self.assertEqual(
+            [("device", {"type": "switch",
+                         "name": "s_test",
+                         "state": {'state': 0, 'recycle_jitter_count': 3},
+                         "changes": ('state', 1, 0)})],
+            self._bcp_client.send_queue)
+
+    def test_switch_monitor_delta(self):
+        # client announced that it understands partial states
+        self._bcp_client.capabilities.add("device_delta")
+        self.release_switch_and_run("s_test", .1)
+        self._bcp_client.receive_queue.put_nowait(('monitor_devices', {}))
+        self.advance_time_and_run()
+        self.assertIn(
+            ("device", {"type": "switch",
+                        "name": "s_test",
+                        "state": {'state': 0, 'recycle_jitter_count': 0},
+                        "changes": False}), self._bcp_client.send_queue)
+        self._bcp_client.send_queue.clear()
+
+        # change switch. only the changed attribute is sent
+        self.hit_switch_and_run("s_test", .1)
+        self.assertEqual(
+            [("device", {"type": "switch",
+                         "name": "s_test",
+                         "state": {'state': 1},
+                         "changes": True})],
+            self._bcp_client.send_queue)
+        self._bcp_client.send_queue.clear()
+
+        # multiple changes in one loop iteration are sent as one message
+        switch = self.machine.switches.s_test
+        switch.state = 0
+        switch.recycle_jitter_count = 5
+        switch.state = 1
+        switch.recycle_jitter_count = 3
+        self.advance_time_and_run(.1)
+        self.assertEqual(
+            [("device", {"type": "switch",
+                         "name": "s_test",
+                         "state": {'recycle_jitter_count': 3},
+                         "changes": True})],
+            self._bcp_client.send_queue)
+        self._bcp_client.send_queue.clear()
+
+        # changes are sent at most 30 times per second
+        switch.state = 0
+        self.advance_time_and_run(.01)
+        switch.state = 1
+        switch.recycle_jitter_count = 0
+        self.advance_time_and_run(.01)
+        switch.state = 0
+        self.advance_time_and_run(.01)
+        self.assertEqual(
+            [("device", {"type": "switch",
+                         "name": "s_test",
+                         "state": {'state': 0},
+                         "changes": True})],
+            self._bcp_client.send_queue)
+        self._bcp_client.send_queue.clear()
+        self.advance_time_and_run(.1)
+        self.assertEqual(
+            [("device", {"type": "switch",
+                         "name": "s_test",
+                         "state": {'recycle_jitter_count': 0},
+                         "changes": True})],
             self._bcp_client.send_queue)
 
     def test_receive_switch(self):
@@ -1,7 +1,8 @@
 import unittest
 from unittest.mock import MagicMock
 
-from mpf.core.bcp.bcp_socket_client import decode_command_string, encode_command_string
+from mpf.core.bcp.bcp_socket_client import decode_command_string, encode_command_string, BINARY_FRAME_HEADER, \
+    encode_command_binary, decode_command_binary, get_binary_codecs
 from mpf.tests.MpfTestCase import MpfTestCase
 from mpf.tests.loop import MockQueueSocket
 
@@ -97,6 +98,17 @@ class TestBcpSocketClientEncoding(unittest.TestCase):
         self.assertEqual(decoded_dict['dict2'][1],
                          dict(key3='value5', key4='value6'))
 
+    def test_binary_encoding_decoding(self):
+        for codec in get_binary_codecs():
+            payload = encode_command_binary(codec, 'Play', some_int=7, some_none=None, some_list=[1, {"a": True}])
+            self.assertEqual(('play', dict(some_int=7, some_none=None, some_list=[1, {"a": True}])),
+                             decode_command_binary(codec, payload))
+
+            # bytes stay bytes
+            payload = encode_command_binary(codec, 'data', some_bytes=b'\x00\xff', some_list=[b'abc'])
+            self.assertEqual(('data', dict(some_bytes=b'\x00\xff', some_list=[b'abc'])),
+                             decode_command_binary(codec, payload))
+
 
 class TestBcpSocketClient(MpfTestCase):
 
@@ -151,3 +163,64 @@ class TestBcpSocketClient(MpfTestCase):
         self._bcp_client.send = MagicMock()
         self.client_socket.recv_queue.append(b'invalid_method?param1=1&param2=2\n')
         self.advance_time_and_run()
+
+    def _read_sent_frames(self):
+        data = b''.join(self.client_socket.send_queue)
+        self.client_socket.send_queue.clear()
+        frames = []
+        while data:
+            payload_length, bytes_length = BINARY_FRAME_HEADER.unpack_from(data)
+            data = data[BINARY_FRAME_HEADER.size:]
+            frames.append((decode_command_binary('json', data[:payload_length]),
+                           data[payload_length:payload_length + bytes_length]))
+            data = data[payload_length + bytes_length:]
+        return frames
+
+    def testBinaryFrames(self):
+        # we announce our codecs in the hello
+        hello = self.client_socket.send_queue[0].decode()
+        self.assertIn("binary=", hello)
+        self.client_socket.send_queue.clear()
+
+        # remote supports json. we switch to binary after telling the remote
+        self.client_socket.recv_queue.append(b'hello?version=1.0&binary=custom,json&capabilities=custom,device_delta\n')
+        self.advance_time_and_run()
+        self.assertEqual([b'binary?codec=json\n'], self.client_socket.send_queue)
+        self.assertEqual({"device_delta"}, self._bcp_client.capabilities)
+        self.client_socket.send_queue.clear()
+
+        self._bcp_client.send("dmd_frame", {"name": "dmd", "rawbytes": b'\x01' * 10})
+        self._bcp_client.send("trigger", {"name": "test", "value": 2.5})
+        self.advance_time_and_run()
+        self.assertEqual([(("dmd_frame", {"name": "dmd"}), b'\x01' * 10),
+                          (("trigger", {"name": "test", "value": 2.5}), b'')],
+                         self._read_sent_frames())
+
+        # remote switches to binary as well
+        receiver = MagicMock()
+        self.machine.bcp.interface.register_command_callback("receive_bytes", receiver)
+        data = b'0' * 4096
+        payload = encode_command_binary("json", "receive_bytes", name="default", number=3)
+        frame = BINARY_FRAME_HEADER.pack(len(payload), len(data)) + payload + data
+        self.client_socket.recv_queue.append(b'binary?codec=json\n' + frame[:5])
+        self.client_socket.recv_queue.append(frame[5:1000])
+        self.client_socket.recv_queue.append(frame[1000:])
+        self.advance_time_and_run()
+        receiver.assert_called_once_with(name="default", number=3, client=self._bcp_client, rawbytes=data)
+        receiver.reset_mock()
+
+        payload = encode_command_binary("json", "receive_bytes", name="other")
+        self.client_socket.recv_queue.append(BINARY_FRAME_HEADER.pack(len(payload), 0) + payload)
+        self.advance_time_and_run()
+        receiver.assert_called_once_with(name="other", client=self._bcp_client)
+
+    def testTextProtocolForOldClients(self):
+        self.client_socket.send_queue.clear()
+        self.client_socket.recv_queue.append(b'hello?version=1.0\n')
+        self.advance_time_and_run()
+        self.assertEqual([], self.client_socket.send_queue)
+        self.assertEqual(set(), self._bcp_client.capabilities)
+
+        self._bcp_client.send("dmd_frame", {"name": "dmd", "rawbytes": b'\x01' * 10})
+        self.advance_time_and_run()
+        self.assertEqual(b'dmd_frame?name=dmd&bytes=10\n' + b'\x01' * 10, b''.join(self.client_socket.send_queue))
@@ -58,3 +58,20 @@ class ClockTestCase(unittest.TestCase):
         self.clock.unschedule(cb1)
         self.advance_time_and_run(0.001)
         self.assertEqual(counter, 1)
+
+    def test_schedule_order(self):
+        self.clock.schedule_once(partial(self.callback1, 3), .002)
+        self.clock.schedule_once(partial(self.callback1, 1), .001)
+        self.clock.schedule_once(partial(self.callback1, 2), .001)
+        self.advance_time_and_run(0.01)
+        self.assertEqual([1, 2, 3], self.callback_order)
+
+    def test_unschedule_in_same_batch(self):
+        # all callbacks share one wake-up. cancelling a later one still works
+        deadline = self.clock.get_time() + .001
+        cb2 = None
+        self.clock.schedule_at(deadline, lambda: self.clock.unschedule(cb2))
+        cb2 = self.clock.schedule_at(deadline, partial(self.callback1, 2, None))
+        self.clock.schedule_at(deadline, partial(self.callback1, 3, None))
+        self.advance_time_and_run(0.01)
+        self.assertEqual([3], self.callback_order)
@@ -0,0 +1,128 @@
+import os
+import pickle
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from mpf.core.config_cache import ConfigCache
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class TestConfigCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_file = os.path.join(self.temp_dir.name, "cache")
+        self.config_file = os.path.join(self.temp_dir.name, "config.yaml")
+        self._write(self.config_file, "switches: {}")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    @staticmethod
+    def _write(filename, content):
+        with open(filename, 'w') as f:
+            f.write(content)
+
+    def test_entries_survive_restart(self):
+        cache = ConfigCache(self.cache_file)
+        self.assertIsNone(cache.get("mode_config", "attract"))
+        config = {"mode": {"priority": 10}}
+        cache.set("mode_config", "attract", config, [self.config_file])
+
+        # later changes to the value do not end up in the cache
+        config["mode"]["priority"] = 20
+        cache.save()
+
+        cache = ConfigCache(self.cache_file)
+        self.assertEqual({"mode": {"priority": 10}}, cache.get("mode_config", "attract"))
+
+    def test_content_change_invalidates(self):
+        cache = ConfigCache(self.cache_file)
+        cache.set("mode_config", "attract", {"a": 1}, [self.config_file])
+        cache.save()
+
+        # mtime does not matter
+        os.utime(self.config_file, (0, 0))
+        self.assertEqual({"a": 1}, ConfigCache(self.cache_file).get("mode_config", "attract"))
+
+        self._write(self.config_file, "switches: {s1: {}}")
+        self.assertIsNone(ConfigCache(self.cache_file).get("mode_config", "attract"))
+
+    def test_new_file_invalidates(self):
+        missing_file = os.path.join(self.temp_dir.name, "missing.yaml")
+        cache = ConfigCache(self.cache_file)
+        cache.set("mode_config", "attract", {"a": 1}, [missing_file])
+        cache.save()
+
+        self.assertEqual({"a": 1}, ConfigCache(self.cache_file).get("mode_config", "attract"))
+
+        self._write(missing_file, "mode: {}")
+        self.assertIsNone(ConfigCache(self.cache_file).get("mode_config", "attract"))
+
+    def test_unused_entries_are_dropped(self):
+        cache = ConfigCache(self.cache_file)
+        cache.set("show", "show1", [1])
+        cache.set("show", "show2", [2])
+        cache.save()
+
+        cache = ConfigCache(self.cache_file)
+        cache.get("show", "show1")
+        cache.set("show", "show3", [3])
+        cache.save()
+
+        cache = ConfigCache(self.cache_file)
+        self.assertEqual([1], cache.get("show", "show1"))
+        self.assertIsNone(cache.get("show", "show2"))
+        self.assertEqual([3], cache.get("show", "show3"))
+
+    def test_other_version(self):
+        with open(self.cache_file, 'wb') as f:
+            pickle.dump({"_version": (0, "0.0"), "entries": {("show", "show1"): ((), pickle.dumps([1]))}}, f)
+
+        self.assertIsNone(ConfigCache(self.cache_file).get("show", "show1"))
+
+    def test_no_load_and_no_save(self):
+        cache = ConfigCache(self.cache_file)
+        cache.set("show", "show1", [1])
+        cache.save()
+
+        self.assertIsNone(ConfigCache(self.cache_file, load=False).get("show", "show1"))
+
+        cache = ConfigCache(self.cache_file, save=False)
+        cache.set("show", "show2", [2])
+        cache.save()
+        self.assertIsNone(ConfigCache(self.cache_file).get("show", "show2"))
+
+    def test_read_only_location(self):
+        cache = ConfigCache(os.path.join(self.temp_dir.name, "missing_dir", "cache"))
+        cache.set("show", "show1", [1])
+        # does not raise
+        cache.save()
+
+
+class TestConfigCacheMachine(MpfTestCase):
+
+    def getConfigFile(self):
+        return 'test_modes.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/mode_tests/'
+
+    def test_warm_start(self):
+        cache = self.machine.config_cache
+        self.assertTrue(cache.get('machine_config', tuple(self.machine.options['configfile'])))
+        self.assertTrue(cache.get('mode_config', ('mode1', None, 'mode1')))
+
+        # a validated device section is reused
+        validator = self.machine.config_validator
+        validated = validator.validate_section("switches", {"number": "42"}, "test_switch", "device")
+
+        validator.validate_config = MagicMock()
+        self.assertEqual(validated, validator.validate_section("switches", {"number": "42"}, "test_switch",
+                                                               "device"))
+        self.assertFalse(validator.validate_config.called)
+
+        # a section with other content is validated again
+        validator.validate_section("switches", {"number": "43"}, "test_switch", "device")
+        self.assertTrue(validator.validate_config.called)
@@ -1,9 +1,10 @@
-"""Test the bonus mode."""
-import time
-from unittest.mock import mock_open, patch
+"""Test the DataManager."""
+import os
+import tempfile
 
-from mpf.file_interfaces.yaml_interface import YamlInterface
 from mpf.core.data_manager import DataManager
+from mpf.core.file_manager import FileManager
+from mpf.file_interfaces.yaml_interface import YamlInterface
 from mpf.tests.MpfTestCase import MpfTestCase
 
 
@@ -12,49 +13,124 @@ class TestDataManager(MpfTestCase):
     def setUp(self):
         super().setUp()
         YamlInterface.cache = False
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.temp_dir.name, "data", "machine_vars.yaml")
+        self.machine.config['mpf']['paths']['machine_vars'] = self.filename
+        self.managers = []
 
     def tearDown(self):
         YamlInterface.cache = True
         super().tearDown()
+        for manager in self.managers:
+            manager._writing_thread.join(5)
+        self.temp_dir.cleanup()
 
-    def test_save_and_load(self):
-        open_mock = mock_open(read_data="")
-        with patch('mpf.file_interfaces.yaml_interface.open', open_mock, create=True):
-            with patch('mpf.core.file_manager.os.path.isfile') as isfile_mock:
-                isfile_mock.return_value = True
-                manager = DataManager(self.machine, "machine_vars")
-                self.assertTrue(isfile_mock.called)
-                self.assertTrue(open_mock.called)
+    def _create_manager(self):
+        manager = DataManager(self.machine, "machine_vars")
+        self.managers.append(manager)
+        return manager
 
+    def test_save_and_load(self):
+        manager = self._create_manager()
         self.assertNotIn("hallo", manager.get_data())
 
-        open_mock = mock_open(read_data="")
-        with patch('mpf.file_interfaces.yaml_interface.open', open_mock, create=True):
-            with patch('mpf.core.data_manager.os.replace') as move_mock:
-                manager.save_key("hallo", "world")
-                while not move_mock.called:
-                    time.sleep(.00001)
-                open_mock().write.assert_called_once_with('hallo: world\n')
-                self.assertTrue(move_mock.called)
-
-        open_mock = mock_open(read_data='hallo: world\n')
-        with patch('mpf.file_interfaces.yaml_interface.open', open_mock, create=True):
-            with patch('mpf.core.file_manager.os.path.isfile') as isfile_mock:
-                isfile_mock.return_value = True
-                manager2 = DataManager(self.machine, "machine_vars")
-                self.assertTrue(isfile_mock.called)
-                self.assertTrue(open_mock.called)
+        manager.save_key("hallo", "world")
+        manager.save_key("test", {"a": 1})
+        manager.remove_key("test")
+        # nothing is written until the write window passed
+        self.assertFalse(os.path.isfile(manager.journal_filename))
+        self.advance_time_and_run(1)
+        manager._shutdown()
 
+        manager2 = self._create_manager()
         self.assertEqual("world", manager2.get_data()["hallo"])
-        self.assertEqual({}, manager.get_data("hallo"))
+        self.assertNotIn("test", manager2.get_data())
+        self.assertEqual({}, manager2.get_data("hallo"))
+
+    def test_journal_and_compaction(self):
+        self.machine.config['mpf']['data_manager_compact_records'] = 3
+        manager = self._create_manager()
+
+        manager.save_key("key1", 1)
+        manager.save_key("key2", 2)
+        self.advance_time_and_run(1)
+        manager._write_queue.join()
+
+        # changes only went to the journal
+        self.assertFalse(os.path.isfile(self.filename))
+        self.assertTrue(os.path.getsize(manager.journal_filename))
+        self.assertEqual({"key1": 1, "key2": 2}, self._create_manager().get_data())
+
+        # too many records in the journal. compact it into the yaml file
+        manager.save_key("key1", 3)
+        manager.save_key("key2", 4)
+        self.advance_time_and_run(1)
+        manager._write_queue.join()
+
+        self.assertEqual({"key1": 3, "key2": 4}, FileManager.load(self.filename))
+        self.assertEqual(0, os.path.getsize(manager.journal_filename))
+        self.assertEqual({"key1": 3, "key2": 4}, self._create_manager().get_data())
+
+    def test_shutdown_writes_all_queued_changes(self):
+        manager = self._create_manager()
+        self.machine.thread_stopper.set()
+        # the writer only stops at the sentinel from _shutdown
+        for i in range(10):
+            manager.save_key("key{}".format(i), i)
+            manager.write_changes()
+        manager._shutdown()
+        self.assertFalse(manager._writing_thread.is_alive())
+        self.assertEqual({"key{}".format(i): i for i in range(10)}, self._create_manager().get_data())
+
+    def test_unchanged_keys_are_not_written(self):
+        manager = self._create_manager()
+        data = {"audits": {"a": 1}, "scores": [1, 2]}
+        manager.save_all(data=data)
+        self.advance_time_and_run(1)
+        self.assertEqual(2, len(manager._write_queue.get()))
+
+        data["audits"]["a"] = 2
+        manager.save_all(data=data)
+        manager.save_all(data=data)
+        self.advance_time_and_run(1)
+        self.assertEqual([("audits", manager._records["audits"])], manager._write_queue.get())
+        self.assertTrue(manager._write_queue.empty())
+
+    def test_torn_record(self):
+        manager = self._create_manager()
+        manager.save_key("key1", 1)
+        self.advance_time_and_run(1)
+        manager.save_key("key1", 2)
+        self.advance_time_and_run(1)
+        manager._write_queue.join()
+
+        # simulate a power cut while the last record was written
+        with open(manager.journal_filename, 'rb+') as f:
+            f.truncate(os.path.getsize(manager.journal_filename) - 2)
+
+        manager = self._create_manager()
+        self.assertEqual({"key1": 1}, manager.get_data())
+
+        # records written after the torn one have to survive the next load
+        manager.save_key("key2", 3)
+        self.advance_time_and_run(1)
+        manager._write_queue.join()
+
+        self.assertEqual({"key1": 1, "key2": 3}, self._create_manager().get_data())
 
     def test_get_data(self):
-        open_mock = mock_open(read_data='hallo:\n  test: world\n')
-        with patch('mpf.file_interfaces.yaml_interface.open', open_mock, create=True):
-            with patch('mpf.core.file_manager.os.path.isfile') as isfile_mock:
-                manager = DataManager(self.machine, "machine_vars")
-                self.assertTrue(isfile_mock.called)
-                self.assertTrue(open_mock.called)
+        os.makedirs(os.path.dirname(self.filename))
+        with open(self.filename, 'w') as f:
+            f.write('hallo:\n  test: world\n')
+
+        manager = self._create_manager()
 
         self.assertEqual({"test": "world"}, manager.get_data("hallo"))
         self.assertEqual({}, manager.get_data("invalid"))
+
+    def test_export_yaml(self):
+        manager = self._create_manager()
+        manager.save_key("hallo", "world")
+        export = os.path.join(self.temp_dir.name, "export.yaml")
+        manager.export_yaml(export)
+        self.assertEqual({"hallo": "world"}, FileManager.load(export))
@@ -1,4 +1,5 @@
 """Test the LED device."""
+from mpf.core.led_frame_engine import numpy_imported
 from mpf.devices.led import Led
 
 from mpf.core.rgb_color import RGBColor
@@ -370,3 +371,34 @@ class TestLed(MpfTestCase):
 
         self.assertEqual([80, 80, 80], self.machine.leds.led1.hw_driver.current_color)
 
+
+class TestLedFrameEngine(TestLed):
+
+    """Run all LED tests again with the vectorised frame engine."""
+
+    def setUp(self):
+        if not numpy_imported:
+            self.skipTest("numpy is not installed")
+
+        self.machine_config_patches['led_settings'] = {'frame_engine': True}
+        super().setUp()
+
+    def test_frame_buffer(self):
+        engine = Led._frame_engine
+        self.assertTrue(engine)
+        self.assertEqual(len(self.machine.leds), len(engine.leds))
+
+        self.machine.leds.led2.color(RGBColor((11, 23, 42)))
+        self.machine.leds.led3.color(RGBColor((11, 23, 42)))
+        self.advance_time_and_run(1)
+
+        # every led writes its channels into one shared buffer
+        buffer = engine.buffer.tolist()
+        position = 0
+        for led in engine.leds:
+            channels = buffer[position:position + len(led.config['type'])]
+            position += len(led.config['type'])
+            if led in (self.machine.leds.led2, self.machine.leds.led3):
+                self.assertEqual(led.hw_driver.current_color, channels)
+
+        self.assertEqual(len(buffer), position)
@@ -0,0 +1,40 @@
+import unittest
+
+from mpf.core.dmd_frame_encoder import RowDeltaEncoder
+
+
+class TestRowDeltaEncoder(unittest.TestCase):
+
+    def test_row_delta(self):
+        # 2 pixels per row, 4 rows
+        encoder = RowDeltaEncoder(2, keyframe_interval=2)
+        frame1 = bytes(range(24))
+        self.assertEqual(b'\x03\x01' + frame1, encoder.encode(frame1))
+
+        # row 2 changed
+        frame2 = frame1[:12] + b'\xff' * 6 + frame1[18:]
+        self.assertEqual(b'\x02\x01\x02\x01' + b'\x02' + b'\xff' * 6, encoder.encode(frame2))
+
+        # nothing changed
+        self.assertEqual(b'\x02\x02\x03\x00', encoder.encode(frame2))
+
+        # key frame after keyframe_interval deltas
+        self.assertEqual(b'\x03\x04' + frame2, encoder.encode(frame2))
+        self.assertEqual(2, encoder.key_frames)
+        self.assertEqual(2, encoder.delta_frames)
+
+    def test_key_frames(self):
+        encoder = RowDeltaEncoder(2)
+        frame1 = bytes(24)
+        encoder.encode(frame1)
+
+        # a delta of all rows is larger than a key frame
+        frame2 = b'\x01' * 24
+        self.assertEqual(b'\x03\x02' + frame2, encoder.encode(frame2))
+
+        # after reset (e.g. resync requested by the dmd)
+        encoder.reset()
+        self.assertEqual(b'\x03\x03' + frame2, encoder.encode(frame2))
+
+        # frame size changed
+        self.assertEqual(b'\x03\x04' + frame2[:12], encoder.encode(frame2[:12]))
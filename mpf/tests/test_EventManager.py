@@ -1,4 +1,6 @@
 """Test event manager."""
+import time
+
 from mpf.core.delays import DelayManager
 from mpf.tests.MpfTestCase import MpfTestCase
 from unittest.mock import patch
@@ -193,6 +195,52 @@ class TestEventManager(MpfTestCase):
         self.assertEqual(self._handlers_called[0], self.event_handler2)
         self.assertEqual(self._handlers_called[1], self.event_handler1)
 
+    def test_event_handler_same_priority(self):
+        # handlers with the same priority are called in registration order
+        self.machine.events.add_handler('test_event', self.event_handler1, priority=100)
+        self.machine.events.add_handler('test_event', self.event_handler2, priority=200)
+        self.machine.events.add_handler('test_event', self.event_handler3, priority=100)
+
+        self.machine.events.post('test_event')
+        self.advance_time_and_run(1)
+
+        self.assertEqual([self.event_handler2, self.event_handler1, self.event_handler3], self._handlers_called)
+
+    def _add_handler3(self, **kwargs):
+        del kwargs
+        self.machine.events.add_handler('test_event', self.event_handler3, priority=0)
+
+    def test_add_handler_while_processing(self):
+        # handlers added while an event is processed are called on the next
+        # post only
+        self.machine.events.add_handler('test_event', self._add_handler3, priority=100)
+        self.machine.events.add_handler('test_event', self.event_handler1, priority=50)
+
+        self.machine.events.post('test_event')
+        self.advance_time_and_run(1)
+        self.assertEqual(1, self._handler1_called)
+        self.assertEqual(0, self._handler3_called)
+
+        self.machine.events.remove_handler(self._add_handler3)
+        self.machine.events.post('test_event', test=1)
+        self.advance_time_and_run(1)
+        self.assertEqual(2, self._handler1_called)
+        self.assertEqual(1, self._handler3_called)
+        self.assertEqual({"test": 1}, self._handler3_kwargs)
+
+    def test_post_benchmark(self):
+        for priority in range(5):
+            self.machine.events.add_handler('test_event', self.event_handler1, priority=priority, handler_kwarg=1)
+
+        start = time.perf_counter()
+        for _ in range(100000):
+            self.machine.events.post('test_event', post_kwarg=2)
+            self.machine.events.process_event_queue()
+        self.machine.log.info("Posting 100k events with 5 handlers took %ss", time.perf_counter() - start)
+
+        self.assertEqual(500000, self._handler1_called)
+        self.assertEqual({"handler_kwarg": 1, "post_kwarg": 2}, self._handler1_kwargs)
+
     def test_remove_handler_by_handler(self):
         # tests that a handler can be removed by passing the handler to remove
         self.machine.events.add_handler('test_event', self.event_handler1)
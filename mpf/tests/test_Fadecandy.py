@@ -56,7 +56,15 @@ class TestFadecandy(MpfTestCase):
         bank2 = self._build_message(1, leds2)
         found1 = False
         found2 = False
-        for message in self._messages:
+        # split writes into OPC messages
+        messages = []
+        for data in self._messages:
+            while data:
+                length = 4 + data[2] * 256 + data[3]
+                messages.append(data[:length])
+                data = data[length:]
+
+        for message in messages:
             if not (message == bank1 or message == bank2):
                 print(":".join("{:02x}".format(c) for c in message))
                 print(":".join("{:02x}".format(c) for c in bank1))
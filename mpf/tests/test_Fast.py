@@ -95,10 +95,13 @@ class MockFastRgb(BaseMockFast):
         self.type = "RGB"
         self.ignore_commands["L1:23,FF"] = True
         self.leds = {}
+        self.led_messages = []
 
     def _parse(self, cmd):
         if cmd[:3] == "RS:":
-            self.leds[cmd[3:5]] = cmd[5:]
+            self.led_messages.append(cmd)
+            for led in cmd[3:].split(","):
+                self.leds[led[0:2]] = led[2:]
             self.queue.append("RX:P")
             return True
 
@@ -673,3 +676,21 @@ class TestFast(MpfTestCase):
         device.color(RGBColor((2, 23, 42)))
         self.advance_time_and_run(1)
         self.assertEqual("02172a", self.rgb_cpu.leds['97'])
+
+        # unchanged leds are only sent on refresh (once per second)
+        self.rgb_cpu.led_messages = []
+        self.advance_time_and_run(1.05)
+        self.assertEqual(["RS:9702172a"], self.rgb_cpu.led_messages)
+        self.rgb_cpu.led_messages = []
+
+        # messages are split at the max line length
+        platform = self.machine.default_platform
+        leds = [platform.configure_led({"number": str(number)}, 3) for number in range(40)]
+        for led in leds:
+            led.color([255, 0, 1])
+        self.advance_time_and_run(.1)
+        self.assertEqual(2, len(self.rgb_cpu.led_messages))
+        for message in self.rgb_cpu.led_messages:
+            self.assertLessEqual(len(message), 256)
+        self.assertEqual("ff0001", self.rgb_cpu.leds['00'])
+        self.assertEqual("ff0001", self.rgb_cpu.leds['27'])
@@ -0,0 +1,88 @@
+from mpf.tests.MpfTestCase import MpfTestCase
+from mpf.tests.loop import MockSerial
+
+
+class MockJRSerial(MockSerial):
+
+    def __init__(self):
+        super().__init__()
+        self.queue = []
+        self.writes = []
+
+    def read(self, length):
+        del length
+        if not self.queue:
+            return b""
+        return self.queue.pop(0)
+
+    def read_ready(self):
+        return bool(self.queue)
+
+    def write_ready(self):
+        return True
+
+    def write(self, msg):
+        self.writes.append(msg)
+        return len(msg)
+
+
+class TestJR(MpfTestCase):
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/jr/'
+
+    def get_platform(self):
+        return 'jr'
+
+    def _mock_loop(self):
+        self.clock.mock_serial("com1", self.serialMock)
+
+    def setUp(self):
+        self.serialMock = MockJRSerial()
+        super().setUp()
+
+    def test_switches(self):
+        self.assertTrue(self.machine.default_platform.features['tickless'])
+        self.assertFalse(self.machine.switch_controller.is_active("s_test"))
+
+        self.serialMock.queue.append(b'P\x03')
+        self.advance_time_and_run(.01)
+        self.assertTrue(self.machine.switch_controller.is_active("s_test"))
+
+        # frames may be split and garbage is skipped
+        self.serialMock.queue.append(b'\x00R')
+        self.advance_time_and_run(.01)
+        self.assertTrue(self.machine.switch_controller.is_active("s_test"))
+        self.serialMock.queue.append(b'\x03P\x07R\x07')
+        self.advance_time_and_run(.01)
+        self.assertFalse(self.machine.switch_controller.is_active("s_test"))
+        self.assertFalse(self.machine.switch_controller.is_active("s_slingshot"))
+
+        self.assertEqual({3: 0, 7: 0}, self.machine.default_platform.get_hw_switch_states())
+
+    def test_drivers(self):
+        self.serialMock.writes = []
+        # commands of one loop iteration are sent together
+        self.machine.coils.c_test.pulse()
+        self.machine.coils.c_test_allow_enable.enable()
+        self.advance_time_and_run(.01)
+        self.assertEqual([b'P\x00\x00\x00\x01A\x00\x00\x00\x02'], self.serialMock.writes)
+
+        self.serialMock.writes = []
+        self.machine.coils.c_test_allow_enable.disable()
+        self.advance_time_and_run(.01)
+        self.assertEqual([b'E\x00\x00\x00\x02'], self.serialMock.writes)
+
+    def test_hw_rule(self):
+        self.serialMock.writes = []
+        self.machine.autofires.ac_slingshot.enable()
+        self.advance_time_and_run(.01)
+        self.assertEqual([b'I\x07\x80\x00\x00\x00'], self.serialMock.writes)
+
+        self.serialMock.writes = []
+        self.machine.autofires.ac_slingshot.disable()
+        self.advance_time_and_run(.01)
+        self.assertEqual([b'I\x07\x00\x00\x00\x00'], self.serialMock.writes)
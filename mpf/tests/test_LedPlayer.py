@@ -1,4 +1,6 @@
 """Test led player."""
+from unittest.mock import MagicMock
+
 from mpf.devices.led import Led
 
 from mpf.core.rgb_color import RGBColor
@@ -169,6 +171,44 @@ class TestLedPlayer(MpfTestCase):
         self.assertEqual(list(RGBColor('red').rgb),
                          self.machine.leds.led5.hw_driver.current_color)
 
+    def test_bound_actions(self):
+        # devices and colors are resolved when the events are registered
+        items_tagged = MagicMock(wraps=self.machine.leds.items_tagged)
+        self.machine.leds.items_tagged = items_tagged
+        led_player = self.machine.show_controller.show_players['leds']
+        led_player._parse_config = MagicMock(wraps=led_player._parse_config)
+
+        self.machine.events.post('event2')
+        self.machine.events.post('event5')
+        self.advance_time_and_run(1)
+        self.machine.events.post('event2', priority=50)
+        self.advance_time_and_run(1)
+
+        self.assertFalse(items_tagged.called)
+        self.assertFalse(led_player._parse_config.called)
+        self.assertEqual(list(RGBColor('blue').rgb), self.machine.leds.led1.hw_driver.current_color)
+        self.assertEqual(list(RGBColor('blue').rgb), self.machine.leds.led2.hw_driver.current_color)
+        self.assertEqual(list(RGBColor('red').rgb), self.machine.leds.led5.hw_driver.current_color)
+        # priority of the event is added to the priority of the entry
+        self.assertEqual(150, self.machine.leds.led1.stack[0]['priority'])
+
+        # play binds settings which were not bound before
+        led_player.play({'led1, led4': {'color': 'green', 'fade_ms': 0}}, '_global', priority=200)
+        self.advance_time_and_run(1)
+        self.assertEqual(list(RGBColor('green').rgb), self.machine.leds.led1.hw_driver.current_color)
+        self.assertEqual(list(RGBColor('green').rgb), self.machine.leds.led4.hw_driver.current_color)
+
+        # tags are resolved whenever the action plays
+        play_action = led_player.get_play_action({'tag1': {'color': 'red', 'fade_ms': 0, 'priority': 0}})
+        play_action('_global', 300)
+        self.advance_time_and_run(1)
+        self.assertEqual(list(RGBColor('red').rgb), self.machine.leds.led1.hw_driver.current_color)
+        self.assertEqual(list(RGBColor('green').rgb), self.machine.leds.led4.hw_driver.current_color)
+        self.machine.leds.led4.tags.append('tag1')
+        play_action('_global', 300)
+        self.advance_time_and_run(1)
+        self.assertEqual(list(RGBColor('red').rgb), self.machine.leds.led4.hw_driver.current_color)
+
     def test_single_step_show(self):
         # with single step shows, loops are automatically set to 0, hold is
         # automatically set to true
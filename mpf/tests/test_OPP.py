@@ -24,23 +24,46 @@ class MockOppSocket(MockSerial):
     def write_ready(self):
         return True
 
-    def write(self, msg):
-        if msg in self.permanent_commands:
-            self.queue.append(self.permanent_commands[msg])
-            return len(msg)
+    @staticmethod
+    def _strip_eom(cmd):
+        if len(cmd) > 1 and cmd.endswith(b'\xff'):
+            return cmd[:-1]
+        return cmd
+
+    def _find_command(self, msg, commands):
+        # longest command at the start of msg. commands may be batched into one frame with one EOM
+        found = None
+        for cmd in commands:
+            if msg.startswith(self._strip_eom(cmd)) and (found is None or len(cmd) > len(found)):
+                found = cmd
+        return found
 
+    def write(self, msg):
+        length = len(msg)
+        self.writes.append(msg)
         # print("Serial received: " + "".join("\\x%02x" % b for b in msg) + " len: " + str(len(msg)))
-        if msg not in self.expected_commands:
-            self.crashed = True
-            print("Unexpected command: " + "".join("\\x%02x" % b for b in msg) + " len: " + str(len(msg)))
-            raise AssertionError("Unexpected command: " + "".join("\\x%02x" % b for b in msg) +
-                                 " len: " + str(len(msg)))
+        while msg:
+            cmd = self._find_command(msg, self.permanent_commands)
+            if cmd is not None:
+                self.queue.append(self.permanent_commands[cmd])
+            else:
+                cmd = self._find_command(msg, self.expected_commands)
+                if cmd is None:
+                    self.crashed = True
+                    print("Unexpected command: " + "".join("\\x%02x" % b for b in msg) + " len: " + str(len(msg)))
+                    raise AssertionError("Unexpected command: " + "".join("\\x%02x" % b for b in msg) +
+                                         " len: " + str(len(msg)))
+
+                if self.expected_commands[cmd] is not False:
+                    self.queue.append(self.expected_commands[cmd])
+
+                del self.expected_commands[cmd]
 
-        if self.expected_commands[msg] is not False:
-            self.queue.append(self.expected_commands[msg])
+            msg = msg[len(self._strip_eom(cmd)):]
+            if msg.startswith(b'\xff') and cmd.endswith(b'\xff'):
+                msg = msg[1:]
 
-        del self.expected_commands[msg]
-        return len(msg)
+        return length
 
     def __init__(self):
         super().__init__()
@@ -49,6 +72,7 @@ class MockOppSocket(MockSerial):
         self.queue = []
         self.permanent_commands = {}
         self.crashed = False
+        self.writes = []
 
 
 class TestOPP(MpfTestCase):
@@ -118,10 +142,83 @@ class TestOPP(MpfTestCase):
         self._test_coils()
         self._test_leds()
         self._test_matrix_lights()
+        self._test_frames()
         self._test_autofires()
         self._test_switches()
         self._test_flippers()
 
+    def test_poll_rate(self):
+        connection = self.machine.default_platform.opp_connection["com1"]
+
+        # idle inputs are polled at 100Hz
+        self.advance_time_and_run(1)
+        stats = self.machine.default_platform.get_poll_stats()["com1"]
+        self.assertAlmostEqual(100, stats["poll_rate"], delta=10)
+        self.assertLess(stats["rtt"], .01)
+        self.assertEqual(0, stats["late_replies"])
+
+        # changing inputs are polled at full rate
+        inputs_message = b"\x20\x08\x00\x00\x01\x08"
+        self.serialMock.permanent_commands = {
+            self._crc_message(b'\x20\x08\x00\x00\x00\x00', False) + self._crc_message(b'\x21\x08\x00\x00\x00\x00'):
+                self._crc_message(inputs_message, False) + self._crc_message(b"\x21\x08\x00\x00\x00\x00")
+        }
+        self.advance_time_and_run(.2)
+        self.assertFalse(self.machine.switch_controller.is_active("s_test_nc"))
+        self.assertGreater(self.machine.default_platform.get_poll_stats()["com1"]["poll_rate"], 300)
+
+        # and back off again
+        self.advance_time_and_run(2)
+        self.assertAlmostEqual(100, self.machine.default_platform.get_poll_stats()["com1"]["poll_rate"], delta=10)
+
+        # a poll which is not answered times out
+        poll = self._crc_message(b'\x20\x08\x00\x00\x00\x00', False) + self._crc_message(b'\x21\x08\x00\x00\x00\x00')
+        self.serialMock.permanent_commands = {}
+        self.serialMock.expected_commands = {poll: False}
+        self.advance_time_and_run(.02)
+        self.assertFalse(self.serialMock.expected_commands)
+        self.serialMock.expected_commands = {poll: False}
+        self.advance_time_and_run(.1)
+
+        # late replies do not count against the next poll. it is only sent after the chain is quiet
+        connection.inputs_received(False)
+        self.advance_time_and_run(.07)
+        connection.inputs_received(False)
+        self.advance_time_and_run(.07)
+        self.assertIn(poll, self.serialMock.expected_commands)
+        self.assertEqual(2, self.machine.default_platform.get_poll_stats()["com1"]["late_replies"])
+        self.advance_time_and_run(.1)
+        self.assertFalse(self.serialMock.expected_commands)
+
+        # the chain answers again
+        self.serialMock.permanent_commands = {
+            poll: self._crc_message(inputs_message, False) + self._crc_message(b"\x21\x08\x00\x00\x00\x00")
+        }
+        self.advance_time_and_run(2)
+        self.assertAlmostEqual(100, self.machine.default_platform.get_poll_stats()["com1"]["poll_rate"], delta=10)
+        self.assertEqual(2, self.machine.default_platform.get_poll_stats()["com1"]["late_replies"])
+
+    def test_poll_bad_replies(self):
+        platform = self.machine.default_platform
+        poll = self._crc_message(b'\x20\x08\x00\x00\x00\x00', False) + self._crc_message(b'\x21\x08\x00\x00\x00\x00')
+        good_reply = self._crc_message(b"\x21\x08\x00\x00\x00\x00")
+        self.advance_time_and_run(1)
+
+        # a reply with a bad CRC completes the poll and the chain is polled again at full rate
+        self.serialMock.permanent_commands = {poll: b"\x20\x08\x00\x00\x01\x08\x00" + good_reply}
+        poll_count = platform.get_poll_stats()["com1"]["polls"]
+        self.advance_time_and_run(.1)
+        self.assertGreater(platform.get_poll_stats()["com1"]["polls"] - poll_count, 50)
+        self.assertGreater(platform.badCRC, 50)
+        self.assertEqual(0, platform.get_poll_stats()["com1"]["late_replies"])
+
+        # a reply which the decoder drops ends the poll without waiting for the timeout
+        self.serialMock.permanent_commands = {poll: b"\x20\x01\x00\x00\x00\x00\x00" + good_reply}
+        poll_count = platform.get_poll_stats()["com1"]["polls"]
+        self.advance_time_and_run(1)
+        self.assertGreater(platform.get_poll_stats()["com1"]["polls"] - poll_count, 8)
+        self.assertGreater(platform.get_poll_stats()["com1"]["late_replies"], 8)
+
     def _test_switches(self):
         # initial switches
         self.assertTrue(self.machine.switch_controller.is_active("s_test"))
@@ -147,6 +244,8 @@ class TestOPP(MpfTestCase):
         self.assertFalse(self.machine.switch_controller.is_active("s_test_nc"))
         self.assertFalse(self.machine.switch_controller.is_active("s_flipper"))
         self.assertFalse(self.machine.switch_controller.is_active("s_test_card2"))
+        # the snapshot of the polled inputs matches
+        self.assertTrue(self.machine.switch_controller.verify_switches())
 
         self.serialMock.permanent_commands = permanent_commands
 
@@ -202,6 +301,29 @@ class TestOPP(MpfTestCase):
         self._wait_for_processing()
         self.assertFalse(self.serialMock.expected_commands)
 
+    def _test_frames(self):
+        incand_cmd = self._crc_message(b'\x20\x13\x07\x00\x02\x00\x00', False)
+        neo_cmd = self._crc_message(b'\x21\x16\x01\x81', False)
+        self.serialMock.expected_commands[incand_cmd] = False
+        self.serialMock.expected_commands[neo_cmd] = False
+        self.serialMock.writes = []
+
+        # all changes of one tick are sent in one frame
+        self.machine.lights.test_light1.off()
+        self.machine.lights.test_light1.on()
+        self.machine.lights.test_light1.off()
+        self.machine.leds.test_led2.color([0, 0, 0])
+        self._wait_for_processing()
+        self.assertFalse(self.serialMock.expected_commands)
+        frames = [msg for msg in self.serialMock.writes if incand_cmd in msg or neo_cmd in msg]
+        self.assertEqual([incand_cmd + neo_cmd + b'\xff'], frames)
+
+        # nothing changed. nothing is sent
+        self.serialMock.writes = []
+        self.machine.lights.test_light2.on()
+        self.advance_time_and_run(.1)
+        self.assertFalse([msg for msg in self.serialMock.writes if msg[:2] == b'\x20\x13'])
+
     def _test_leds(self):
         # add ff/ff/ff as color 0
         self.serialMock.expected_commands[self._crc_message(b'\x21\x11\x00\xff\xff\xff', False)] = False
@@ -1,5 +1,9 @@
 """Test openpixel hardware interface."""
+from unittest.mock import patch
+
+from mpf.core.led_frame_engine import numpy_imported
 from mpf.core.rgb_color import RGBColor
+from mpf.platforms.openpixel import OpenPixelLED
 from mpf.tests.MpfTestCase import MpfTestCase
 from mpf.tests.loop import MockSocket
 
@@ -17,7 +21,7 @@ class TestOpenpixel(MpfTestCase):
     def setUp(self):
         self._messages = []
         super().setUp()
-        self.assertOpenPixelLedsSent({}, {})
+        self.assertOpenPixelLedsSent({0: {}, 1: {}})
         self.assertTrue(self._mock_socket.is_open)
 
     def _mock_loop(self):
@@ -41,9 +45,9 @@ class TestOpenpixel(MpfTestCase):
         self._messages.append(message)
         return len(message)
 
-    def assertOpenPixelLedsSent(self, leds1, leds2):
-        self.assertEqual([self._build_message(0, leds1),
-                          self._build_message(1, leds2)],
+    def assertOpenPixelLedsSent(self, channels):
+        # all changed channels are sent in one write
+        self.assertEqual([b''.join(self._build_message(channel, leds) for channel, leds in sorted(channels.items()))],
                          self._messages)
         self._messages = []
 
@@ -51,27 +55,44 @@ class TestOpenpixel(MpfTestCase):
         # test led on channel 0. position 99
         self.machine.leds.test_led.on()
         self.advance_time_and_run(1)
-        self.assertOpenPixelLedsSent({99: (255, 255, 255)}, {})
+        self.assertOpenPixelLedsSent({0: {99: (255, 255, 255)}})
 
         # test led 20 ond channel 0
         self.machine.leds.test_led2.color(RGBColor((255, 0, 0)))
         self.advance_time_and_run(1)
-        self.assertOpenPixelLedsSent({20: (255, 0, 0), 99: (255, 255, 255)}, {})
+        self.assertOpenPixelLedsSent({0: {20: (255, 0, 0), 99: (255, 255, 255)}})
 
         self.machine.leds.test_led.off()
         self.advance_time_and_run(1)
-        self.assertOpenPixelLedsSent({20: (255, 0, 0), 99: (0, 0, 0)}, {})
+        self.assertOpenPixelLedsSent({0: {20: (255, 0, 0), 99: (0, 0, 0)}})
         self._messages = []
 
         # test led color
         self.machine.leds.test_led.color(RGBColor((2, 23, 42)))
         self.advance_time_and_run(1)
-        self.assertOpenPixelLedsSent({20: (255, 0, 0), 99: (2, 23, 42)}, {})
+        self.assertOpenPixelLedsSent({0: {20: (255, 0, 0), 99: (2, 23, 42)}})
 
-        # test led on channel 1
+        # test led on channel 1. only channel 1 is sent
         self.machine.leds.test_led3.on()
         self.advance_time_and_run(1)
-        self.assertOpenPixelLedsSent({20: (255, 0, 0), 99: (2, 23, 42)}, {99: (255, 255, 255)})
+        self.assertOpenPixelLedsSent({1: {99: (255, 255, 255)}})
+
+        # both channels change at once
+        self.machine.leds.test_led.off()
+        self.machine.leds.test_led3.off()
+        self.advance_time_and_run(1)
+        self.assertOpenPixelLedsSent({0: {20: (255, 0, 0)}, 1: {}})
+
+        # nothing changed. nothing is sent
+        self.advance_time_and_run(1)
+        self.assertEqual([], self._messages)
+
+    def test_set_pixel_color(self):
+        client = self.machine.default_platform.opc_client
+        client.set_pixel_color(0, 3, (300, -5, 12.7))
+        client.set_pixel_color(1, 4, [1, 2, 3])
+        self.advance_time_and_run(1)
+        self.assertOpenPixelLedsSent({0: {3: (255, 0, 12)}, 1: {4: (1, 2, 3)}})
 
     def test_configure_led(self):
         # test configure_led with int format
@@ -82,3 +103,24 @@ class TestOpenpixel(MpfTestCase):
         self.machine.config['open_pixel_control']['number_format'] = "hex"
         led = self.machine.default_platform.configure_led({"number": "10"}, 3)
         self.assertEqual(16, led.led)
+
+
+class TestOpenpixelFrameEngine(TestOpenpixel):
+
+    """Run the openpixel tests again with the vectorised LED frame engine."""
+
+    def setUp(self):
+        if not numpy_imported:
+            self.skipTest("numpy is not installed")
+
+        self.machine_config_patches['led_settings'] = {'frame_engine': True}
+        super().setUp()
+
+    def test_color_from_buffer(self):
+        # channels are copied from the frame buffer without building a list
+        with patch.object(OpenPixelLED, 'color') as color:
+            self.machine.leds.test_led.color(RGBColor((2, 23, 42)))
+            self.advance_time_and_run(1)
+
+        self.assertFalse(color.called)
+        self.assertOpenPixelLedsSent({0: {99: (2, 23, 42)}})
@@ -1,3 +1,5 @@
+import time
+
 from mpf.tests.MpfTestCase import MpfTestCase
 from unittest.mock import MagicMock, call
 from mpf.platforms import p_roc_common, p_roc
@@ -61,6 +63,8 @@ class TestPRoc(MpfTestCase):
     def getConfigFile(self):
         if "wpc" in self._testMethodName:
             return "wpc.yaml"
+        elif "threaded" in self._testMethodName:
+            return "threaded.yaml"
         else:
             return 'config.yaml'
 
@@ -88,6 +92,7 @@ class TestPRoc(MpfTestCase):
         p_roc_common.pinproc.driver_state_pulse = MagicMock(
             return_value="driver_state_pulse")
         self.pinproc.switch_get_states = MagicMock(return_value=[0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0])
+        self.pinproc.get_events = MagicMock(return_value=[])
         super().setUp()
 
     def test_pulse_and_hold(self):
@@ -110,6 +115,51 @@ class TestPRoc(MpfTestCase):
             number, 2, 5, 10, True)
 
 
+    def test_watchdog_and_flush(self):
+        self.assertTrue(self.machine.default_platform.features['tickless'])
+        proc = self.machine.default_platform.proc
+
+        # watchdog is tickled every half watchdog_time
+        proc.watchdog_tickle = MagicMock()
+        self.advance_time_and_run(1.1)
+        self.assertEqual(2, proc.watchdog_tickle.call_count)
+
+        # all commands in one loop iteration are flushed together
+        proc.flush = MagicMock()
+        self.machine.coils.c_test.pulse()
+        self.machine.coils.c_pwm_on_off.enable()
+        self.assertFalse(proc.flush.called)
+        self.advance_time_and_run(.001)
+        proc.flush.assert_called_once_with()
+
+    def test_threaded_event_reader(self):
+        platform = self.machine.default_platform
+        self.assertIsInstance(platform.proc, p_roc_common.ThreadSafePinProc)
+
+        # the reader thread and the loop only call the handle with the lock held
+        lock_held = []
+        events = [[{'type': 1, 'value': 23}]]
+
+        def get_events():
+            lock_held.append(platform.proc._lock.locked())
+            return events.pop() if events else []
+
+        self.pinproc.get_events = MagicMock(side_effect=get_events)
+        self.pinproc.driver_pulse = MagicMock(side_effect=lambda *args: lock_held.append(platform.proc._lock.locked()))
+
+        # events read in the thread are processed on the loop
+        for _ in range(100):
+            if self.machine.switch_controller.is_active("s_test"):
+                break
+            time.sleep(.01)
+            self.advance_time_and_run(.01)
+        self.assertTrue(self.machine.switch_controller.is_active("s_test"))
+
+        self.machine.coils.c_test.pulse()
+        self.pinproc.driver_pulse.assert_called_with(self.machine.coils.c_test.hw_driver.number, 23)
+        self.assertTrue(lock_held)
+        self.assertTrue(all(lock_held))
+
     def test_enable_exception(self):
         # enable coil which does not have allow_enable
         with self.assertRaises(AssertionError):
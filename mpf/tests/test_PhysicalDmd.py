@@ -1,4 +1,9 @@
+from unittest.mock import MagicMock
+
+from mpf.core.dmd_frame_encoder import RowDeltaEncoder
+from mpf.core.dmd_output_stage import DmdOutputStage
 from mpf.tests.MpfBcpTestCase import MpfBcpTestCase
+from mpf.tests.MpfTestCase import MpfTestCase
 
 
 class TestPhysicalDmd(MpfBcpTestCase):
@@ -14,7 +19,7 @@ class TestPhysicalDmd(MpfBcpTestCase):
         self.assertEqual(b'12345', self.machine.physical_dmds.test_dmd.hw_device.data)
 
         self._bcp_client.receive_queue.put_nowait(("dmd_frame", {"name": "test_dmd", "rawbytes": b'1337'}))
-        self.machine_run()
+        self.advance_time_and_run(.1)
 
         self.assertEqual(b'1337', self.machine.physical_dmds.test_dmd.hw_device.data)
 
@@ -23,6 +28,84 @@ class TestPhysicalDmd(MpfBcpTestCase):
         self.assertEqual(b'12345', self.machine.physical_rgb_dmds.test_dmd.hw_device.data)
 
         self._bcp_client.receive_queue.put_nowait(("rgb_dmd_frame", {"name": "test_dmd", "rawbytes": b'1337'}))
-        self.machine_run()
+        self.advance_time_and_run(.1)
 
         self.assertEqual(b'1337', self.machine.physical_rgb_dmds.test_dmd.hw_device.data)
+
+
+class TestDmdOutputStage(MpfTestCase):
+
+    def getConfigFile(self):
+        return 'testPhysicalDmd.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/physical_dmd/'
+
+    def test_frame_dropping(self):
+        dmd = self.machine.physical_dmds.test_dmd
+        stage = dmd.output_stage
+        hw_device = dmd.hw_device
+        hw_device.update = MagicMock(wraps=hw_device.update)
+
+        self.advance_time_and_run(1)
+        dmd.update(b'1')
+        hw_device.update.assert_called_once_with(b'1')
+
+        # fps is 30. frames within the next 33ms wait and only the latest is sent
+        dmd.update(b'2')
+        dmd.update(b'3')
+        self.assertEqual(1, stage.queued)
+        self.advance_time_and_run(.01)
+        self.assertEqual(b'1', hw_device.data)
+        self.advance_time_and_run(.03)
+        self.assertEqual(b'3', hw_device.data)
+        self.assertEqual({"sent": 2, "dropped": 1, "skipped": 0, "queued": 0}, stage.get_stats())
+
+        # identical frames are not sent again
+        self.advance_time_and_run(1)
+        dmd.update(b'3')
+        self.assertEqual(1, stage.skipped)
+        self.assertEqual(2, hw_device.update.call_count)
+
+        # frames wait while the hardware is busy
+        hw_device.is_busy = MagicMock(return_value=True)
+        dmd.update(b'4')
+        self.advance_time_and_run(.1)
+        self.assertEqual(b'3', hw_device.data)
+        hw_device.is_busy.return_value = False
+        self.advance_time_and_run(.01)
+        self.assertEqual(b'4', hw_device.data)
+        self.assertEqual(3, stage.sent)
+
+    def test_encoder(self):
+        hw_device = MagicMock()
+        hw_device.is_busy.return_value = False
+        hw_device.is_desynced.return_value = False
+        stage = DmdOutputStage(self.machine, hw_device, 0, RowDeltaEncoder(2))
+
+        frame = bytes(12)
+        stage.put(frame)
+        hw_device.update_encoded.assert_called_once_with(b'\x03\x01' + frame)
+        self.assertFalse(hw_device.update.called)
+
+        stage.put(b'\x01' * 6 + bytes(6))
+        hw_device.update_encoded.assert_called_with(b'\x02\x01\x02\x01\x00' + b'\x01' * 6)
+
+        # dmd lost synchronisation -> key frame
+        hw_device.is_desynced.return_value = True
+        stage.put(frame)
+        hw_device.update_encoded.assert_called_with(b'\x03\x03' + frame)
+
+        # an idle dmd which lost synchronisation gets the last frame again as key frame
+        hw_device.is_desynced.return_value = False
+        stage.put(frame)
+        self.advance_time_and_run(1)
+        self.assertEqual(3, hw_device.update_encoded.call_count)
+
+        hw_device.is_desynced.return_value = True
+        self.advance_time_and_run(.1)
+        hw_device.is_desynced.return_value = False
+        self.advance_time_and_run(.1)
+        self.assertEqual(4, hw_device.update_encoded.call_count)
+        hw_device.update_encoded.assert_called_with(b'\x03\x04' + frame)
+        self.assertEqual(1, stage.skipped)
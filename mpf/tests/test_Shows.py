@@ -1,8 +1,11 @@
 """Test shows."""
+import os
+import tempfile
 import time
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+from mpf.assets.show import Show
 from mpf.core.rgb_color import RGBColor
 from mpf.tests.MpfTestCase import MpfTestCase
 
@@ -574,6 +577,134 @@ class TestShows(MpfTestCase):
         self.assertEqual(self.machine.leds.led_01.hw_driver.current_color, list(RGBColor('red').rgb))
         self.post_event("test_mode_stopped")
 
+    def test_tokens_without_copy(self):
+        show = self.machine.shows['leds_color_token']
+        show1 = show.play(show_tokens=dict(color1='red', color2='blue'))
+        show2 = show.play(show_tokens=dict(color1='green', color2='blue'))
+        self.advance_time_and_run(.5)
+
+        # running shows share the steps of the show
+        self.assertIs(show.show_steps, show1.show_steps)
+        self.assertIs(show.show_steps, show2.show_steps)
+        # bound steps are not kept by the running show
+        self.assertIsNot(show1._get_step(0), show1._get_step(0))
+        self.assertEqual('red', show1._get_step(0)['leds'][self.machine.leds.led_01]['color'])
+        self.assertEqual('green', show2._get_step(0)['leds'][self.machine.leds.led_01]['color'])
+        self.assertEqual('(color1)', show.show_steps[0]['leds'][self.machine.leds.led_01]['color'])
+        # steps without tokens are not copied
+        self.machine.show_controller.register_show(
+            'mixed_tokens', [{'duration': 1, 'leds': {'led_01': '(color)'}}, {'duration': 1, 'leds': {'led_02': 'red'}}])
+        mixed_show = self.machine.shows['mixed_tokens']
+        show4 = mixed_show.play(show_tokens=dict(color='red'))
+        self.assertIs(mixed_show.show_steps[1], show4._get_step(1))
+        self.assertIsNot(mixed_show.show_steps[0], show4._get_step(0))
+        show4.stop()
+
+        # key tokens only copy the path to the token
+        show = self.machine.shows['leds_name_token']
+        show3 = show.play(show_tokens=dict(leds='led_01'))
+        step = show3._get_step(0)
+        self.assertIn('led_01', step['leds'])
+        self.assertNotIn('(leds)', step['leds'])
+        self.assertIn('(leds)', show.show_steps[0]['leds'])
+        self.assertIs(show.show_steps[0]['leds']['(leds)'], step['leds']['led_01'])
+
+        show1.stop()
+        show2.stop()
+        show3.stop()
+
+    def test_compiled_steps(self):
+        show = self.machine.shows['leds_name_token']
+        running_show = show.play(show_tokens=dict(leds='tag1'))
+        self.advance_time_and_run(.5)
+
+        # the step is compiled whenever it plays and not kept. the tag is resolved to LEDs when it plays
+        duration, actions = running_show._get_compiled_step(0)
+        self.assertEqual(1, len(actions))
+        player_name, action = actions[0]
+        self.assertEqual('leds', player_name)
+        self.assertEqual((), action.args[0])
+        self.assertEqual(['tag1'], [device for device, _ in action.args[1]])
+        self.assertIsNot(running_show._get_compiled_step(0), running_show._get_compiled_step(0))
+        self.assertEqual(list(RGBColor('red').rgb), self.machine.leds.led_01.hw_driver.current_color)
+        self.assertEqual(list(RGBColor('red').rgb), self.machine.leds.led_02.hw_driver.current_color)
+
+        # LEDs are resolved and colors are parsed once when the step contains device names
+        running_show.stop()
+        running_show = show.play(show_tokens=dict(leds='led_01'))
+        self.advance_time_and_run(.5)
+        duration, actions = running_show._get_compiled_step(0)
+        player_name, action = actions[0]
+        self.assertEqual([(self.machine.leds.led_01, RGBColor('red'))],
+                         [(led, color) for led, color, _, _ in action.args[0]])
+
+        running_show.stop()
+        self.advance_time_and_run()
+        self.assertEqual(list(RGBColor('off').rgb), self.machine.leds.led_02.hw_driver.current_color)
+
+    def test_show_scheduler(self):
+        scheduler = self.machine.show_controller.show_scheduler
+        self.machine.show_controller.register_show(
+            'scheduler_show', [{'duration': 1, 'leds': {'led_01': 'red'}}, {'duration': 1, 'leds': {'led_01': 'blue'}}])
+        show = self.machine.shows['scheduler_show']
+
+        self.advance_time_and_run(.3)
+        running_shows = [show.play(sync_ms=500) for _ in range(50)]
+        self.advance_time_and_run(.1)
+        running_shows += [show.play(sync_ms=500) for _ in range(50)]
+
+        # all shows start at the same grid point and share one deadline
+        self.assertEqual(100, scheduler.get_scheduled_count())
+        self.assertEqual(1, len(scheduler._events))
+        self.advance_time_and_run(.2)
+        self.assertEqual(list(RGBColor('red').rgb), self.machine.leds.led_01.hw_driver.current_color)
+        self.assertEqual(1, len(scheduler._events))
+        self.assertEqual([1] * 100, [running_show.next_step_index for running_show in running_shows])
+
+        # paused shows are not advanced
+        running_shows[0].pause()
+        self.assertEqual(99, scheduler.get_scheduled_count())
+        self.advance_time_and_run(1)
+        self.assertEqual(1, running_shows[0].next_step_index)
+        self.assertEqual(2, running_shows[1].next_step_index)
+
+        # advance, step back and resume run a step right away. advanced shows
+        # keep their timeline and share a deadline. resumed shows restart now
+        running_shows[1].advance()
+        self.assertEqual(1, running_shows[1].next_step_index)
+        running_shows[2].step_back()
+        self.assertEqual(1, running_shows[2].next_step_index)
+        running_shows[0].resume()
+        self.assertEqual(2, running_shows[0].next_step_index)
+        self.assertEqual(100, scheduler.get_scheduled_count())
+        self.assertEqual(3, len(scheduler._events))
+
+        # the speed of a show is kept
+        fast_show = show.play(speed=2)
+        self.advance_time_and_run(.4)
+        self.assertEqual(1, fast_show.next_step_index)
+        self.advance_time_and_run(.2)
+        self.assertEqual(2, fast_show.next_step_index)
+
+        for running_show in running_shows + [fast_show]:
+            running_show.stop()
+        self.assertEqual(0, scheduler.get_scheduled_count())
+        # deadlines without shows do not wake up the loop
+        self.assertEqual(0, len(scheduler._events))
+        self.assertEqual({}, scheduler._callbacks)
+
+    def test_start_show_without_copy(self):
+        # starting a show does not copy its steps. only the first step is bound to the tokens
+        self.machine.show_controller.register_show(
+            'long_show', [{'duration': 1, 'leds': {'led_01': '(color)'}}] * 200)
+        show = self.machine.shows['long_show']
+        with patch.object(show, 'bind_tokens', wraps=show.bind_tokens) as bind_tokens:
+            running_shows = [show.play(show_tokens=dict(color='red')) for _ in range(10)]
+        self.assertEqual(10, bind_tokens.call_count)
+        for running_show in running_shows:
+            self.assertIs(show.show_steps, running_show.show_steps)
+            running_show.stop()
+
     def test_get_show_copy(self):
         copied_show = self.machine.shows['test_show1'].get_show_steps()
         self.assertEqual(5, len(copied_show))
@@ -774,4 +905,59 @@ class TestShows(MpfTestCase):
         # test wrap around
         self.post_event("advance_manual_step_back")
         self.advance_time_and_run()
-        self.assertEqual([0, 0, 255], self.machine.leds.led_01.hw_driver.current_color)
\ No newline at end of file
+        self.assertEqual([0, 0, 255], self.machine.leds.led_01.hw_driver.current_color)
+
+    def test_streamed_show(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        file_name = os.path.join(temp_dir.name, 'streamed_show.mpfshow')
+
+        data = [{'duration': .1, 'leds': {'led_01': '{:02x}0001'.format(i)}} for i in range(256)]
+        data[200]['leds']['(leds)'] = 'green'
+        Show.write_compiled_show(data, file_name)
+
+        show = Show(self.machine, 'streamed_show', file_name, {'file': file_name, 'stream_window': 16})
+        show.load()
+        self.advance_time_and_run()
+        self.assertTrue(show.loaded)
+        self.assertTrue(show.streamed)
+        self.assertEqual(256, show.total_steps)
+        self.assertEqual({'leds'}, show.tokens)
+        # only the first window is decoded on load
+        self.assertEqual(16, show.show_steps.get_decoded_count())
+
+        running_show = show.play(show_tokens=dict(leds='led_02'), loops=0)
+        self.advance_time_and_run(.05)
+        self.assertEqual([0, 0, 1], self.machine.leds.led_01.hw_driver.current_color)
+
+        # the next window is prefetched once half of the current window is played
+        self.advance_time_and_run(.6)
+        self.assertEqual(16, show.show_steps.get_decoded_count())
+        self.advance_time_and_run(.2)
+        self.assertEqual(32, show.show_steps.get_decoded_count())
+
+        # steps are decoded ahead of the play head and old steps are dropped
+        self.advance_time_and_run(9.2)
+        self.assertEqual([100, 0, 1], self.machine.leds.led_01.hw_driver.current_color)
+        self.assertLessEqual(show.show_steps.get_decoded_count(), 32)
+        self.assertLessEqual(len(show.token_steps), 1)
+
+        self.advance_time_and_run(10)
+        self.assertEqual([200, 0, 1], self.machine.leds.led_01.hw_driver.current_color)
+        self.assertEqual(list(RGBColor('green').rgb), self.machine.leds.led_02.hw_driver.current_color)
+
+        # steps which were dropped are decoded again
+        running_show.step_back(150)
+        self.advance_time_and_run(.02)
+        self.assertEqual([50, 0, 1], self.machine.leds.led_01.hw_driver.current_color)
+
+        self.advance_time_and_run(30)
+        self.assertTrue(running_show._stopped)
+        self.assertLessEqual(show.show_steps.get_decoded_count(), 32)
+
+        show.unload()
+        self.assertIsNone(show.show_steps)
+
+        # steps are stored as JSON. data which JSON cannot represent is rejected
+        with self.assertRaises(ValueError):
+            Show.write_compiled_show([{'duration': .1, 'leds': {1: 'red'}}], file_name)
@@ -1,6 +1,8 @@
+import logging
 from unittest.mock import MagicMock
 
 from mpf.core.switch_controller import MonitoredSwitchChange
+from mpf.core.switch_snapshot import SwitchStateSnapshot
 
 from mpf.tests.MpfTestCase import MpfTestCase
 
@@ -65,6 +67,73 @@ class TestSwitchController(MpfTestCase):
     def test_verify_switches(self):
         self.assertTrue(self.machine.switch_controller.verify_switches())
 
+        platform = self.machine.default_platform
+        snapshot = platform.get_hw_switch_snapshot()
+        bank, bit = platform.get_switch_position(self.machine.switches.s_test.hw_switch.number)
+        snapshot.set_switch(bank, bit, 1)
+        bank, bit = platform.get_switch_position(self.machine.switches.s_test_invert.hw_switch.number)
+        snapshot.set_switch(bank, bit, 1)
+        platform.get_hw_switch_snapshot = MagicMock(return_value=snapshot)
+
+        # both switches differ from the hardware. verify applies the hardware states silently
+        self.assertFalse(self.machine.switch_controller.verify_switches())
+        self.assertTrue(self.machine.switches.s_test.state)
+        self.assertFalse(self.machine.switches.s_test_invert.state)
+
+        # now MPF expects the states of the snapshot
+        self.assertTrue(self.machine.switch_controller.verify_switches())
+
+        # processed switch changes update the expected states
+        self.machine.switch_controller.process_switch("s_test", 0, True)
+        self.assertFalse(self.machine.switch_controller.verify_switches())
+        self.machine.switch_controller.process_switch("s_test", 1, True)
+        self.assertTrue(self.machine.switch_controller.verify_switches())
+
+    def test_switch_without_subscribers(self):
+        post = MagicMock(wraps=self.machine.events.post)
+        self.machine.events.post = post
+
+        # nobody listens to the events of s_test. only the state is updated
+        self.hit_switch_and_run("s_test", 1)
+        self.assertTrue(self.machine.switch_controller.is_active("s_test"))
+        post.assert_not_called()
+        self.release_switch_and_run("s_test", 1)
+        self.assertFalse(self.machine.switch_controller.is_active("s_test"))
+        post.assert_not_called()
+
+        # a handler for one of the events enables posting
+        self.mock_event("s_test_active")
+        self.hit_switch_and_run("s_test", 1)
+        self.assertEventCalled("s_test_active")
+        post.assert_called_with("s_test_active")
+        post.reset_mock()
+
+        # switch handlers are called again after they have been added
+        callback = MagicMock()
+        self.machine.switch_controller.add_switch_handler("s_test", callback, state=0)
+        self.release_switch_and_run("s_test", 1)
+        callback.assert_called_once_with()
+        post.assert_not_called()
+
+        self.machine.switch_controller.remove_switch_handler("s_test", callback, state=0)
+        self.hit_switch_and_run("s_test", 1)
+        self.release_switch_and_run("s_test", 1)
+        callback.assert_called_once_with()
+
+    def test_switch_state_snapshot(self):
+        snapshot = SwitchStateSnapshot()
+        snapshot.set_bank("card", ~0b0101, 0b1111)
+        snapshot.set_switch(1, 3, 1)
+        snapshot.set_switch(1, 3, 0)
+        snapshot.set_switch(1, 4, 1)
+
+        self.assertEqual((0b1010, 0b1111), snapshot.get_bank("card"))
+        self.assertEqual((0b10000, 0b11000), snapshot.get_bank(1))
+        self.assertEqual((0, 0), snapshot.get_bank(2))
+        self.assertEqual(1, snapshot.get_state("card", 1))
+        self.assertEqual(0, snapshot.get_state(1, 3))
+        self.assertEqual(None, snapshot.get_state(1, 0))
+
     def test_is_active_timing(self):
         self.isActive = None
 
@@ -209,3 +278,93 @@ class TestSwitchController(MpfTestCase):
         self.machine.switch_controller.process_switch("s_test_invert", 0, logical=True)
         self.advance_time_and_run()
         self.assertFalse(self.machine.switch_controller.is_active("s_test_invert"))
+
+    def test_process_switch_by_num(self):
+        switch = self.machine.switches.s_test
+        platform = self.machine.default_platform
+
+        self.machine.switch_controller.process_switch_by_num(switch.hw_switch.number, 1, platform)
+        self.advance_time_and_run(.1)
+        self.assertTrue(self.machine.switch_controller.is_active("s_test"))
+
+        # same number on another platform does not match
+        self.machine.switch_controller.process_switch_by_num(switch.hw_switch.number, 0, MagicMock())
+        self.advance_time_and_run(.1)
+        self.assertTrue(self.machine.switch_controller.is_active("s_test"))
+
+        self.machine.switch_controller.process_switch_by_num(switch.hw_switch.number, 0, platform)
+        self.advance_time_and_run(.1)
+        self.assertFalse(self.machine.switch_controller.is_active("s_test"))
+
+        # reconfigure the switch to a new number
+        switch.config['number'] = "100"
+        switch._initialize()
+        self.machine.switch_controller.process_switch_by_num("1", 1, platform)
+        self.advance_time_and_run(.1)
+        self.assertFalse(self.machine.switch_controller.is_active("s_test"))
+        self.machine.switch_controller.process_switch_by_num("100", 1, platform)
+        self.advance_time_and_run(.1)
+        self.assertTrue(self.machine.switch_controller.is_active("s_test"))
+
+    def test_update_switch_number_index(self):
+        controller = self.machine.switch_controller
+        platform = self.machine.default_platform
+        switch = self.machine.switches.s_test
+        old_number = switch.hw_switch.number
+        invert_key, invert_bit = controller._switch_bits[self.machine.switches.s_test_invert]
+        self.assertTrue(controller._expected_states[invert_key] & invert_bit)
+
+        # reconfiguring a switch only touches its own entries
+        switches = self.machine.switches
+        self.machine.switches = MagicMock()
+        switch.config['number'] = "100"
+        switch._initialize()
+        self.assertFalse(self.machine.switches.__iter__.called)
+        self.machine.switches = switches
+
+        self.assertNotIn((platform, old_number), controller._switches_by_number)
+        self.assertIs(switch, controller._switches_by_number[(platform, "100")])
+        key, bit_value = controller._switch_bits[switch]
+        self.assertIn(switch, controller._switch_layout[key][bit_value])
+        self.assertTrue(controller._expected_states[invert_key] & invert_bit)
+        self.assertEqual(1, sum(switch in switches_by_bit
+                                for layout in controller._switch_layout.values()
+                                for switches_by_bit in layout.values()))
+
+    def test_process_switch_by_num_lookup(self):
+        # switches are found with a single lookup in the number index
+        controller = self.machine.switch_controller
+        platform = self.machine.default_platform
+        switch = self.machine.switches.s_test
+        switches = self.machine.switches
+        index = controller._switches_by_number
+        self.machine.switches = MagicMock()
+        controller._switches_by_number = MagicMock(wraps=index)
+
+        controller.process_switch_by_num(switch.hw_switch.number, 1, platform)
+        controller._switches_by_number.get.assert_called_once_with((platform, switch.hw_switch.number))
+        self.assertFalse(self.machine.switches.__iter__.called)
+
+        self.machine.switches = switches
+        controller._switches_by_number = index
+        self.advance_time_and_run(.1)
+        self.assertTrue(controller.is_active("s_test"))
+
+    def test_trace(self):
+        controller = self.machine.switch_controller
+        root_debug = logging.getLogger().isEnabledFor(logging.DEBUG)
+        self.assertEqual(root_debug, controller.debug)
+
+        self.machine.config['mpf']['trace'] = "events, switches"
+        controller.update_log_level()
+        self.machine.events.update_log_level()
+        self.assertTrue(controller.debug)
+        self.assertTrue(self.machine.events.debug)
+
+        controller.log.setLevel(logging.NOTSET)
+        self.machine.events.log.setLevel(logging.NOTSET)
+        del self.machine.config['mpf']['trace']
+        controller.update_log_level()
+        self.machine.events.update_log_level()
+        self.assertEqual(root_debug, controller.debug)
+        self.assertEqual(root_debug, self.machine.events.debug)
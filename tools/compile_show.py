@@ -0,0 +1,51 @@
+"""Compile a YAML show file to a compiled show which is streamed while it plays.
+
+Compiled shows load in constant time and only keep a window of their steps in
+memory. Use them for very long shows (e.g. thousands of steps generated from
+audio analysis). Put the compiled file into the shows folder instead of the
+YAML file since both would register a show with the same name.
+
+Usage:
+    python compile_show.py show.yaml [output.mpfshow]
+
+Show generators can also write compiled shows directly with
+mpf.assets.show.Show.write_compiled_show().
+"""
+import argparse
+import os
+import sys
+import time
+
+from mpf.assets.compiled_show import CompiledShowFile, EXTENSION
+from mpf.assets.show import Show
+from mpf.core.file_manager import FileManager
+from mpf.file_interfaces.yaml_interface import YamlInterface
+from mpf._version import __show_version__
+
+
+def main():
+    """Compile show."""
+    parser = argparse.ArgumentParser(description="Compile a YAML show file")
+    parser.add_argument("show", help="YAML show file")
+    parser.add_argument("output", nargs="?", help="compiled show file (default: next to the show)")
+    args = parser.parse_args()
+
+    output = args.output or "{}.{}".format(os.path.splitext(args.show)[0], EXTENSION)
+
+    if YamlInterface.get_show_file_version(args.show) != int(__show_version__):
+        print("Show file {} requires #show_version={}".format(args.show, __show_version__), file=sys.stderr)
+        sys.exit(1)
+
+    start = time.perf_counter()
+    data = FileManager.load(args.show, halt_on_error=True)
+    Show.write_compiled_show(data, output, args.show)
+    duration = time.perf_counter() - start
+
+    show_file = CompiledShowFile(output)
+    print("{}: {} steps, {} tokens, {} bytes ({:.1f}s)".format(
+        output, len(show_file), len(show_file.tokens), os.path.getsize(output), duration))
+    show_file.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""Benchmark for the RGB DMD frame encoders.
+
+Reports the bytes per frame which are sent to the DMD with and without
+row delta encoding and the time it takes to encode a frame.
+
+Usage:
+    python dmd_encoder_benchmark.py [recording ...]
+
+A recording is a file with raw frames (width * height * 3 bytes each)
+concatenated. Without recordings a set of synthetic sequences is used.
+"""
+import argparse
+import random
+import sys
+import time
+
+from mpf.core.dmd_frame_encoder import RowDeltaEncoder
+
+
+def load_recording(filename, frame_length):
+    """Return all frames of a recording."""
+    with open(filename, 'rb') as f:
+        data = f.read()
+
+    return [data[start:start + frame_length] for start in range(0, len(data) - frame_length + 1, frame_length)]
+
+
+def synthetic_sequences(width, height, frames):
+    """Return a dict of synthetic frame sequences."""
+    row_length = width * 3
+    rand = random.Random(42)
+    background = bytes(rand.randrange(256) for _ in range(row_length * height))
+
+    def scrolling_text():
+        # a bar of 8 rows moves down one row every fourth frame
+        for i in range(frames):
+            top = (i // 4) % (height - 8)
+            frame = bytearray(row_length * height)
+            frame[top * row_length:(top + 8) * row_length] = b'\xff' * (8 * row_length)
+            yield bytes(frame)
+
+    def score_update():
+        # a static frame where 4 rows change every 10th frame
+        frame = bytearray(background)
+        for i in range(frames):
+            if i % 10 == 0:
+                row = rand.randrange(height - 4)
+                frame[row * row_length:(row + 4) * row_length] = bytes(
+                    rand.randrange(256) for _ in range(4 * row_length))
+            yield bytes(frame)
+
+    def video():
+        # every pixel changes in every frame
+        for _ in range(frames):
+            yield bytes(rand.randrange(256) for _ in range(row_length * height))
+
+    return {"scrolling text": list(scrolling_text()),
+            "score update": list(score_update()),
+            "video": list(video())}
+
+
+def benchmark(name, frames, width):
+    """Encode a sequence and print the results."""
+    encoder = RowDeltaEncoder(width)
+    raw_bytes = sum(len(frame) + 1 for frame in frames)
+
+    start = time.perf_counter()
+    for frame in frames:
+        encoder.encode(frame)
+    duration = time.perf_counter() - start
+
+    print("{:<20} {:>6} frames  raw: {:>8.0f} B/frame  row delta: {:>8.0f} B/frame ({:>5.1f}%)  "
+          "key frames: {:>4}  encode: {:>6.1f} us/frame".format(
+              name, len(frames), raw_bytes / len(frames), encoder.bytes_encoded / len(frames),
+              100 * encoder.bytes_encoded / raw_bytes, encoder.key_frames, 1e6 * duration / len(frames)))
+
+
+def main():
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark RGB DMD frame encoders")
+    parser.add_argument("recordings", nargs="*", help="files with raw frames")
+    parser.add_argument("--width", type=int, default=128)
+    parser.add_argument("--height", type=int, default=32)
+    parser.add_argument("--frames", type=int, default=300, help="length of synthetic sequences")
+    args = parser.parse_args()
+
+    if args.recordings:
+        sequences = {filename: load_recording(filename, args.width * args.height * 3)
+                     for filename in args.recordings}
+    else:
+        sequences = synthetic_sequences(args.width, args.height, args.frames)
+
+    for name, frames in sequences.items():
+        if not frames:
+            print("{}: no complete frames".format(name), file=sys.stderr)
+            continue
+        benchmark(name, frames, args.width)
+
+
+if __name__ == '__main__':
+    main()
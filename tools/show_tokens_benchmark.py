@@ -0,0 +1,83 @@
+"""Benchmark for running many instances of shows with tokens.
+
+Starts a number of instances of a show with a token in every step, plays
+all steps once and reports the time it takes to start the instances, the
+time per step and the memory which is held by the running instances.
+Shows with one and with many steps are compared. Starting a show and the
+memory of a running show should not depend on the length of the show.
+
+Usage:
+    python show_tokens_benchmark.py [--instances 1000] [--steps 200]
+"""
+import argparse
+import time
+import tracemalloc
+
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class ShowMachine(MpfTestCase):
+
+    """Machine with the config of the show tests and virtual hardware."""
+
+    def getConfigFile(self):
+        return 'test_shows.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/shows/'
+
+    def runTest(self):
+        """Not used."""
+        pass
+
+
+def benchmark(machine_case, steps, instances):
+    """Play instances of a show with steps and print the results."""
+    name = 'benchmark_{}'.format(steps)
+    machine_case.machine.show_controller.register_show(
+        name, [{'duration': 1, 'leds': {'led_01': '(color)'}}] * steps)
+    show = machine_case.machine.shows[name]
+
+    tracemalloc.start()
+    memory_before = tracemalloc.get_traced_memory()[0]
+
+    start = time.perf_counter()
+    running_shows = [show.play(show_tokens=dict(color='red')) for _ in range(instances)]
+    start_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    machine_case.advance_time_and_run(steps)
+    step_duration = time.perf_counter() - start
+
+    memory = tracemalloc.get_traced_memory()[0] - memory_before
+    tracemalloc.stop()
+
+    for running_show in running_shows:
+        running_show.stop()
+
+    print("{:>5} steps  {:>5} instances  start: {:>7.1f} us/instance  play: {:>7.1f} us/step/instance  "
+          "memory: {:>8.0f} B/instance".format(
+              steps, instances, 1e6 * start_duration / instances, 1e6 * step_duration / steps / instances,
+              memory / instances))
+
+
+def main():
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark running show instances with tokens")
+    parser.add_argument("--instances", type=int, default=1000)
+    parser.add_argument("--steps", type=int, default=200)
+    args = parser.parse_args()
+
+    machine_case = ShowMachine()
+    # do not warn about the duration of the benchmark on tear down
+    machine_case.expected_duration = float('inf')
+    machine_case.setUp()
+    try:
+        for steps in (1, args.steps):
+            benchmark(machine_case, steps, args.instances)
+    finally:
+        machine_case.tearDown()
+
+
+if __name__ == '__main__':
+    main()
@@ -28,9 +28,39 @@ const rgb24 defaultBackgroundColor = {0, 0, 0};
 // Teensy 3.0 has the LED on pin 13
 const int ledPin = 13;
 
+// protocol (see mpf/core/dmd_frame_encoder.py)
+// 0x01 <frame>                                   full frame
+// 0x02 <base seq> <seq> <row count> (<row> <row data>)*   changed rows against frame <base seq>
+// 0x03 <seq> <frame>                             key frame
+// we answer 'R' when we cannot apply a delta frame. the host sends a key frame next.
+const uint8_t kFullFrame = 0x01;
+const uint8_t kDeltaFrame = 0x02;
+const uint8_t kKeyFrame = 0x03;
+const char kResyncRequest = 'R';
+
+const int kRowLength = kMatrixWidth * 3;
+const int kFrameLength = kRowLength * kMatrixHeight;
+
+enum State {
+  WAIT_COMMAND,
+  KEY_FRAME_SEQUENCE,
+  DELTA_HEADER,
+  DELTA_ROW,
+  READ_DATA,
+  SKIP_DATA
+};
+
+State state = WAIT_COMMAND;
 boolean frameOn = false;
+boolean inSync = false;
+uint8_t currentSequence = 0;
+uint8_t nextSequence = 0;
+uint8_t deltaHeader[3];
+int deltaHeaderPos = 0;
+int rowsLeft = 0;
 int dataPos = 0;
 int dataExpected = 0;
+long skipLeft = 0;
 
 
 // the setup() method runs once, when the sketch starts
@@ -52,51 +82,117 @@ void setup() {
 }
 
 
+uint16_t frameCount = 0;
+
+// show the back buffer. swapBuffers(true) copies the new frame to the back
+// buffer so the next delta frame can be applied on top of it
+void showFrame() {
+  frameCount++;
+  backgroundLayer.swapBuffers(true);
+  currentSequence = nextSequence;
+  digitalWrite(ledPin, frameOn);
+  frameOn = !frameOn;
+}
+
+void nextRowOrFrame() {
+  if (rowsLeft == 0) {
+    showFrame();
+    state = WAIT_COMMAND;
+  } else {
+    state = DELTA_ROW;
+  }
+}
+
 // the loop() method runs over and over again,
 // as long as the board has power
-uint16_t frameCount = 0;
 void loop() {
   char* buffer = (char*)backgroundLayer.backBuffer();
   int bytesAvail = Serial.available();
-  boolean swap = false;
-  
-  if ((bytesAvail > 1) && (dataPos > 0))
-  {
-    if (bytesAvail > dataExpected) bytesAvail = dataExpected;
-    int count = Serial.readBytes(&buffer[dataPos], bytesAvail);
-    dataPos += count;
-    dataExpected -= count;
-    if (dataExpected == 0) {
-      swap = true;
+  if (!bytesAvail) return;
+
+  switch (state) {
+    case WAIT_COMMAND: {
+      uint8_t command = Serial.read();
+      if (command == kFullFrame) {
+        // old protocol without sequence numbers
+        inSync = false;
+        dataPos = 0;
+        dataExpected = kFrameLength;
+        rowsLeft = 0;
+        state = READ_DATA;
+      } else if (command == kKeyFrame) {
+        state = KEY_FRAME_SEQUENCE;
+      } else if (command == kDeltaFrame) {
+        deltaHeaderPos = 0;
+        state = DELTA_HEADER;
+      }
+      break;
     }
-  }
-  else if (bytesAvail) {
-    char val = Serial.read();
-    if ( val == 1 )
-    {
-      backgroundLayer.swapBuffers(true);
-      dataPos=0;
-      dataExpected = kMatrixWidth * kMatrixHeight * 3;
-      digitalWrite(ledPin, HIGH);
+
+    case KEY_FRAME_SEQUENCE:
+      nextSequence = Serial.read();
+      inSync = true;
+      dataPos = 0;
+      dataExpected = kFrameLength;
+      rowsLeft = 0;
+      state = READ_DATA;
+      break;
+
+    case DELTA_HEADER:
+      deltaHeader[deltaHeaderPos++] = Serial.read();
+      if (deltaHeaderPos == 3) {
+        nextSequence = deltaHeader[1];
+        rowsLeft = deltaHeader[2];
+        if (!inSync || deltaHeader[0] != currentSequence) {
+          // we do not show the frame this delta is based on
+          inSync = false;
+          skipLeft = (long)rowsLeft * (kRowLength + 1);
+          state = skipLeft ? SKIP_DATA : WAIT_COMMAND;
+          Serial.write(kResyncRequest);
+        } else {
+          nextRowOrFrame();
+        }
+      }
+      break;
+
+    case DELTA_ROW: {
+      uint8_t row = Serial.read();
+      rowsLeft--;
+      if (row >= kMatrixHeight) {
+        // corrupted delta
+        inSync = false;
+        skipLeft = kRowLength + (long)rowsLeft * (kRowLength + 1);
+        state = SKIP_DATA;
+        Serial.write(kResyncRequest);
+      } else {
+        dataPos = row * kRowLength;
+        dataExpected = kRowLength;
+        state = READ_DATA;
+      }
+      break;
     }
-    else {
-      buffer[dataPos++] = val;
-      dataExpected--;
+
+    case READ_DATA: {
+      if (bytesAvail > dataExpected) bytesAvail = dataExpected;
+      int count = Serial.readBytes(&buffer[dataPos], bytesAvail);
+      dataPos += count;
+      dataExpected -= count;
       if (dataExpected == 0) {
-        swap = true;
+        nextRowOrFrame();
       }
+      break;
     }
-  }
 
-  if (swap) {
-    frameCount++;
-    char frameText[12];
-    itoa(frameCount, frameText, 10);
-    backgroundLayer.swapBuffers(true);
-    dataPos = 0;
-    dataExpected = kMatrixWidth * kMatrixHeight * 3;
-    digitalWrite(ledPin, frameOn);
-    frameOn = !frameOn;
+    case SKIP_DATA: {
+      if (bytesAvail > skipLeft) bytesAvail = skipLeft;
+      for (int i = 0; i < bytesAvail; i++) {
+        Serial.read();
+      }
+      skipLeft -= bytesAvail;
+      if (skipLeft == 0) {
+        state = WAIT_COMMAND;
+      }
+      break;
+    }
   }
 }
-
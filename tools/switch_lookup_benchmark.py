@@ -0,0 +1,83 @@
+"""Benchmark for the switch number lookup of the switch controller.
+
+Fills the (platform, number) index of the switch controller with a number of
+switches and reports the time process_switch_by_num needs for a switch
+number. The lookup should not depend on the number of configured switches.
+
+Usage:
+    python switch_lookup_benchmark.py [--switches 10 1000] [--calls 20000]
+"""
+import argparse
+from functools import partial
+import timeit
+from unittest.mock import MagicMock
+
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class SwitchMachine(MpfTestCase):
+
+    """Machine with the config of the switch controller tests and virtual hardware."""
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/switch_controller/'
+
+    def runTest(self):
+        """Not used."""
+        pass
+
+
+def add_switches(machine_case, count):
+    """Add switches until the index of the switch controller contains count switches."""
+    controller = machine_case.machine.switch_controller
+    platform = machine_case.machine.default_platform
+    number = 10000
+    while len(controller._switches_by_number) < count:
+        switch = MagicMock()
+        switch.platform = platform
+        switch.hw_switch.number = number
+        switch.state = 0
+        switch.invert = False
+        controller.update_switch_number_index(switch)
+        number += 1
+
+
+def benchmark(machine_case, count, calls):
+    """Time lookups with count switches and print the results."""
+    controller = machine_case.machine.switch_controller
+    platform = machine_case.machine.default_platform
+    add_switches(machine_case, count)
+
+    # a number which is not configured. it is looked up in the index and
+    # only reported to the (empty list of) switch monitors
+    duration = min(timeit.repeat(partial(controller.process_switch_by_num, -1, 1, platform),
+                                 number=calls, repeat=5))
+
+    print("{:>6} switches  process_switch_by_num: {:>6.3f} us/call".format(
+        len(controller._switches_by_number), 1e6 * duration / calls))
+
+
+def main():
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark the switch number lookup")
+    parser.add_argument("--switches", type=int, nargs="+", default=[10, 1000],
+                        help="number of switches in the index")
+    parser.add_argument("--calls", type=int, default=20000)
+    args = parser.parse_args()
+
+    machine_case = SwitchMachine()
+    # do not warn about the duration of the benchmark on tear down
+    machine_case.expected_duration = float('inf')
+    machine_case.setUp()
+    try:
+        for count in sorted(args.switches):
+            benchmark(machine_case, count, args.calls)
+    finally:
+        machine_case.tearDown()
+
+
+if __name__ == '__main__':
+    main()